@@ -0,0 +1,57 @@
+"""
+Per-frame cost of finding "every object with Transform+RigidBody whose Transform changed":
+a scan of Scene.id_mappings vs Scene.query over the archetype tables, with and without changed=.
+
+    python -m benchmarks.archetype_queries [count] [moved per frame]
+
+One object in 100 also has a BoxCollider, so the matches span two archetypes.
+"""
+import sys
+import time
+from benchmarks.scene_serialization import scene_data
+from src.engine import Engine
+from src.managers import Scene, change_tick
+
+FRAMES = 20
+
+
+def main(count, moved):
+    from src.components import BoxCollider, RigidBody, Transform
+    Engine().register_components(headless=True)
+    data = scene_data(count)
+    for i, go_data in enumerate(data["gameobjects"]):
+        if i % 100 == 0:
+            go_data["components"].append({"type": "BoxCollider", "enabled": True})
+    scene = Scene.from_dict(**data)
+    gameobjects = list(scene.id_mappings.values())
+
+    def scan(since):
+        rows = []
+        for go in scene.id_mappings.values():
+            transform, body = go.get_component(Transform), go.get_component(RigidBody)
+            if transform is not None and body is not None and transform.changed_since(since):
+                rows.append((go, transform, body))
+        return rows
+
+    def query_all(since):
+        return [row for row in scene.query(Transform, RigidBody) if row[1].changed_since(since)]
+
+    def query_changed(since):
+        return scene.query(Transform, RigidBody, changed=Transform, since=since)
+
+    print(f"{count} objects, {moved} Transforms set per frame, {len(scene.index.archetypes)} archetypes")
+    for name, system in (("scan id_mappings", scan), ("query + filter", query_all), ("query changed=", query_changed)):
+        elapsed, found = 0.0, 0
+        last = change_tick()
+        for frame in range(FRAMES):
+            for i in range(moved):
+                gameobjects[(frame * moved + i * 7919) % count].transform.position = (frame, i)
+            since, last = last, change_tick()
+            start = time.perf_counter()
+            found += len(system(since))
+            elapsed += time.perf_counter() - start
+        print(f"{name:>18} {elapsed / FRAMES * 1000:>9.2f} ms/frame  ({found // FRAMES} rows)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000, int(sys.argv[2]) if len(sys.argv) > 2 else 500)
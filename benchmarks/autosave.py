@@ -0,0 +1,38 @@
+"""
+Autosave cost after a handful of edits: full rewrite vs journaled incremental save.
+
+    python -m benchmarks.autosave [counts...]
+"""
+import os
+import sys
+import tempfile
+from benchmarks.scene_serialization import scene_data, timed
+from src.engine import Engine
+from src.managers import Scene
+from src.managers.scenes import SceneAutosave
+from src.managers.serialization import Serializer
+
+EDITS = 10
+
+
+def main(counts):
+    Engine().register_components(headless=True)
+    directory = tempfile.mkdtemp()
+    print(f"{EDITS} edited GameObjects per save")
+    print(f"{'objects':>8} {'full save ms':>13} {'journal ms':>11}")
+    for count in counts:
+        path = os.path.join(directory, f"bench{count}.yaml")
+        scene = Scene.from_dict(**scene_data(count))
+        autosave = SceneAutosave(scene, path)
+        _, full = timed(autosave.save, compact=True)
+
+        gameobjects = list(scene.id_mappings.values())
+        for gameobject in gameobjects[::count // EDITS][:EDITS]:
+            gameobject.transform.position = (1.0, 2.0)
+        _, journal = timed(autosave.save)
+        autosave.close()
+        print(f"{count:>8} {full * 1000:>13.1f} {journal * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main([int(count) for count in sys.argv[1:]] or [1000, 10000, 50000])
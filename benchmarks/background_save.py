@@ -0,0 +1,56 @@
+"""
+Main-thread stall of a full scene save: Serializer.save_scene vs SceneManager.save_scene_async.
+
+    python -m benchmarks.background_save [count] [extension]
+
+The async save is driven like the editor does it: 60 fps frames that edit the scene and
+call SceneManager.update() until the write lands. The snapshot (to_dict + pickle) still runs
+on the main thread, so the frame that starts the save stalls for it; it is reported split
+up, and "worst frame while writing" covers only the frames after it.
+"""
+import os
+import sys
+import tempfile
+import time
+from benchmarks.scene_serialization import scene_data, timed
+from src.engine import Engine
+from src.managers import Scene
+from src.managers.scenes.scene_manager import SceneManager
+from src.managers.serialization import Serializer
+
+FRAME = 1 / 60
+
+
+def main(count, extension):
+    Engine().register_components(headless=True)
+    path = os.path.join(tempfile.mkdtemp(), "bench" + extension)
+    scene = Scene.from_dict(**scene_data(count))
+    gameobjects = list(scene.id_mappings.values())
+    manager = SceneManager()
+
+    _, blocking = timed(Serializer.save_scene, scene, path)
+    _, to_dict = timed(scene.to_dict)
+
+    start = time.perf_counter()
+    future, snapshot = timed(manager.save_scene_async, scene, path)
+    frames, worst = 0, 0.0
+    while not future.done():
+        frame = time.perf_counter()
+        gameobjects[frames % count].transform.position = (frames, frames)
+        manager.update()
+        elapsed = time.perf_counter() - frame
+        worst = max(worst, elapsed)
+        frames += 1
+        time.sleep(max(FRAME - elapsed, 0))
+    total = time.perf_counter() - start
+    future.result()
+
+    print(f"{count} objects → {extension} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    print(f"{'save_scene (blocking)':>24} {blocking * 1000:>9.1f} ms")
+    print(f"{'save_scene_async snapshot':>24} {snapshot * 1000:>9.1f} ms  main-thread stall "
+          f"(to_dict ~{to_dict * 1000:.0f} ms + pickle ~{max(snapshot - to_dict, 0) * 1000:.0f} ms)")
+    print(f"{'worst frame while writing':>24} {worst * 1000:>9.1f} ms  ({frames} frames, {total:.2f}s to land)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000, sys.argv[2] if len(sys.argv) > 2 else ".yaml")
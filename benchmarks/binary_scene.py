@@ -0,0 +1,46 @@
+"""
+YAML vs .bscene: file size, parse-only time and full scene load time.
+
+    python -m benchmarks.binary_scene [count]
+
+"parse" turns the file into Scene.to_dict()-shaped data; "load" is what SceneManager.load_scene
+does (parse + build every GameObject). The YAML side uses yaml.safe_load like Serializer does.
+"""
+import os
+import sys
+import tempfile
+import time
+import yaml
+from benchmarks.scene_serialization import scene_data, timed
+from src.engine import Engine
+from src.managers.serialization import BinaryScene, Serializer
+
+
+def main(count):
+    Engine().register_components(headless=True)
+    data = scene_data(count)
+    directory = tempfile.mkdtemp()
+    yaml_path = os.path.join(directory, "bench.yaml")
+    binary_path = os.path.join(directory, "bench" + BinaryScene.EXTENSION)
+
+    with open(yaml_path, "w") as f:
+        yaml.safe_dump(data, f, sort_keys=False)
+    BinaryScene.save(data, binary_path)
+
+    def parse_yaml():
+        with open(yaml_path) as f:
+            return yaml.safe_load(f)
+
+    _, yaml_parse = timed(parse_yaml)
+    _, binary_parse = timed(BinaryScene.load, binary_path)
+    _, yaml_load = timed(Serializer.load_from_yaml, yaml_path, None)
+    _, binary_load = timed(Serializer.load_from_binary, binary_path, None)
+
+    print(f"{count} objects")
+    print(f"{'':>8} {'size MB':>8} {'parse s':>8} {'load s':>8}")
+    print(f"{'yaml':>8} {os.path.getsize(yaml_path) / 1e6:>8.1f} {yaml_parse:>8.2f} {yaml_load:>8.2f}")
+    print(f"{'bscene':>8} {os.path.getsize(binary_path) / 1e6:>8.1f} {binary_parse:>8.2f} {binary_load:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
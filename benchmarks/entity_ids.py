@@ -0,0 +1,45 @@
+"""
+GameObject identity: uuid4 strings (the old GameObject.id) vs Entities generational handles.
+
+    python -m benchmarks.entity_ids [count]
+
+Times generating N ids, N id → GameObject lookups in a dict like Scene.id_mappings,
+and reports the bytes each id costs its object.
+"""
+import random
+import sys
+import time
+import uuid
+from src.core.entities import Entities
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main(count):
+    strings, string_time = timed(lambda: [str(uuid.uuid4()) for _ in range(count)])
+    handles, handle_time = timed(lambda: [Entities.allocate() for _ in range(count)])
+
+    rows = []
+    for name, ids, generate in (("uuid4 str", strings, string_time), ("handle", handles, handle_time)):
+        mapping = {id: object() for id in ids}
+        keys = [ids[i] for i in random.Random(0).choices(range(count), k=count)]
+        _, lookup = timed(lambda: [mapping[key] for key in keys])
+        rows.append((name, generate, lookup, sys.getsizeof(ids[-1])))
+
+    _, lazy = timed(lambda: [Entities.uuid(handle) for handle in handles])
+    for handle in handles:
+        Entities.release(handle)
+
+    print(f"{count} ids")
+    print(f"{'id':>10} {'generate ms':>12} {'lookup ms':>10} {'bytes/id':>9}")
+    for name, generate, lookup, size in rows:
+        print(f"{name:>10} {generate * 1000:>12.1f} {lookup * 1000:>10.1f} {size:>9}")
+    print(f"UUIDs for every handle on first save: {lazy * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
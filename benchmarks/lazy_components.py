@@ -0,0 +1,69 @@
+"""
+Load time and Python heap after load for a mostly dormant level, eager vs GameObject.lazy_components.
+
+    python -m benchmarks.lazy_components [count] [active fraction]
+
+Every GameObject has a Transform, a RigidBody and a BoxCollider; all but `active fraction`
+of them load inactive. pymunk's own allocations are outside the Python heap, so the
+memory column understates the saving. Each mode loads in a forked process, since pymunk
+keeps loaded scenes alive and they would slow down whatever loads after them.
+"""
+import gc
+import multiprocessing
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.scene_serialization import timed
+from src.core.gameobject import GameObject
+from src.engine import Engine
+from src.managers import Scene
+
+
+def level_data(count, active_fraction):
+    every = max(round(1 / active_fraction), 1) if active_fraction else count + 1
+    return {
+        "name": "Dormant",
+        "gameobjects": [
+            {
+                "name": f"GameObject {i}",
+                "active": i % every == 0,
+                "components": [
+                    {"type": "Transform", "position": [i % 1000, i // 1000], "angle": 0.0, "scale": [1, 1]},
+                    {"type": "RigidBody", "mass": 1.0},
+                    {"type": "BoxCollider"},
+                ],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def load(data, lazy):
+    """Timed load, then a second one under tracemalloc for the heap (tracing slows loading down)."""
+    GameObject.lazy_components = lazy
+    gc.collect()
+    _, seconds = timed(Scene.from_dict, **data)
+    tracemalloc.start()
+    scene = Scene.from_dict(**data)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return seconds, memory, scene.to_dict() == data
+
+
+def main(count, active_fraction):
+    Engine().register_components(headless=True)
+    GameObject.lazy_components = False
+    data = Scene.from_dict(**level_data(count, active_fraction)).to_dict()
+
+    print(f"{count} objects, {active_fraction:.0%} active")
+    print(f"{'':>6} {'load s':>8} {'heap MB':>8}")
+    for lazy in (False, True):
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("fork")) as pool:
+            seconds, memory, round_trip = pool.submit(load, data, lazy).result()
+        print(f"{'lazy' if lazy else 'eager':>6} {seconds:>8.2f} {memory / 1e6:>8.1f}")
+    print("lazy save == loaded data:", round_trip)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 0.1)
@@ -0,0 +1,79 @@
+"""
+Creation time and resident memory for N data-model objects, each scenario in a fresh process.
+
+    python -m benchmarks.observable_memory [count]
+
+"qobject base" reproduces the old QObject + pyqtSignal Observable for comparison.
+"""
+import multiprocessing
+import sys
+import time
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            import os
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _qobject_base(count):
+    from PyQt6.QtCore import QObject, pyqtSignal
+
+    class LegacyObservable(QObject):
+        updated = pyqtSignal()
+
+        def __init__(self):
+            super().__init__()
+            self._subscribers = []
+
+    return [LegacyObservable() for _ in range(count)]
+
+
+def _observable_base(count):
+    from src.core import Observable
+    return [Observable() for _ in range(count)]
+
+
+def _gameobjects(count):
+    from src.engine import Engine
+    from src.core.gameobject import GameObject
+    Engine().register_components(headless=True)
+    return [GameObject(name="GameObject") for _ in range(count)]
+
+
+SCENARIOS = {
+    "qobject base": _qobject_base,
+    "observable base": _observable_base,
+    "GameObject": _gameobjects,
+}
+
+
+def _run(name, count, results):
+    _gameobjects(1) if name == "GameObject" else SCENARIOS[name](1)  # warm up imports
+    before = _rss_bytes()
+    start = time.perf_counter()
+    objects = SCENARIOS[name](count)
+    elapsed = time.perf_counter() - start
+    results.put((name, elapsed, (_rss_bytes() - before) / count))
+    del objects
+
+
+def main(count):
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    print(f"{count} objects")
+    print(f"{'scenario':>16} {'create s':>9} {'us/object':>10} {'bytes/object':>13}")
+    for name in SCENARIOS:
+        process = ctx.Process(target=_run, args=(name, count, results))
+        process.start()
+        name, elapsed, per_object = results.get()
+        process.join()
+        print(f"{name:>16} {elapsed:>9.3f} {elapsed / count * 1e6:>10.2f} {per_object:>13.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
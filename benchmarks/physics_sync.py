@@ -0,0 +1,112 @@
+"""
+Body -> Transform sync cost per fixed step: per-object, batched (BodySync),
+and batched into a scene TransformStore (Scene(array_transforms=True)).
+Then the kinematic push (Transform -> body) with 1% of the Transforms moved per step:
+the old set-every-body loop vs BodySync.push_kinematic, with and without the store.
+
+    python -m benchmarks.physics_sync [counts...]
+"""
+import sys
+import time
+import pygame
+import pymunk
+from src.headless import HeadlessRunner
+from src.core.gameobject import GameObject
+from src.components import RigidBody
+from src.managers import Scene
+
+
+def build_scene(count, array_transforms=False):
+    scene = Scene(name=f"Bench {count}", array_transforms=array_transforms)
+    for i in range(count):
+        go = GameObject(name=f"Body {i}")
+        go.transform.position = pygame.Vector2(i % 1000, i // 1000)
+        go.add_component(RigidBody(go))
+        scene.add_gameobject(go)
+    for rigidbody in scene.physics.rigidbodies:
+        rigidbody.body.velocity = (1.0, 0.0)
+    return scene
+
+
+def per_object_sync(scene):
+    # What RigidBody.fixed_update used to do for every body
+    for rigidbody in scene.physics.rigidbodies:
+        transform = rigidbody.gameobject.get_component("Transform")
+        transform.position = pygame.Vector2(*rigidbody.body.position)
+        transform.angle = rigidbody.body.angle
+
+
+def per_body_push(scene):
+    # What BodySync.push_kinematic used to do: set every kinematic body, moved or not
+    for rigidbody, body in scene.physics.rigidbodies.items():
+        position = rigidbody.gameobject.transform.position
+        body.position = (position.x, position.y)
+        body.angle = rigidbody.gameobject.transform.angle
+
+
+def push_ms(scene, push, steps):
+    for rigidbody in scene.physics.rigidbodies:
+        rigidbody.body.body_type = pymunk.Body.KINEMATIC
+    scene.physics.sync.mark_dirty()
+    scene.physics.sync.push_kinematic()
+    gameobjects = [rigidbody.gameobject for rigidbody in scene.physics.rigidbodies]
+    moved = max(1, len(gameobjects) // 100)
+    total = 0.0
+    for step in range(steps):
+        for i in range(moved):
+            gameobjects[(step * moved + i * 7919) % len(gameobjects)].transform.position = (step, i)
+        start = time.perf_counter()
+        push()
+        total += time.perf_counter() - start
+    return total / steps * 1000.0
+
+
+def timed(space, sync, steps, dt=1.0 / 60):
+    """Average ms of step() and of sync() over `steps` fixed steps."""
+    step_total = sync_total = 0.0
+    for _ in range(steps):
+        start = time.perf_counter()
+        space.step(dt)
+        middle = time.perf_counter()
+        sync()
+        step_total += middle - start
+        sync_total += time.perf_counter() - middle
+    return step_total / steps * 1000.0, sync_total / steps * 1000.0
+
+
+def main(counts):
+    runner = HeadlessRunner()
+    runner.initialize()
+    print(f"{'bodies':>8} {'step ms':>10} {'per-object ms':>14} {'batched ms':>11} {'arrays ms':>10} {'speedup':>8}")
+    for count in counts:
+        scene = build_scene(count)
+        world = scene.physics
+        world.sync.rebuild()
+        steps = max(3, 20000 // count)
+        step_ms, legacy_ms = timed(world.space, lambda: per_object_sync(scene), steps)
+        _, batched_ms = timed(world.space, world.sync.pull_dynamic, steps)
+        world.clear()
+
+        scene = build_scene(count, array_transforms=True)
+        world = scene.physics
+        world.sync.rebuild()
+        _, arrays_ms = timed(world.space, world.sync.pull_dynamic, steps)
+        world.clear()
+        print(f"{count:>8} {step_ms:>10.2f} {legacy_ms:>14.2f} {batched_ms:>11.2f} {arrays_ms:>10.2f} "
+              f"{legacy_ms / arrays_ms:>7.1f}x")
+
+    print(f"\n{'kinematic':>8} {'per-body ms':>12} {'batched ms':>11} {'arrays ms':>10} {'speedup':>8}")
+    for count in counts:
+        steps = max(3, 20000 // count)
+        scene = build_scene(count)
+        legacy_ms = push_ms(scene, lambda: per_body_push(scene), steps)
+        batched_ms = push_ms(scene, scene.physics.sync.push_kinematic, steps)
+        scene.physics.clear()
+        scene = build_scene(count, array_transforms=True)
+        arrays_ms = push_ms(scene, scene.physics.sync.push_kinematic, steps)
+        scene.physics.clear()
+        print(f"{count:>8} {legacy_ms:>12.2f} {batched_ms:>11.2f} {arrays_ms:>10.2f} {legacy_ms / arrays_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 5000, 10000, 50000])
@@ -0,0 +1,36 @@
+"""
+Cold vs warm Serializer.load_from_yaml with the parsed-scene cache.
+
+    python -m benchmarks.scene_cache [count]
+
+"cold" parses the YAML and fills the cache; "warm" is the next launch, served from
+the cached .bscene without touching the YAML parser.
+"""
+import os
+import sys
+import tempfile
+import yaml
+from benchmarks.scene_serialization import scene_data, timed
+from src.engine import Engine
+from src.managers.serialization import SceneCache, Serializer
+
+
+def main(count):
+    Engine().register_components(headless=True)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "bench.yaml")
+    with open(path, "w") as f:
+        yaml.safe_dump(scene_data(count), f, sort_keys=False)
+
+    SceneCache.directory = os.path.join(directory, "cache")
+    _, cold = timed(Serializer.load_from_yaml, path, None)
+    _, warm = timed(Serializer.load_from_yaml, path, None)
+    _, key = timed(SceneCache.key, path)
+
+    print(f"{count} objects")
+    print(f"{'cold':>6} {cold:>8.2f}s")
+    print(f"{'warm':>6} {warm:>8.2f}s  (hashing the source: {key * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,57 @@
+"""
+Lookup costs: GameObject.transform / get_component by name, and scene queries by tag and
+component type against a scan of Scene.id_mappings.
+
+    python -m benchmarks.scene_queries [count]
+
+One object in 100 is tagged "Enemy" and has a BoxCollider next to its RigidBody.
+"""
+import sys
+import time
+from benchmarks.scene_serialization import scene_data
+from src.engine import Engine
+from src.managers import Scene
+
+REPEAT = 100000
+
+
+def per_call(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(count):
+    from src.components import BoxCollider, RigidBody
+    Engine().register_components(headless=True)
+    data = scene_data(count)
+    for i, go_data in enumerate(data["gameobjects"]):
+        if i % 100 == 0:
+            go_data["tag"] = "Enemy"
+            go_data["components"].append({"type": "BoxCollider", "enabled": True})
+    scene = Scene.from_dict(**data)
+    gameobject = next(iter(scene.id_mappings.values()))
+
+    def scan_tag():
+        return [go for go in scene.id_mappings.values() if go.tag == "Enemy"]
+
+    def scan_with():
+        return [go for go in scene.id_mappings.values()
+                if go.get_component(RigidBody) is not None and go.get_component(BoxCollider) is not None]
+
+    print(f"{count} objects, {count // 100} matching")
+    rows = [
+        ("gameobject.transform", per_call(lambda: gameobject.transform, REPEAT)),
+        ('get_component("RigidBody")', per_call(lambda: gameobject.get_component("RigidBody"), REPEAT)),
+        ("scan id_mappings by tag", per_call(scan_tag, 10)),
+        ('find_all_with_tag("Enemy")', per_call(lambda: scene.find_all_with_tag("Enemy"), 1000)),
+        ("scan for RigidBody+BoxCollider", per_call(scan_with, 10)),
+        ("find_all_with(RigidBody, BoxCollider)", per_call(lambda: scene.find_all_with(RigidBody, BoxCollider), 100)),
+    ]
+    for name, seconds in rows:
+        print(f"{name:>38} {seconds * 1e6:>10.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
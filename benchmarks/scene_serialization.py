@@ -0,0 +1,149 @@
+"""
+Scene save (to_dict) and load (from_dict) time for N GameObjects with a Transform and a RigidBody.
+
+    python -m benchmarks.scene_serialization [count]
+
+Only the data-model side is timed (best of 3 each); JSON encoding is reported
+separately since it does not depend on the schema code.
+
+"legacy" swaps every class's compiled Schema init / dump / load for the per-field loops
+Serializable used before schemas (hasattr + setattr seeding, getattr per field); everything
+else, scene.batch() included, is shared, so the speedup is the schema code alone. Most of a
+load is building GameObjects / components and registering them with the scene (index,
+scheduler, physics), which neither column changes.
+"""
+import gc
+import json
+import sys
+import time
+from contextlib import contextmanager
+from src.engine import Engine
+from src.managers import Scene
+
+
+def scene_data(count):
+    return {
+        "name": "Bench",
+        "gameobjects": [
+            {
+                "name": f"GameObject {i}",
+                "tag": "Untagged",
+                "layer": "Default",
+                "active": True,
+                "components": [
+                    {"type": "Transform", "enabled": True, "position": [i % 1000, i // 1000], "angle": 0.0, "scale": [1, 1]},
+                    {"type": "RigidBody", "enabled": True, "mass": 1.0},
+                ],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def legacy_init(self, kwargs):
+    for name, prop in type(self)._serializable_fields:
+        attr_name = "_" + name
+        if name in kwargs:
+            setattr(self, attr_name, kwargs[name])
+        else:
+            default = prop.default() if callable(prop.default) else prop.default
+            if not hasattr(self, attr_name):
+                setattr(self, attr_name, default)
+
+
+def legacy_dump(self):
+    from pygame import Vector2
+    from src.managers.serialization import Serializable
+    data = {}
+    for name, prop in self._schema.persistent:
+        if getattr(prop, "hide", False):
+            continue
+        value = getattr(self, name)
+        if isinstance(value, Serializable):
+            value = value.to_dict()
+        elif isinstance(value, Vector2):  # the old Transform.to_dict listed its vectors by hand
+            value = [value.x, value.y]
+        data[name] = value
+    return data
+
+
+def legacy_load(cls, data, args=(), extra=None):
+    from src.managers.serialization import Serializable
+    kwargs = {}
+    for name, prop in cls._schema.persistent:
+        if name in data:
+            value = data[name]
+            type_hint = getattr(prop, "type_hint", None)
+            if isinstance(type_hint, type) and issubclass(type_hint, Serializable) and isinstance(value, dict):
+                value = type_hint.from_dict(value)
+        else:
+            value = prop.default() if callable(prop.default) else prop.default
+        kwargs[name] = value
+    if extra:
+        kwargs.update(extra)
+    return cls(*args, **kwargs)
+
+
+@contextmanager
+def legacy_schemas():
+    """Run the block with the pre-schema per-field serialization on every Serializable class."""
+    from src.managers.serialization import Serializable
+    classes, stack = [], [Serializable]
+    while stack:
+        cls = stack.pop()
+        classes.append(cls)
+        stack.extend(cls.__subclasses__())
+    saved = [(cls._schema, cls._schema.init, cls._schema.dump, cls._schema.load) for cls in classes]
+    for schema, *_ in saved:
+        schema.init, schema.dump, schema.load = legacy_init, legacy_dump, legacy_load
+    try:
+        yield
+    finally:
+        for schema, init, dump, load in saved:
+            schema.init, schema.dump, schema.load = init, dump, load
+
+
+def measure(data):
+    """(best-of-3 load seconds, best-of-3 save seconds, saved data)"""
+    load_seconds = float("inf")
+    for _ in range(3):
+        scene = None
+        gc.collect()
+        scene, seconds = timed(Scene.from_dict, **data)
+        load_seconds = min(load_seconds, seconds)
+    gc.collect()
+    saved, save_seconds = min((timed(scene.to_dict) for _ in range(3)), key=lambda run: run[1])
+    return load_seconds, save_seconds, saved
+
+
+def main(count):
+    Engine().register_components(headless=True)
+    data = scene_data(count)
+
+    # Warm both paths up so neither pays for first-use allocations
+    measure(scene_data(count // 10))
+    with legacy_schemas():
+        measure(scene_data(count // 10))
+    gc.collect()
+    with legacy_schemas():
+        legacy_load_seconds, legacy_save_seconds, _ = measure(data)
+    gc.collect()
+    load_seconds, save_seconds, saved = measure(data)
+    _, json_seconds = timed(json.dumps, saved)
+
+    print(f"{count} objects, us/object, schema code alone (everything else shared)")
+    print(f"{'':>18} {'legacy':>9} {'schema':>9} {'speedup':>8}")
+    for name, legacy, schema in (("load (from_dict)", legacy_load_seconds, load_seconds),
+                                 ("save (to_dict)", legacy_save_seconds, save_seconds)):
+        print(f"{name:>18} {legacy / count * 1e6:>9.2f} {schema / count * 1e6:>9.2f} {legacy / schema:>7.1f}x")
+    print(f"{'json.dumps':>18} {json_seconds:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,85 @@
+"""
+Get/set throughput of SerializeField accessors, fast path vs the previous generic descriptor.
+
+    python -m benchmarks.serialize_field [iterations]
+
+"legacy" reproduces the old accessors: hasattr + getattr + weakref check per read,
+unconditional notify() per write.
+"""
+import sys
+import timeit
+import weakref
+from src.managers.serialization import Serializable, SerializeField
+from src.managers.serialization.util import SerializableProperty
+
+
+def legacy_field(default=None, type_hint=None):
+    def decorator(func):
+        attr_name = "_" + func.__name__
+
+        def _getter(self):
+            if not hasattr(self, attr_name):
+                val = default() if callable(default) else default
+                setattr(self, attr_name, val)
+
+            value = getattr(self, attr_name)
+            return value() if isinstance(value, weakref.ref) else value
+
+        def _setter(self, value):
+            setattr(self, attr_name, value)
+            self.notify(func.__name__)
+
+        return SerializableProperty(fget=_getter, fset=_setter, type_hint=type_hint, default=default)
+
+    return decorator
+
+
+class Legacy(Serializable):
+    @legacy_field(default=0.0, type_hint=float)
+    def speed(self): pass
+
+    @legacy_field(default=None, type_hint=Serializable)
+    def target(self): pass
+
+
+class Fast(Serializable):
+    @SerializeField(default=0.0, type_hint=float)
+    def speed(self): pass
+
+    @SerializeField(default=None, type_hint=Serializable)
+    def target(self): pass
+
+
+class Slotted(Serializable, slots=True):
+    @SerializeField(default=0.0, type_hint=float)
+    def speed(self): pass
+
+    @SerializeField(default=None, type_hint=Serializable)
+    def target(self): pass
+
+
+CASES = {
+    "get plain": "obj.speed",
+    "get reference": "obj.target",
+    "set plain": "obj.speed = 1.0",
+    "set (subscribed)": "obj.speed = 1.0",
+}
+
+
+def main(iterations):
+    print(f"{iterations} operations, ns/op")
+    print(f"{'case':>18} {'legacy':>8} {'fast':>8} {'slotted':>8} {'speedup':>8}")
+    for case, stmt in CASES.items():
+        timings = []
+        for cls in (Legacy, Fast, Slotted):
+            obj = cls()
+            if case == "set (subscribed)":
+                obj.subscribe(lambda: None, immediate=True, fields=("target",))
+            seconds = min(timeit.repeat(stmt, globals={"obj": obj}, number=iterations, repeat=5))
+            timings.append(seconds / iterations * 1e9)
+        legacy, fast, slotted = timings
+        print(f"{case:>18} {legacy:>8.1f} {fast:>8.1f} {slotted:>8.1f} {legacy / min(fast, slotted):>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -1,6 +1,6 @@
 from .transform import Transform
 from .component import Component
 from .rigidbody import RigidBody
-from .collider import CircleCollider, BoxCollider
+from .collider import Collider, CircleCollider, BoxCollider
 from .component_registry import Component_Registry
 from .test_component import Test_Component
\ No newline at end of file
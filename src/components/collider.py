@@ -1,5 +1,6 @@
 from .component import Component
 from ..core import Options
+from ..managers.physics import PhysicsWorld
 import pymunk
 
 
@@ -17,6 +18,15 @@ class Collider(Component):
     def create_shape(self, body):
         raise NotImplementedError
 
+    def awake(self):
+        if world := PhysicsWorld.of(self):
+            world.add_collider(self)
+
+    def destroy(self):
+        if world := PhysicsWorld.of(self):
+            world.remove_collider(self)
+        super().destroy()
+
     def start(self):
         from . import RigidBody
         rigidbody : RigidBody = self.gameobject.get_component(RigidBody)
@@ -39,9 +49,6 @@ class BoxCollider(Collider):
         self.shape = shape
         return shape
     
-    @classmethod
-    def from_dict(cls, gameobject, **kwargs):
-        return cls(gameobject, **kwargs)
     
 
     
@@ -58,6 +65,3 @@ class CircleCollider(Collider):
         self.shape = shape
         return shape
 
-    @classmethod
-    def from_dict(cls, gameobject, **kwargs):
-        return cls(gameobject, **kwargs)
@@ -2,6 +2,10 @@ from ..core import Observable
 from ..managers.serialization.util import SerializeField
 from ..managers.serialization.serializable import Serializable
 import inspect
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core.gameobject import GameObject
 
 class Component(Serializable):
 
@@ -14,15 +18,17 @@ class Component(Serializable):
         elif not value and self.enabled:
             self._enabled = False
             self.on_disable()
-        self.notify()
+        gameobject = getattr(self, "gameobject", None)
+        if gameobject is not None and gameobject.scene:
+            gameobject.scene.scheduler.refresh(self)
+        self.notify("enabled")
 
     @SerializeField(default=True, type_hint=bool, setter=enabled_setter, hidden= True)
     def enabled(self) -> bool | None: pass
 
     def __init__(self, gameobject, **kwargs):
-        from ..core.gameobject import GameObject
         super().__init__(**kwargs)
-        self.gameobject: GameObject = gameobject
+        self.gameobject: 'GameObject' = gameobject
         self.removable = True
         self.always_enabled = False
 
@@ -39,11 +45,9 @@ class Component(Serializable):
     def set_enabled(self, e):
         self.enabled = e
 
-    def to_dict(self) -> 'Component' : pass
-   
     @classmethod
     def from_dict(cls, gameobject, **kwargs):
-        return cls(gameobject, **kwargs)
+        return cls._schema.load(cls, kwargs, (gameobject,))
         
 class CustomComponent(Component):
     def __init__(self, gameobject, **kwargs):
@@ -1,8 +1,13 @@
 
 
 
+import hashlib
+
+
 class Component_Registry:
     registry = {}
+    _version = None
+    _by_name = None  # lower-case class name -> class, rebuilt after (un)registering
 
     @classmethod
     def register_component(cls, component_name, component_class, component_widget):
@@ -11,9 +16,32 @@ class Component_Registry:
             "class" : component_class,
             "widget" : component_widget
         }
+        cls._version = None
+        cls._by_name = None
 
     @classmethod
     def unregister_component(cls, type_name):
         del cls.registry[type_name] 
+        cls._version = None
+        cls._by_name = None
+
+    @classmethod
+    def find(cls, name):
+        """Registered component class by class name, case-insensitive; None if there is none."""
+        if cls._by_name is None:
+            cls._by_name = {entry["class"].__name__.lower(): entry["class"] for entry in cls.registry.values()}
+        return cls._by_name.get(name.lower())
+
+    @classmethod
+    def version(cls) -> str:
+        """Fingerprint of the registered component types and their serialized fields; changes whenever either does."""
+        if cls._version is None:
+            digest = hashlib.blake2b(digest_size=8)
+            for name in sorted(cls.registry):
+                component_class = cls.registry[name]["class"]
+                fields = ",".join(field for field, _ in component_class._schema.persistent)
+                digest.update(f"{name}={component_class.__module__}.{component_class.__qualname__}({fields});".encode())
+            cls._version = digest.hexdigest()
+        return cls._version
     
     
\ No newline at end of file
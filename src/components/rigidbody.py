@@ -3,6 +3,7 @@ import pymunk
 import pygame
 from ..core import Options
 from ..managers.serialization.util import SerializeField
+from ..managers.physics import PhysicsWorld
 
 
 class RigidBody(Component):
@@ -22,22 +23,30 @@ class RigidBody(Component):
 
     def awake(self):
         self.body = pymunk.Body(self.mass, self.moment, self.body_type['Dynamic'])
+        if world := PhysicsWorld.of(self):
+            world.add_rigidbody(self)
+
+    def on_enable(self):
+        if world := PhysicsWorld.of(self):
+            world.add_rigidbody(self)
+
+    def on_disable(self):
+        if world := PhysicsWorld.of(self):
+            world.remove_rigidbody(self)
+
+    def destroy(self):
+        if world := PhysicsWorld.of(self):
+            world.remove_rigidbody(self)
+        super().destroy()
     
     def start(self):
         from . import Transform
-        transform : Transform = self.gameobject.get_component("Transform")
+        transform : Transform = self.gameobject.get_component(Transform)
         self.body.position = pymunk.Vec2d(*transform.position)
         self.body.angle = transform.angle
-    
-    def fixed_update(self):
-        from . import Transform
-        transform : Transform = self.gameobject.get_component("Transform")
-        transform.position = pygame.Vector2(*self.body.position)
-        transform.angle = self.body.angle
 
-    @classmethod
-    def from_dict(cls, gameobject, **kwargs):
-        return cls(gameobject, **kwargs)
+    # Body -> Transform sync happens in batch in PhysicsWorld.step (see BodySync)
+
 
 
     
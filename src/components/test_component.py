@@ -29,9 +29,6 @@ class Test_Component(Component):
         if self.transform:
             self.transform.position = pygame.Vector2(self.x, self.y)
 
-    @classmethod
-    def from_dict(cls, gameobject, **kwargs):
-        return cls(gameobject, **kwargs)
     
     def update_transform(self):
         if self.enabled:
@@ -1,12 +1,113 @@
 from __future__ import annotations
+import math
 import numpy as np
 from pygame import Vector2
 from .component import Component
-from ..managers.serialization.util import SerializeField
+from ..managers.serialization.util import SerializeField, stamp
 from ..managers.serialization.serializable import  Serializable
 
+class TransformVector(Vector2):
+    """
+    What Transform.position / scale return: a copy of the value (from the TransformStore row,
+    or the Transform's own Vector2) that writes itself back through the Transform's setter
+    when edited in place (v.x = 1, v[0] = 1, v += d, v.rotate_ip(90), ...), so the world cache
+    is invalidated, the change tick stamped and subscribers notified.
+    - vectors computed from it (v + d, v.copy()) are detached copies
+    """
+    __slots__ = ("_transform", "_field")
+
+    def _write_back(self):
+        transform = getattr(self, "_transform", None)
+        if transform is not None:
+            setattr(transform, self._field, self)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name[0] != "_":  # x, y, xy, swizzles
+            self._write_back()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._write_back()
+
+
+def _write_through(name):
+    method = getattr(Vector2, name)
+
+    def in_place(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._write_back()
+        return result
+    in_place.__name__ = name
+    return in_place
+
+
+def _view(values, transform, field):
+    vector = TransformVector(values)
+    # Slot descriptors directly: the overridden __setattr__ would cost two Python calls per read
+    _set_transform(vector, transform)
+    _set_field(vector, field)
+    return vector
+
+
+_set_transform = TransformVector._transform.__set__
+_set_field = TransformVector._field.__set__
+
+for _name in ("__iadd__", "__isub__", "__imul__", "__itruediv__", "__ifloordiv__", "update", "from_polar",
+              "normalize_ip", "scale_to_length", "rotate_ip", "rotate_rad_ip", "reflect_ip",
+              "clamp_magnitude_ip", "move_towards_ip"):
+    setattr(TransformVector, _name, _write_through(_name))
+
+
 class Transform(Component):
 
+    # Set while the Transform lives in a scene's TransformStore (see bind())
+    _store = None
+    _index = -1
+
+    # Cached world affine (a, b, c, d, tx, ty); a dirty Transform implies a dirty subtree
+    _world_dirty = True
+    _world_affine = None
+
+    def position_getter(self):
+        if self._store is not None:
+            return _view(self._store.positions[self._index].tolist(), self, "position")
+        return _view(self._position, self, "position")
+
+    def position_setter(self, value):
+        if self._store is not None:
+            self._store.positions[self._index] = (value[0], value[1])
+        else:
+            self._position = Vector2(value)  # own copy: never the caller's vector or a view
+        self._invalidate_world()
+        self.notify("position")
+
+    def angle_getter(self):
+        if self._store is not None:
+            return float(self._store.angles[self._index])
+        return self._angle
+
+    def angle_setter(self, value):
+        if self._store is not None:
+            self._store.angles[self._index] = value
+        else:
+            self._angle = value
+        self._invalidate_world()
+        self.notify("angle")
+
+    def scale_getter(self):
+        if self._store is not None:
+            return _view(self._store.scales[self._index].tolist(), self, "scale")
+        return _view(self._scale, self, "scale")
+
+    def scale_setter(self, value):
+        if self._store is not None:
+            self._store.scales[self._index] = (value[0], value[1])
+        else:
+            self._scale = Vector2(value)
+        self._invalidate_world()
+        self.notify("scale")
+
     def parent_setter(self, new_transform, keep_world=True):
         if new_transform is self:
             raise ValueError("Cannot set a Transform as its own parent.")
@@ -17,50 +118,170 @@ class Transform(Component):
         if new_transform:
             if self not in new_transform.children:
                 new_transform.children.append(self)
-        self.notify()
-        self.gameobject.notify()
+        self._invalidate_world()
+        self.notify("parent")
+        self.gameobject._hierarchy_active_changed()
+        self.gameobject.notify("parent")
     
     def parent_getter(self):
         return self._parent
 
-    @SerializeField(type_hint=Vector2, default=lambda: Vector2(0, 0))
+    @SerializeField(type_hint=Vector2, default=lambda: Vector2(0, 0), getter=position_getter, setter=position_setter)
     def position(self): pass
     
-    @SerializeField(type_hint=float, default=0.0)
+    @SerializeField(type_hint=float, default=0.0, getter=angle_getter, setter=angle_setter)
     def angle(self): pass
     
-    @SerializeField(type_hint=Vector2, default=lambda: Vector2(1, 1))
+    @SerializeField(type_hint=Vector2, default=lambda: Vector2(1, 1), getter=scale_getter, setter=scale_setter)
     def scale(self): pass    
     
-    @SerializeField(type_hint= Serializable , setter= parent_setter, getter= parent_getter, hidden= True)
+    @SerializeField(type_hint= Serializable , setter= parent_setter, getter= parent_getter, hidden= True, transient= True)
     def parent(self): pass    
 
-    @SerializeField(type_hint= list, default= lambda: [])
+    @SerializeField(type_hint= list, default= lambda: [], transient= True)
     def children(self):  pass
     
 
     def __init__(self, gameobject, **kwargs):
         super().__init__(gameobject, **kwargs)
         self._children = list(self.children)
-        self._position = Vector2(self.position)
-        self._scale = Vector2(self.scale)
+        self._position = Vector2(self._position)
+        self._scale = Vector2(self._scale)
         self.removable = False
         self.always_enabled = True
 
+    def set_pose(self, x, y, angle):
+        """Set position and angle in place with a single notify()."""
+        if self._store is not None:
+            self._store.positions[self._index] = (x, y)
+            self._store.angles[self._index] = angle
+        else:
+            self._position.update(x, y)
+            self._angle = angle
+        stamp(self)
+        self._invalidate_world()
+        self.notify("position", "angle")
+
+    def bind(self, store):
+        """Move position / angle / scale into a row of `store`."""
+        if self._store is store:
+            return
+        position, angle, scale = self.position, self.angle, self.scale
+        self.unbind()
+        index = store.allocate(self)
+        store.positions[index] = (position.x, position.y)
+        store.angles[index] = angle
+        store.scales[index] = (scale.x, scale.y)
+        self._store = store
+        self._index = index
+        del self._position, self._angle, self._scale
+
+    def unbind(self):
+        """Copy values back out of the store and release the row."""
+        store = self._store
+        if store is None:
+            return
+        position, angle, scale = self.position, self.angle, self.scale
+        store.release(self._index)
+        self._store = None
+        self._index = -1
+        self._position, self._angle, self._scale = Vector2(position), angle, Vector2(scale)
+
+    def destroy(self):
+        self.unbind()
+        super().destroy()
+
     def add_child(self, transform):
         transform.parent = self
-        self.children.append(transform)
-
-    def to_dict(self):
-        return {
-            "position": [self.position.x, self.position.y],
-            "angle": self.angle,
-            "scale": [self.scale.x, self.scale.y]
-        }
-
-    @classmethod
-    def from_dict(cls, gameobject, **kwargs):
-        return cls(gameobject, **kwargs)
-    
+
+    def _adopt(self, transforms):
+        """
+        Parent many Transforms that have no parent yet, e.g. while loading: unlike the parent
+        setter there is no per-child scan of the children list, so k children cost O(k).
+        Scheduling is left to the caller (_hierarchy_active_changed once per adopted subtree).
+        """
+        for transform in transforms:
+            transform._parent = self
+            transform._invalidate_world()
+            transform.notify("parent")
+            transform.gameobject.notify("parent")
+        self._children.extend(transforms)
+
+    def _invalidate_world(self):
+        if self._world_dirty:
+            return
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._world_dirty:
+                continue
+            node._world_dirty = True
+            stack.extend(child for child in node._children if isinstance(child, Transform))
+
+    def _local_affine(self):
+        if self._store is not None:
+            store, index = self._store, self._index
+            (px, py), (sx, sy) = store.positions[index].tolist(), store.scales[index].tolist()
+            angle = float(store.angles[index])
+        else:
+            (px, py), (sx, sy), angle = self._position, self._scale, self._angle
+        cos, sin = math.cos(angle), math.sin(angle)
+        return (cos * sx, sin * sx, -sin * sy, cos * sy, px, py)
+
+    def _world(self):
+        """World affine, recomputing only the dirty part of the parent chain."""
+        if not self._world_dirty:
+            return self._world_affine
+        chain = []
+        node = self
+        while node is not None and node._world_dirty:
+            chain.append(node)
+            node = node._parent
+        parent = node._world_affine if node is not None else None
+        for node in reversed(chain):
+            local = node._local_affine()
+            if parent is None:
+                world = local
+            else:
+                pa, pb, pc, pd, ptx, pty = parent
+                la, lb, lc, ld, ltx, lty = local
+                world = (
+                    pa * la + pc * lb, pb * la + pd * lb,
+                    pa * lc + pc * ld, pb * lc + pd * ld,
+                    pa * ltx + pc * lty + ptx, pb * ltx + pd * lty + pty,
+                )
+            node._world_affine = world
+            node._world_dirty = False
+            parent = world
+        return parent
+
+    @property
+    def world_matrix(self) -> np.ndarray:
+        """3x3 local-to-world matrix (angles in radians)."""
+        a, b, c, d, tx, ty = self._world()
+        return np.array([[a, c, tx], [b, d, ty], [0.0, 0.0, 1.0]])
+
+    @property
+    def world_position(self) -> Vector2:
+        a, b, c, d, tx, ty = self._world()
+        return Vector2(tx, ty)
+
+    @property
+    def world_angle(self) -> float:
+        a, b, c, d, tx, ty = self._world()
+        return math.atan2(b, a)
+
+    @property
+    def world_scale(self) -> Vector2:
+        a, b, c, d, tx, ty = self._world()
+        sign = -1.0 if a * d - b * c < 0 else 1.0
+        return Vector2(math.hypot(a, b), sign * math.hypot(c, d))
+
+    def transform_point(self, point) -> Vector2:
+        """Map a point from this Transform's local space to world space."""
+        a, b, c, d, tx, ty = self._world()
+        x, y = point[0], point[1]
+        return Vector2(a * x + c * y + tx, b * x + d * y + ty)
+
     def __repr__(self):
         return f"<Transform position={self.position} angle={self.angle} scale={self.scale}>"
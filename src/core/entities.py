@@ -0,0 +1,99 @@
+import threading
+import uuid
+
+
+class Entities:
+    """
+    Generational integer handles: the runtime identity of GameObjects (GameObject.id).
+    - handle → slot index in the low INDEX_BITS bits, the slot's generation above them;
+      index(handle) is dense, so it can index per-entity arrays
+    - release() bumps the slot's generation before the slot is reused, so a handle kept
+      past destroy() never matches whatever gets the slot next (alive() is False)
+    - generations start at 1, so no live handle is 0 (or falsy)
+    The persistent UUIDs that scene files use live only here, in one uuid ↔ handle table,
+    and only for entities that were loaded with one or have been asked for one (saving).
+    The same UUID can be live more than once (a scene loaded additively twice); handles()
+    lists all of them and each scene picks its own.
+    Thread-safe: GameObject.__del__ may release from whichever thread the GC runs on.
+    """
+    INDEX_BITS = 32
+    INDEX_MASK = (1 << INDEX_BITS) - 1
+
+    _generations = []  # slot -> generation of the handle currently issued for it
+    _free = []  # released slots
+    _uuids = {}  # handle -> uuid string
+    _handles = {}  # uuid string -> {handle: None}, in the order they got it
+
+    # Reentrant: a GC pass inside allocate() can run __del__ → release() on the same thread
+    _lock = threading.RLock()
+
+    @classmethod
+    def allocate(cls) -> int:
+        with cls._lock:
+            if cls._free:
+                index = cls._free.pop()
+            else:
+                index = len(cls._generations)
+                cls._generations.append(1)
+            return (cls._generations[index] << cls.INDEX_BITS) | index
+
+    @classmethod
+    def release(cls, handle):
+        with cls._lock:
+            if not cls.alive(handle):
+                return
+            index = handle & cls.INDEX_MASK
+            cls._generations[index] += 1
+            cls._free.append(index)
+            if (persistent := cls._uuids.pop(handle, None)) is not None:
+                cls._unmap(persistent, handle)
+
+    @classmethod
+    def alive(cls, handle) -> bool:
+        index = handle & cls.INDEX_MASK
+        return index < len(cls._generations) and cls._generations[index] == handle >> cls.INDEX_BITS
+
+    @classmethod
+    def index(cls, handle) -> int:
+        return handle & cls.INDEX_MASK
+
+    @classmethod
+    def uuid(cls, handle):
+        """The entity's persistent UUID, generated on first use; None once the handle is released."""
+        persistent = cls._uuids.get(handle)
+        if persistent is None:
+            with cls._lock:
+                persistent = cls._uuids.get(handle)
+                if persistent is None and cls.alive(handle):
+                    persistent = str(uuid.uuid4())
+                    cls._uuids[handle] = persistent
+                    cls._handles[persistent] = {handle: None}
+        return persistent
+
+    @classmethod
+    def set_uuid(cls, handle, persistent):
+        """Give the entity the UUID it was saved with."""
+        with cls._lock:
+            if (previous := cls._uuids.get(handle)) is not None:
+                cls._unmap(previous, handle)
+            cls._uuids[handle] = persistent
+            cls._handles.setdefault(persistent, {})[handle] = None
+
+    @classmethod
+    def find(cls, persistent):
+        """UUID → handle of the live entity that got it last, or None."""
+        handles = cls._handles.get(persistent)
+        return next(reversed(handles), None) if handles else None
+
+    @classmethod
+    def handles(cls, persistent):
+        """Handles of every live entity with this UUID, the one that got it last first."""
+        return list(reversed(cls._handles.get(persistent, ())))
+
+    @classmethod
+    def _unmap(cls, persistent, handle):
+        handles = cls._handles.get(persistent)
+        if handles is not None:
+            handles.pop(handle, None)
+            if not handles:
+                del cls._handles[persistent]
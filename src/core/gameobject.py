@@ -1,36 +1,64 @@
 from __future__ import annotations
 from .util import Observable
-import uuid
-import asyncio
-from PyQt6.QtCore import QTimer
+from .entities import Entities
 from src.managers.serialization.util import SerializeField
 from src.managers.serialization.serializable import Serializable
-from ..components import Component_Registry
+from ..components import Component_Registry, Transform
 from  ..managers import Layer, LayerManager
 
 
 class GameObject(Serializable):
+    # Load mode: GameObjects that load inactive (themselves or through an ancestor) keep their
+    # components, except the Transform, as saved data until get_component() / components needs
+    # them or the object is activated; untouched ones are saved back from that data
+    lazy_components = False
+
+    def _reindex(self, field, value):
+        if (scene := self.scene) is not None:
+            scene.index.move(self, field, getattr(self, "_" + field), value)
+
+    def name_setter(self, name):
+        self._reindex("name", name)
+        self._name = name
+        if self._subscribers:
+            self.notify("name")
+
+    def tag_setter(self, tag):
+        self._reindex("tag", tag)
+        self._tag = tag
+        if self._subscribers:
+            self.notify("tag")
 
     def layer_setter(self, layer):
         from ..managers import LayerManager
-        self._layer = LayerManager.get_layer(layer)
-        self.notify()
+        layer = LayerManager.get_layer(layer)
+        self._reindex("layer", layer)
+        self._layer = layer
+        if self._subscribers:
+            self.notify("layer")
 
     def transform_setter(self, transform):
         self._transform = transform
         self.add_component(transform, override= True)
 
     def transform_getter(self):
-        return self.get_component("Transform")
+        return self._components.get(Transform)  # never lazily loaded
+
+    def components_getter(self):
+        if self._pending is not None:
+            self._materialize()
+        return self._components
 
     def active_setter(self, active):
         self._active = active
-        self.notify()
+        self._hierarchy_active_changed()
+        if self._subscribers:
+            self.notify("active")
 
-    @SerializeField(default= "GameObject", type_hint= str)
+    @SerializeField(default= "GameObject", type_hint= str, setter= name_setter)
     def name(self): pass
 
-    @SerializeField(default= "Untagged", type_hint= str)
+    @SerializeField(default= "Untagged", type_hint= str, setter= tag_setter)
     def tag(self): pass
 
     @SerializeField(default= LayerManager.default , type_hint= Layer, setter=layer_setter)
@@ -39,38 +67,101 @@ class GameObject(Serializable):
     @SerializeField(default=True, type_hint=bool, setter= active_setter)
     def active(self) -> bool: pass
 
-    @SerializeField(default=lambda : {}, type_hint=dict)
+    @SerializeField(default=lambda : {}, type_hint=dict, getter= components_getter, transient= True)
     def components(self) -> dict: pass
 
-    @SerializeField(default= None, setter= transform_setter, getter= transform_getter, type_hint= "Transform")  
+    @SerializeField(default= None, setter= transform_setter, getter= transform_getter, type_hint= "Transform", transient= True)  
     def transform(self): pass  
 
-    @SerializeField(default= lambda : str(uuid.uuid4()), type_hint=str, hidden= True)
-    def id(self): pass
-
-    @SerializeField(default=None, type_hint= 'Scene')
+    @SerializeField(default=None, type_hint= 'Scene', transient= True)
     def scene(self): pass
 
     def __init__(self, **kwargs):
-        from ..components import Transform
         from ..managers import LayerManager
         super().__init__(**kwargs)
-        self.layer = LayerManager.get_layer(self.layer)
+        self._id = Entities.allocate()
+        if (persistent := kwargs.get("id")) is not None:
+            Entities.set_uuid(self._id, persistent)
+        # Straight to the slot: not in a scene yet and nobody subscribed, so the setter has nothing to do
+        self._layer = LayerManager.get_layer(self._layer)
         self._components = {}
+        self._pending = None  # lower-case type name -> saved data of components not built yet (lazy_components)
         self._destroyed = False
-        self.transform = Transform(self)
+        if "transform" not in kwargs:  # _from_dict passes transform=None and adds the saved Transform itself
+            self.transform = Transform(self)
+
+    @property
+    def id(self) -> int:
+        """Runtime identity: a generational handle (see Entities); never reused for another GameObject."""
+        return self._id
+
+    @property
+    def uuid(self) -> str:
+        """Persistent identity, saved as "id" in scene files; generated the first time it's needed."""
+        return Entities.uuid(self._id)
+
+    @property
+    def parent(self):
+        transform = self.transform
+        if transform is None or transform.parent is None:
+            return None
+        return transform.parent.gameobject
+
+    @parent.setter
+    def parent(self, gameobject):
+        self.transform.parent = gameobject.transform if gameobject else None
+
+    @property
+    def active_in_hierarchy(self):
+        gameobject = self
+        while gameobject is not None:
+            if not gameobject.active:
+                return False
+            gameobject = gameobject.parent
+        return True
+
+    def _hierarchy_active_changed(self):
+        """Re-evaluate which components of this gameobject and its descendants get scheduled."""
+        scene = self.scene
+        if scene is None or getattr(self, "_components", None) is None:
+            return
+        stack = [self]
+        while stack:
+            gameobject = stack.pop()
+            if gameobject._pending is not None and gameobject.active_in_hierarchy:
+                gameobject._materialize()
+            scene.scheduler.add_gameobject(gameobject)
+            stack.extend(gameobject.children)
+
+    @property
+    def children(self):
+        transform = self.transform
+        if transform is None:
+            return []
+        return [child.gameobject for child in transform.children]
 
     def add_component(self, component, override = False):
+        if self._pending is not None:
+            self._materialize(type(component))
         if not override and type(component) in self._components:
             return self._components[type(component)]
         self.remove_component(type(component))
         self._components[type(component)] = component
         component.awake()
-        self.notify()
+        if self.scene:
+            self.scene.index.add_component(self, component)
+            self.scene.scheduler.add(component)
+        self.notify("components")
         return component
 
     def get_component(self, component_type):
+        if self._pending is not None:
+            self._materialize(component_type)
         if isinstance(component_type, str):
+            component_class = Component_Registry.find(component_type)
+            if component_class is not None:
+                return self._components.get(component_class)
+            # Not a registered type: match by class name
             for comp in self._components.values():
                 if comp.__class__.__name__.lower() == component_type.lower():
                     return comp
@@ -78,54 +169,140 @@ class GameObject(Serializable):
         else:
             return self._components.get(component_type, None)
 
+    def _materialize(self, component_type=None):
+        """Build lazily loaded components from their saved data: all of them, or the one matching component_type."""
+        pending = self._pending
+        if component_type is None:
+            keys = list(pending)
+        else:
+            key = (component_type if isinstance(component_type, str) else component_type.__name__).lower()
+            if key not in pending:
+                return
+            keys = [key]
+        registry = Component_Registry.registry
+        for key in keys:
+            # Building one component may build another first (a Collider looks up its RigidBody)
+            data = pending.pop(key, None)
+            if data is not None:
+                self.add_component(registry[data["type"]]["class"].from_dict(self, **data), override= True)
+        if not pending:
+            self._pending = None
+
     def remove_component(self, component_type):
         comp = self.get_component(component_type)
         if comp and comp.removable:
             comp = self._components.pop(type(comp), None)
+            if self.scene:
+                self.scene.index.remove_component(self, type(comp))
+                self.scene.scheduler.remove(comp)
             comp.destroy()
-            self.notify()
+            self.notify("components")
             return True
         return False
 
     def destroy(self):
+        """Destroy this GameObject and its whole subtree, deepest first; the top one leaves its parent."""
         if getattr(self, "_destroyed", False):
             return
+        transform = self._components.get(Transform)
+        if transform is not None and (parent := transform._parent) is not None and transform in parent._children:
+            parent._children.remove(transform)
+        subtree, stack = [], [self]
+        while stack:
+            gameobject = stack.pop()
+            subtree.append(gameobject)
+            stack.extend(child for child in gameobject.children if not child._destroyed)
+        for gameobject in reversed(subtree):
+            gameobject._destroy()
+
+    def __del__(self):
+        # Fallback for GameObjects dropped without destroy() (e.g. a scene that was never unloaded)
+        if self.__dict__.get("_destroyed") is False:
+            Entities.release(self._id)
+
+    def _destroy(self):
         self._destroyed = True
+        if self.scene:
+            self.scene.index.remove(self)
+            self.scene.scheduler.remove_gameobject(self)
         for comp in list(self._components.values()):
             comp.destroy()
         self._components.clear()
+        self._pending = None
         self._transform = None
+        Entities.release(self._id)
 
         self.notify()
 
 
-    def to_dict(self):
-        component_data = []
-        for comp in self.components.values():
-            if comp.to_dict:
-                component_data.append({
-                    'type': comp.__class__.__name__,
-                    'data': comp.to_dict()
-                })
-        return {
-            "name": self.name,
-            "tag": self.tag,
-            "active": self.active,
-            "components": component_data,
-            "children": [child.to_dict() for child in self.children]
-        }
+    def to_dict(self, recursive=True):
+        """recursive=False → "children" lists child UUIDs instead of nesting their data."""
+        data = self._schema.dump(self)
+        data["id"] = self.uuid
+        data["components"] = [
+            {"type": type(comp).__name__, **comp.to_dict()} for comp in self._components.values()
+        ]
+        if self._pending is not None:
+            data["components"] += [dict(comp_data) for comp_data in self._pending.values()]
+        if recursive:
+            data["children"] = [child.to_dict() for child in self.children]
+        else:
+            data["children"] = [child.uuid for child in self.children]
+        return data
 
     @classmethod
     def from_dict(cls, **kwargs):
-        go = cls(**kwargs)
-        for comp_data in kwargs.get("components", []):
-            comp_type = comp_data["type"]
-            comp_cls = Component_Registry.registry.get(comp_type).get("class")  # you'll need a registry
-            if comp_cls:
-                comp = comp_cls.from_dict(go, **comp_data)
-                go.add_component(comp)
-        for child_data in kwargs.get("children", []):
-            child = cls.from_dict(**child_data)
-            child.parent = go
-            go.children.append(child)
+        from ..managers.serialization.linker import Linker
+        with Linker.scope() as linker:
+            return cls._from_dict(kwargs, False, linker)
+
+    @classmethod
+    def _from_dict(cls, data, dormant, linker):
+        """
+        dormant → an ancestor loads inactive, so with lazy_components this whole subtree waits too.
+        Nested children are attached here; hierarchy given as ids is left to the linker.
+        """
+        extra = {"id": data["id"], "transform": None} if "id" in data else {"transform": None}
+        go = cls._schema.load(cls, data, (), extra)
+        linker.add(data.get("id"), go)
+        dormant = dormant or not go.active
+        lazy = dormant and cls.lazy_components
+        registry = Component_Registry.registry
+        components = data.get("components", [])
+        # The saved Transform is built first, in place of the default one (other components may read it)
+        transform_data = next((comp_data for comp_data in components if comp_data["type"] == "Transform"), None)
+        if transform_data is not None:
+            go.transform = transform = Transform.from_dict(go, **transform_data)
+            linker.add(transform_data.get("id"), transform)
+        else:
+            go.transform = transform = Transform(go)
+        for comp_data in components:
+            if comp_data is transform_data:
+                continue
+            type_name = comp_data["type"]
+            entry = registry.get(type_name)
+            if entry and entry["class"]:
+                if lazy:
+                    if go._pending is None:
+                        go._pending = {}
+                    go._pending[type_name.lower()] = comp_data
+                else:
+                    comp = entry["class"].from_dict(go, **comp_data)
+                    go.add_component(comp, override= True)
+                    linker.add(comp_data.get("id"), comp)
+
+        if transform_data is not None:
+            if type(parent := transform_data.get("parent")) is str:
+                linker.link_parent(parent, transform, from_child= True)
+            for child in transform_data.get("children") or ():
+                if type(child) is str:
+                    linker.link_parent(transform, child)
+        children = []
+        for child_data in data.get("children", []):
+            if type(child_data) is str:
+                linker.link_parent(transform, child_data)
+            else:
+                children.append(cls._from_dict(child_data, dormant, linker).transform)
+        if children:
+            transform._adopt(children)
         return go
@@ -1,6 +1,8 @@
 
+import threading
+import weakref
+from contextlib import contextmanager
 import numpy as np
-from PyQt6.QtCore import QObject, pyqtSignal
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
@@ -23,56 +25,196 @@ class Options:
         pass
         
 
-class Observable(QObject):
-    # Normal Qt signal for direct usage (optional)
-    updated = pyqtSignal()
-
-    # Global callback queue (shared by all Observable instances)
-    _callback_queue = set()
+_Tracer = None  # managers.profiler.Tracer, resolved on the first dispatch (managers imports this module)
+
+
+def _run_callback(callback, *args):
+    global _Tracer
+    Tracer = _Tracer
+    if Tracer is None:
+        from ..managers.profiler import Tracer
+        _Tracer = Tracer
+    if Tracer.enabled:
+        name = getattr(callback, "__qualname__", None) or repr(callback)
+        with Tracer.span(name):
+            callback(*args)
+    else:
+        callback(*args)
+
+
+class Subscription:
+    """
+    Handle returned by Observable.subscribe().
+    Bound methods are held through a WeakMethod, so subscribing does not keep the
+    subscriber alive; the subscription removes itself once the instance is collected.
+    Other callables (functions, lambdas, partials) are held strongly until unsubscribe().
+    """
+    __slots__ = ("_observable", "_callback", "_weak", "immediate", "fields", "pass_changes", "__weakref__")
+
+    def __init__(self, observable, callback, immediate, fields, pass_changes):
+        self._observable = weakref.ref(observable)
+        self._weak = hasattr(callback, "__self__") and hasattr(callback, "__func__")
+        self._callback = weakref.WeakMethod(callback, self._on_collected) if self._weak else callback
+        self.immediate = immediate
+        self.fields = fields
+        self.pass_changes = pass_changes
+
+    @property
+    def callback(self):
+        """The subscribed callable, or None once its instance has been collected."""
+        return self._callback() if self._weak else self._callback
+
+    @property
+    def active(self):
+        observable = self._observable()
+        return observable is not None and self in observable._subscribers and self.callback is not None
+
+    def unsubscribe(self):
+        observable = self._observable()
+        if observable is not None and observable._subscribers:
+            observable._subscribers.pop(self, None)
+
+    def _on_collected(self, _ref):
+        self.unsubscribe()
+
+
+class Observable:
+    """
+    Plain-Python observable base for the data model (no QObject per instance).
+    Qt only comes in where a widget subscribes with owner=: the subscription is
+    dropped when the owner's destroyed signal fires.
+    """
+    __slots__ = ("_subscribers", "__weakref__")
+
+    # Global callback queue (shared by all Observable instances), in first-queued order:
+    # callback -> [changed field names or None for "unspecified", pass_changes]
+    _callback_queue = {}
+
+    # Most callbacks one emit_all() may run; the rest (including cascades) wait for the next frame
+    max_callbacks_per_emit = 10000
+
+    # Inside batch(): observable -> merged changes, dispatched once when the outermost batch exits
+    _batch_depth = 0
+    _batched = {}
 
     def __init__(self):
         super().__init__()
-        self._subscribers = []  # store (callback, immediate)
+        self._subscribers = ()  # Subscription -> None in subscribe order; a dict once subscribed
 
-    def subscribe(self, callback, owner: QObject = None, immediate: bool = False):
+    def subscribe(self, callback, owner = None, immediate: bool = False,
+                  fields=None, pass_changes: bool = False) -> Subscription:
         """
-        Subscribe a callback.
+        Subscribe a callback and return its Subscription handle.
         - immediate=True → callback runs instantly when notify() is called.
         - immediate=False → callback is queued for emit_all().
+        - fields → only called when one of these fields changed (or the change is unspecified).
+        - pass_changes=True → called with the frozenset of changed field names (None if unspecified).
+        - owner → a QObject whose destroyed signal ends the subscription.
         """
-        
-        self._subscribers.append((callback, immediate))
+        fields = frozenset(fields) if fields is not None else None
+        subscription = Subscription(self, callback, immediate, fields, pass_changes)
+        if not self._subscribers:
+            self._subscribers = {}
+        self._subscribers[subscription] = None
 
-        if owner:
+        if owner is not None:
             # Auto-remove subscriber when owner is deleted
-            owner.destroyed.connect(lambda: self._remove_subscriber(callback))
+            owner.destroyed.connect(subscription.unsubscribe)
+        return subscription
 
-    def _remove_subscriber(self, callback):
-        self._subscribers = [(cb, imm) for cb, imm in self._subscribers if cb != callback]
+    def unsubscribe(self, callback):
+        """Remove every subscription of `callback` (prefer Subscription.unsubscribe(), which is O(1))."""
+        for subscription in [sub for sub in self._subscribers if sub.callback == callback]:
+            subscription.unsubscribe()
     
     def clear_subscribers(self):
-        self._subscribers.clear()
+        self._subscribers = ()
 
-    def notify(self):
+    def notify(self, *fields):
         """
-        Notify subscribers.
+        Notify subscribers that `fields` changed (no fields → unspecified change).
         - Immediate subscribers are called right now.
-        - Deferred subscribers are queued for later emit_all().
+        - Deferred subscribers are queued for later emit_all(); a callback that is already
+          queued keeps its place and its change set is merged.
+        - Inside Observable.batch() nothing runs or queues until the batch exits.
         """
-        for callback, immediate in self._subscribers:
-            if immediate:
-                callback()
-            else:
-                Observable._callback_queue.add(callback)
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        changes = frozenset(fields) if fields else None
+        if Observable._batch_depth:
+            batched = Observable._batched
+            if self not in batched:
+                batched[self] = changes
+            elif batched[self] is not None:
+                batched[self] = None if changes is None else batched[self] | changes
+            return
+        self._dispatch(changes)
+
+    def _dispatch(self, changes):
+        queue = Observable._callback_queue
+        subscribers = self._subscribers
+        for subscription in tuple(subscribers):
+            wanted = subscription.fields
+            if wanted is not None and changes is not None and wanted.isdisjoint(changes):
+                continue
+            callback = subscription.callback
+            if callback is None:
+                continue
+            pass_changes = subscription.pass_changes
+            if subscription.immediate:
+                if pass_changes:
+                    _run_callback(callback, changes)
+                else:
+                    _run_callback(callback)
+                continue
+            entry = queue.get(callback)
+            if entry is None:
+                queue[callback] = [changes, pass_changes]
+            elif entry[0] is not None:
+                entry[0] = None if changes is None else entry[0] | changes
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """
+        Hold back every notify() until the outermost batch exits, then notify each
+        changed observable once with the union of its changed fields.
+        The batch is global, not per scene: while it's open, notifications from every
+        Observable (other scenes, the editor, SceneManager) are held too. Like the rest of
+        the data model it is main-thread only.
+        """
+        assert threading.current_thread() is threading.main_thread(), "Observable.batch() is main-thread only"
+        cls._batch_depth += 1
+        try:
+            yield
+        finally:
+            cls._batch_depth -= 1
+            if cls._batch_depth == 0:
+                batched, cls._batched = cls._batched, {}
+                for observable, changes in batched.items():
+                    if observable._subscribers:
+                        observable._dispatch(changes)
 
     @classmethod
-    def emit_all(cls):
+    def emit_all(cls, max_callbacks=None):
         """
-        Run all queued callbacks (in the order they were queued) and clear the queue.
+        Run queued callbacks in the order they were first queued. Callbacks queued while
+        emitting run in the same pass, up to max_callbacks (default max_callbacks_per_emit).
+        Returns the number of callbacks run.
         """
-        while cls._callback_queue:
-            callback = cls._callback_queue.pop()
-            callback()
+        budget = cls.max_callbacks_per_emit if max_callbacks is None else max_callbacks
+        queue = cls._callback_queue
+        ran = 0
+        while queue and (budget is None or ran < budget):
+            callback = next(iter(queue))
+            changes, pass_changes = queue.pop(callback)
+            if pass_changes:
+                _run_callback(callback, changes)
+            else:
+                _run_callback(callback)
+            ran += 1
+        return ran
            
 
 
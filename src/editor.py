@@ -47,7 +47,7 @@ class Editor(Observable):
             self._selected_gameobject = None
         else:
             self._selected_gameobject = weakref.ref(gameobject)
-        self.notify()
+        self.notify("selected_gameobject")
 
     def create_gui(self):
         self.gui_app = QApplication(sys.argv)
@@ -1,5 +1,4 @@
-from .managers import Time, StateManager, EditorState, PlayState, SceneManager
-from PyQt6.QtCore import QTimer
+from .managers import Time, StateManager, EditorState, PlayState, SceneManager, Profiler, Tracer
 from .managers.serialization.serializer_manager import Serializer
 from .core import Observable
 from .components import Component_Registry
@@ -24,13 +23,16 @@ class Engine:
         self.editor_state = EditorState(self)
         self.editor = None
 
-    def register_components(self):
+    def register_components(self, headless=False):
         from .components import (
             Transform, RigidBody, BoxCollider, CircleCollider, Test_Component
             )
-        from .gui.components import (
-            TransformWidget, RigidBodyWidget, CircleColliderWidget, BoxColliderWidget, ComponentWidget
-        )
+        if headless:
+            TransformWidget = RigidBodyWidget = CircleColliderWidget = BoxColliderWidget = ComponentWidget = None
+        else:
+            from .gui.components import (
+                TransformWidget, RigidBodyWidget, CircleColliderWidget, BoxColliderWidget, ComponentWidget
+            )
         Component_Registry.register_component("Transform", Transform, TransformWidget)
         Component_Registry.register_component("RigidBody", RigidBody, RigidBodyWidget)
         Component_Registry.register_component("BoxCollider", BoxCollider, BoxColliderWidget)
@@ -44,13 +46,15 @@ class Engine:
         LayerManager.add_layer("Player")
         LayerManager.add_layer("VFX")
         
-    def initialize(self):
-        self.register_components()
+    def initialize(self, scene_path=None, headless=False, background=None):
+        # The editor loads the startup scene in the background while frames keep running; headless runs load it up front
+        self.register_components(headless)
         self.register_layers()
-        self.scene_manager.initialize()
+        self.scene_manager.initialize(scene_path, background=not headless if background is None else background)
 
 
     def start(self):
+        from PyQt6.QtCore import QTimer
         self.timer = QTimer()
         self.timer.timeout.connect(self.update)
         self.timer.start(1000 // 60)
@@ -60,9 +64,18 @@ class Engine:
 
     
     def update(self):
-        Time.update()
-        self.editor.update()
+        Profiler.begin_frame()
+        Tracer.begin_frame()
+        with Profiler.sample("Time.update"):
+            Time.update()
+        self.scene_manager.update()
+        if self.editor:
+            with Profiler.sample("Editor.update"):
+                self.editor.update()
         self.state_manager.update()
-        
-        Observable.emit_all()
+
+        with Profiler.sample("Observable.emit_all"):
+            Observable.emit_all()
+        Tracer.end_frame()
+        Profiler.end_frame()
         
\ No newline at end of file
@@ -80,7 +80,7 @@ class ComponentWidget(QWidget):
         self.layout.setContentsMargins(0,0,0,0)
         self.layout.addWidget(self.header)
         self.visible_field_widgets = set()
-        self.component.subscribe(self.update, self)
+        self.component.subscribe(self.update, self, fields=("enabled",))
         self.construct_fields()
  
     @property
@@ -110,7 +110,7 @@ class FieldWidget(QWidget):
         self.name_label = QLabel(self.name)
         self.name_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.name_label.setFixedWidth(75)
-        self.component.subscribe(self.update_field, owner=self)
+        self.component.subscribe(self.update_field, owner=self, fields=(name,))
         self.layout.setContentsMargins(0,0,0,0)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         
@@ -240,7 +240,7 @@ class RefWidget(FieldWidget):
         scenes = SceneManager._instance.loaded_scenes
         gameobject = None
         for s in scenes:
-            if g := s.id_mappings.get(gameobject_id):
+            if g := s.id_mappings.get(int(gameobject_id)):
                 gameobject = g
                 break
         if gameobject:
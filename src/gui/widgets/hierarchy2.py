@@ -35,7 +35,7 @@ class GameObjectModel(QStandardItemModel):
         if indexes:
             # Assume first selected index, get component ID
             obj_id = indexes[0].data(Qt.ItemDataRole.UserRole)
-            if obj_id:
+            if obj_id is not None:
                 obj = self.scene.find_gameobject_by_id(obj_id)
                 if obj:
                     mimetypes = self.get_mimetype(obj)
@@ -136,6 +136,7 @@ class SceneWidget(QWidget):
         self.addAction(self.delete_action) 
         self.header.addAction(self.add_action)
         self.item_mappings = {}
+        self.item_subscriptions = []
 
     def toggle_tree_visibility(self, event):
             self.tree.setVisible(not self.tree.isVisible())
@@ -179,7 +180,7 @@ class SceneWidget(QWidget):
             print(item)
             go_id = item.data(Qt.ItemDataRole.UserRole)
 
-            if go_id:
+            if go_id is not None:
                 self.item_mappings[go_id] = weakref.ref(item)
             self._rebuild_item_mappings(item)
 
@@ -214,7 +215,8 @@ class SceneWidget(QWidget):
             item.setForeground(QBrush(QColor(120, 120, 120)))  # dark gray
         else:
             item.setForeground(QBrush(QColor(255, 255, 255)))
-        gameobject.subscribe(lambda: self.update_item(gameobject.id))
+        self.item_subscriptions.append(
+            gameobject.subscribe(lambda: self.update_item(gameobject.id), owner=self, fields=("name", "active")))
         for child in gameobject.children:
             child_item = self.build_gameobject_item(child)
             item.appendRow(child_item)
@@ -247,6 +249,9 @@ class SceneWidget(QWidget):
         self.model.clear()
         self.model.setHorizontalHeaderLabels([self.scene.name])
         self.item_mappings.clear()
+        for subscription in self.item_subscriptions:
+            subscription.unsubscribe()
+        self.item_subscriptions.clear()
 
         for obj in self.scene.root_gameobjects:
             item = self.build_gameobject_item(obj)
@@ -358,6 +363,7 @@ class Hierarchy(QWidget):
 
     def start(self):
         self.build_scenes()
+        self.engine.scene_manager.subscribe(self.build_scenes, owner=self, fields=("loaded_scenes",))
     
     def update(self):
         return
@@ -397,6 +403,7 @@ class Hierarchy(QWidget):
 
     def start(self):
         self.build_scenes()
+        self.engine.scene_manager.subscribe(self.build_scenes, owner=self, fields=("loaded_scenes",))
 
     def add_scene(self):
         name, ok = QInputDialog.getText(self, "New Scene", "Enter scene name:")
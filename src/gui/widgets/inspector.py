@@ -73,6 +73,7 @@ class Inspector(QWidget):
         self.layer_combo_box.currentIndexChanged.connect(self.set_layer)
 
         self.component_widgets : set[QWidget] = set()
+        self.subscriptions = []
         self.add_component_btn = QPushButton("Add Component")
         self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.content_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -99,8 +100,10 @@ class Inspector(QWidget):
         index = self.layer_combo_box.findData(self.gameobject.layer)
         self.layer_combo_box.setCurrentIndex(index)
         
-        self.gameobject.subscribe(self.update_fields, owner=self)
-        self.gameobject.subscribe(self.build_components, owner= self)
+        self.subscriptions.append(
+            self.gameobject.subscribe(self.update_fields, owner=self, fields=("name", "active", "tag", "layer")))
+        self.subscriptions.append(
+            self.gameobject.subscribe(self.build_components, owner= self, fields=("components",)))
         self.build_components()
         self.content_widget.show()
         self.name_field.blockSignals(False)
@@ -109,6 +112,9 @@ class Inspector(QWidget):
         self.layer_combo_box.blockSignals(False)
 
     def reset(self):
+        for subscription in self.subscriptions:
+            subscription.unsubscribe()
+        self.subscriptions.clear()
         self.name_field.setText("")
         self.active_checkbox.setChecked(False)
         self.content_widget.hide()
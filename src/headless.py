@@ -0,0 +1,119 @@
+import argparse
+import time
+from .engine import Engine
+from .managers import Time, Profiler, Tracer, Scene
+from .core.gameobject import GameObject
+
+
+class HeadlessRunner:
+    """
+    Drives the engine without a QApplication, Editor or GL context.
+    - realtime=False → frames run back to back, each advancing Time by fixed_dt.
+    - realtime=True → frames are paced to the wall clock at 1 / fixed_dt per second.
+    """
+
+    def __init__(self, engine: Engine = None, fixed_dt: float = None, realtime: bool = False):
+        self.engine = engine or Engine()
+        self.fixed_dt = fixed_dt or Time.fixedDeltaTime
+        self.realtime = realtime
+        self.frame_count = 0
+        self.elapsed = 0.0
+
+    def initialize(self, scene_path=None):
+        self.engine.initialize(scene_path, headless=True)
+
+    def start(self, state="play"):
+        Time.start()
+        self.engine.state_manager.set_state(
+            self.engine.play_state if state == "play" else self.engine.editor_state
+        )
+        self.engine.scene_manager.start()
+
+    def step(self):
+        self.engine.update()
+        self.frame_count += 1
+
+    def run(self, frames: int = None, duration: float = None):
+        """
+        Run until `frames` frames have been simulated, `duration` seconds of
+        game time have passed, or engine.running is cleared.
+        Returns the number of frames run.
+        """
+        previous_capture = Time.captureDeltaTime
+        Time.captureDeltaTime = 0.0 if self.realtime else self.fixed_dt
+        start_frame = self.frame_count
+        wall_start = time.perf_counter()
+        next_frame = wall_start
+        try:
+            while self.engine.running:
+                if frames is not None and self.frame_count - start_frame >= frames:
+                    break
+                if duration is not None and Time.time >= duration:
+                    break
+                self.step()
+
+                if self.realtime:
+                    next_frame += self.fixed_dt
+                    delay = next_frame - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Fell behind, resync instead of trying to catch up
+                        next_frame = time.perf_counter()
+        finally:
+            Time.captureDeltaTime = previous_capture
+            self.elapsed += time.perf_counter() - wall_start
+        return self.frame_count - start_frame
+
+    def stop(self):
+        self.engine.running = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a scene without the editor.")
+    parser.add_argument("scene", nargs="?", default=None, help="Scene file (.yaml or .json)")
+    parser.add_argument("--frames", type=int, default=None, help="Number of frames to simulate")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds of game time to simulate")
+    parser.add_argument("--dt", type=float, default=Time.fixedDeltaTime, help="Fixed timestep in seconds")
+    parser.add_argument("--realtime", action="store_true", help="Pace frames to the wall clock")
+    parser.add_argument("--state", choices=["play", "editor"], default="play")
+    parser.add_argument("--array-transforms", action="store_true",
+                        help="Keep Transform data in per-scene NumPy arrays")
+    parser.add_argument("--lazy-components", action="store_true",
+                        help="Build the components of inactive GameObjects only once they are needed")
+    parser.add_argument("--profile", metavar="PATH", default=None, help="Dump per-phase frame stats to PATH")
+    parser.add_argument("--trace", metavar="PATH", default=None, help="Dump a Chrome trace of the last frames to PATH")
+    parser.add_argument("--trace-frames", type=int, default=300, help="Frames kept in the trace ring buffer")
+    parser.add_argument("--trace-trigger", metavar="MS", type=float, default=None,
+                        help="Dump the trace buffer whenever a frame takes longer than MS")
+    args = parser.parse_args(argv)
+
+    if args.frames is None and args.duration is None and not args.realtime:
+        parser.error("--frames or --duration is required unless --realtime is set")
+
+    if args.array_transforms:
+        Scene.array_transforms = True
+    if args.lazy_components:
+        GameObject.lazy_components = True
+    if args.profile:
+        Profiler.enable()
+    if args.trace or args.trace_trigger is not None:
+        Tracer.enable(capacity=args.trace_frames, trigger_ms=args.trace_trigger)
+
+    runner = HeadlessRunner(fixed_dt=args.dt, realtime=args.realtime)
+    runner.initialize(args.scene)
+    runner.start(args.state)
+    try:
+        frames = runner.run(frames=args.frames, duration=args.duration)
+    except KeyboardInterrupt:
+        frames = runner.frame_count
+    fps = frames / runner.elapsed if runner.elapsed > 0 else 0.0
+    print(f"Simulated {frames} frames ({Time.time:.3f}s game time) in {runner.elapsed:.3f}s ({fps:.0f} fps)")
+    if args.profile:
+        Profiler.dump(args.profile)
+    if args.trace:
+        Tracer.dump(args.trace)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 
 
 from .time.time_manager import Time
+from .profiler import Profiler, Tracer
+from .physics import PhysicsWorld
 from .states import PlayState, EditorState
 from .states.state_manager import StateManager
 from .scenes import Scene, SceneManager
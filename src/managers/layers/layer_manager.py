@@ -1,8 +1,9 @@
 from .layers import Layer
-from ...managers.serialization import Serializable, SerializeField
+from ...managers.serialization import Serializable, SerializeField, Schema
 
 class LayerManager(Serializable):
     _instance = None  # Singleton instance
+    _layers = {}  # Backing store for the class-level layers field
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -34,8 +35,8 @@ class LayerManager(Serializable):
     def _get_layer(self, name: str):
         return self.layers.get(name, self.default)
     
-    def _subscribe(self, callback, owner = None, immediate = False):
-        return super().subscribe(callback, owner, immediate)
+    def _subscribe(self, callback, owner = None, immediate = False, fields = None, pass_changes = False):
+        return super().subscribe(callback, owner, immediate, fields, pass_changes)
 
     # Classmethod wrappers
     @classmethod
@@ -51,11 +52,14 @@ class LayerManager(Serializable):
         return cls._instance._get_layer(name)
     
     @classmethod
-    def subscribe(cls, callback, owner = None, immediate = False):
-        cls._instance._subscribe(callback, owner =owner, immediate=immediate )
+    def subscribe(cls, callback, owner = None, immediate = False, fields = None, pass_changes = False):
+        return cls._instance._subscribe(callback, owner =owner, immediate=immediate, fields=fields, pass_changes=pass_changes)
 
 
 # Create singleton instance and default layer
 _layer_manager = LayerManager()
 LayerManager._instance = _layer_manager
+
+# Fields typed Layer are saved by name and resolved against the registered layers on load
+Schema.register_codec(Layer, lambda layer: layer.name, LayerManager.get_layer)
 LayerManager._instance.default = LayerManager.add_layer("Default")
@@ -1,6 +1,6 @@
 from ...managers.serialization import Serializable, SerializeField
 
-class Layer(Serializable):
+class Layer(Serializable, slots=True):
     count = 0
 
     @SerializeField(default= 0, type_hint= int)
@@ -0,0 +1 @@
+from .physics_world import PhysicsWorld
@@ -0,0 +1,202 @@
+import numpy as np
+import pymunk
+
+try:
+    import pymunk.batch as pymunk_batch
+except ImportError:  # pymunk < 6.6
+    pymunk_batch = None
+
+
+class BodySync:
+    """
+    Batched sync between a PhysicsWorld's bodies and their Transforms.
+    - push_kinematic() copies Transform → body for kinematic bodies before a step: target and
+      current poses are compared as arrays (the targets straight from the TransformStore when
+      it holds them all) and only bodies that are off get set. The set itself stays per body:
+      pymunk.batch.set_space_bodies writes every body in the space and wakes sleeping ones.
+    - pull_dynamic() reads every body pose into NumPy arrays in one go and writes
+      back only the transforms whose pose changed (sleeping and resting bodies are skipped).
+      When the scene keeps transforms in a TransformStore the write-back is a single array assignment.
+    Static bodies are never synced. Call mark_dirty() when bodies are added,
+    removed or change body_type.
+    """
+
+    EPSILON = 1e-9
+
+    def __init__(self, world):
+        self.world = world
+        self._dirty = True
+        self._transforms = []   # row -> Transform of a dynamic body
+        self._bodies = []       # row -> pymunk.Body
+        self._kinematic = []    # row -> pymunk.Body of a kinematic body
+        self._kinematic_transforms = []  # row -> its Transform
+        self._store = None      # scene TransformStore when every synced transform is bound to it
+        self._store_rows = np.zeros(0, dtype=np.intp)
+        self._sorted_ids = np.zeros(0, dtype=np.uintp)
+        self._sorted_rows = np.zeros(0, dtype=np.intp)
+        self._kinematic_store = None  # same, for the kinematic transforms
+        self._kinematic_store_rows = np.zeros(0, dtype=np.intp)
+        self._kinematic_sorted_ids = np.zeros(0, dtype=np.uintp)
+        self._kinematic_sorted_rows = np.zeros(0, dtype=np.intp)
+        self.positions = np.zeros((0, 2))
+        self.angles = np.zeros(0)
+        self._buffer = pymunk_batch.Buffer() if pymunk_batch else None
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def rebuild(self):
+        self._transforms.clear()
+        self._bodies.clear()
+        self._kinematic.clear()
+        self._kinematic_transforms.clear()
+        for rigidbody, body in self.world.rigidbodies.items():
+            transform = rigidbody.gameobject.transform if rigidbody.gameobject else None
+            if transform is None:
+                continue
+            if body.body_type == pymunk.Body.DYNAMIC:
+                self._transforms.append(transform)
+                self._bodies.append(body)
+            elif body.body_type == pymunk.Body.KINEMATIC:
+                self._kinematic.append(body)
+                self._kinematic_transforms.append(transform)
+
+        self._sorted_ids, self._sorted_rows = self._sort_ids(self._bodies)
+        self._kinematic_sorted_ids, self._kinematic_sorted_rows = self._sort_ids(self._kinematic)
+        count = len(self._bodies)
+        self.positions = np.fromiter(
+            (c for body in self._bodies for c in body.position), dtype=np.float64, count=count * 2
+        ).reshape(count, 2)
+        self.angles = np.fromiter((body.angle for body in self._bodies), dtype=np.float64, count=count)
+
+        store = getattr(self.world.scene, "transforms", None)
+        self._store, self._store_rows = self._store_of(store, self._transforms)
+        self._kinematic_store, self._kinematic_store_rows = self._store_of(store, self._kinematic_transforms)
+        self._dirty = False
+
+    @staticmethod
+    def _sort_ids(bodies):
+        """(sorted body ids, row of each) for mapping pymunk.batch output back to rows."""
+        ids = np.fromiter((body.id for body in bodies), dtype=np.uintp, count=len(bodies))
+        order = np.argsort(ids, kind="stable")
+        return ids[order], order
+
+    @staticmethod
+    def _store_of(store, transforms):
+        """(store, row of each transform) when every transform is bound to `store`, else (None, empty)."""
+        if store is None or not all(transform._store is store for transform in transforms):
+            return None, np.zeros(0, dtype=np.intp)
+        return store, np.fromiter((transform._index for transform in transforms), dtype=np.intp, count=len(transforms))
+
+    @staticmethod
+    def _poses(transforms):
+        """Local (positions, angles) arrays of `transforms`, read from their fields or store rows (no vector per read)."""
+        count = len(transforms)
+        if all(transform._store is None for transform in transforms):
+            positions = np.fromiter(
+                (c for transform in transforms for c in transform._position), dtype=np.float64, count=count * 2
+            ).reshape(count, 2)
+            return positions, np.fromiter((transform._angle for transform in transforms), dtype=np.float64, count=count)
+        positions = np.empty((count, 2))
+        angles = np.empty(count)
+        for row, transform in enumerate(transforms):
+            store = transform._store
+            if store is None:
+                positions[row] = transform._position
+                angles[row] = transform._angle
+            else:
+                positions[row] = store.positions[transform._index]
+                angles[row] = store.angles[transform._index]
+        return positions, angles
+
+    def push_kinematic(self):
+        if self._dirty:
+            self.rebuild()
+        bodies = self._kinematic
+        if not bodies:
+            return
+        count = len(bodies)
+        if self._kinematic_store is not None:
+            rows = self._kinematic_store_rows
+            targets, target_angles = self._kinematic_store.positions[rows], self._kinematic_store.angles[rows]
+        else:
+            targets, target_angles = self._poses(self._kinematic_transforms)
+
+        # Bodies missing from the gather stay NaN, so they count as off
+        positions, angles = self._gather(bodies, self._kinematic_sorted_ids, self._kinematic_sorted_rows,
+                                         np.full((count, 2), np.nan), np.full(count, np.nan))
+        changed = np.flatnonzero(
+            ~(np.abs(targets - positions) <= self.EPSILON).all(axis=1)
+            | ~(np.abs(target_angles - angles) <= self.EPSILON)
+        )
+        xs = targets[changed, 0].tolist()
+        ys = targets[changed, 1].tolist()
+        rotations = target_angles[changed].tolist()
+        for row, x, y, angle in zip(changed.tolist(), xs, ys, rotations):
+            body = bodies[row]
+            body.position = (x, y)
+            body.angle = angle
+
+    def pull_dynamic(self):
+        if self._dirty:
+            self.rebuild()
+        if not self._bodies:
+            return
+        positions, angles = self._gather(self._bodies, self._sorted_ids, self._sorted_rows, self.positions, self.angles)
+        changed = np.flatnonzero(
+            (np.abs(positions - self.positions) > self.EPSILON).any(axis=1)
+            | (np.abs(angles - self.angles) > self.EPSILON)
+        )
+        self.positions = positions
+        self.angles = angles
+        if not len(changed):
+            return
+
+        if self._store is not None:
+            rows = self._store_rows[changed]
+            self._store.positions[rows] = positions[changed]
+            self._store.angles[rows] = angles[changed]
+            self._store.notify(rows, ("position", "angle"))
+            return
+
+        transforms = self._transforms
+        xs = positions[changed, 0].tolist()
+        ys = positions[changed, 1].tolist()
+        rotations = angles[changed].tolist()
+        for row, x, y, angle in zip(changed.tolist(), xs, ys, rotations):
+            transforms[row].set_pose(x, y, angle)
+
+    def _gather(self, bodies, sorted_ids, sorted_rows, positions, angles):
+        """
+        Current poses of `bodies` as (positions, angles) arrays; rows of bodies not in the space
+        keep their value from the given `positions` / `angles`.
+        """
+        count = len(bodies)
+        if self._buffer is None:
+            positions = np.fromiter(
+                (c for body in bodies for c in body.position), dtype=np.float64, count=count * 2
+            ).reshape(count, 2)
+            angles = np.fromiter((body.angle for body in bodies), dtype=np.float64, count=count)
+            return positions, angles
+
+        # One C call for every body in the space, then map body ids back to our rows
+        buffer = self._buffer
+        buffer.clear()
+        pymunk_batch.get_space_bodies(
+            self.world.space,
+            pymunk_batch.BodyFields.BODY_ID | pymunk_batch.BodyFields.POSITION | pymunk_batch.BodyFields.ANGLE,
+            buffer,
+        )
+        ids = np.frombuffer(buffer.int_buf(), dtype=np.uintp)
+        data = np.frombuffer(buffer.float_buf(), dtype=np.float64).reshape(-1, 3)
+
+        slots = np.searchsorted(sorted_ids, ids)
+        slots[slots >= len(sorted_ids)] = 0
+        known = sorted_ids[slots] == ids
+        rows = sorted_rows[slots[known]]
+
+        positions = positions.copy()
+        angles = angles.copy()
+        positions[rows] = data[known, :2]
+        angles[rows] = data[known, 2]
+        return positions, angles
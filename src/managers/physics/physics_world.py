@@ -0,0 +1,134 @@
+import pymunk
+from .body_sync import BodySync
+
+
+class PhysicsWorld:
+    """
+    Owns the pymunk.Space of one Scene.
+    RigidBody bodies and Collider shapes are registered as their components are
+    added to, or removed from, gameobjects that live in the scene.
+    Colliders without a RigidBody get a static body placed at their Transform.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.space = pymunk.Space()
+        self.rigidbodies = {}   # RigidBody -> pymunk.Body
+        self.colliders = {}     # Collider -> pymunk.Shape
+        self.static_bodies = {} # Collider -> pymunk.Body owned by that collider
+        self.sync = BodySync(self)
+
+    @staticmethod
+    def of(component):
+        """The world a component belongs to, or None if its gameobject is not in a scene."""
+        gameobject = component.gameobject
+        scene = gameobject.scene if gameobject else None
+        return getattr(scene, "physics", None)
+
+    @property
+    def gravity(self):
+        return self.space.gravity
+
+    @gravity.setter
+    def gravity(self, value):
+        self.space.gravity = value
+
+    def add_gameobject(self, gameobject):
+        from ...components import RigidBody, Collider
+        # _components: lazily loaded components not built yet have no body or shape to add
+        for comp in list(gameobject._components.values()):
+            if isinstance(comp, RigidBody):
+                self.add_rigidbody(comp)
+        for comp in list(gameobject._components.values()):
+            if isinstance(comp, Collider):
+                self.add_collider(comp)
+
+    def remove_gameobject(self, gameobject):
+        from ...components import RigidBody, Collider
+        for comp in list(gameobject._components.values()):
+            if isinstance(comp, Collider):
+                self.remove_collider(comp)
+        for comp in list(gameobject._components.values()):
+            if isinstance(comp, RigidBody):
+                self.remove_rigidbody(comp)
+
+    def add_rigidbody(self, rigidbody):
+        if rigidbody in self.rigidbodies or rigidbody.body is None or not rigidbody.enabled:
+            return
+        body = rigidbody.body
+        transform = rigidbody.gameobject.transform
+        if transform:
+            body.position = pymunk.Vec2d(*transform.position)
+            body.angle = transform.angle
+        self.space.add(body)
+        self.rigidbodies[rigidbody] = body
+        self.sync.mark_dirty()
+        self._reattach_colliders(rigidbody.gameobject)
+
+    def remove_rigidbody(self, rigidbody):
+        body = self.rigidbodies.pop(rigidbody, None)
+        if body is None:
+            return
+        gameobject = rigidbody.gameobject
+        for collider, shape in list(self.colliders.items()):
+            if shape.body is body:
+                self.remove_collider(collider)
+        self.space.remove(body)
+        self.sync.mark_dirty()
+        if gameobject and not getattr(gameobject, "_destroyed", False):
+            self._reattach_colliders(gameobject, exclude=rigidbody)
+
+    def add_collider(self, collider, body=None):
+        if collider in self.colliders:
+            return
+        if body is None:
+            body = self._body_for(collider.gameobject)
+        if body is None:
+            body = pymunk.Body(body_type=pymunk.Body.STATIC)
+            transform = collider.gameobject.transform
+            if transform:
+                body.position = pymunk.Vec2d(*transform.position)
+                body.angle = transform.angle
+            self.space.add(body)
+            self.static_bodies[collider] = body
+        shape = collider.create_shape(body)
+        shape.friction = collider.friction
+        shape.elasticity = collider.elasticity
+        shape.sensor = collider.sensor
+        self.space.add(shape)
+        self.colliders[collider] = shape
+
+    def remove_collider(self, collider):
+        shape = self.colliders.pop(collider, None)
+        if shape is not None:
+            self.space.remove(shape)
+        body = self.static_bodies.pop(collider, None)
+        if body is not None:
+            self.space.remove(body)
+
+    def _body_for(self, gameobject, exclude=None):
+        from ...components import RigidBody
+        rigidbody = gameobject.get_component(RigidBody)
+        if rigidbody is not None and rigidbody is not exclude and rigidbody in self.rigidbodies:
+            return rigidbody.body
+        return None
+
+    def _reattach_colliders(self, gameobject, exclude=None):
+        """Rebuild a gameobject's shapes against its current body."""
+        from ...components import Collider
+        body = self._body_for(gameobject, exclude)
+        for comp in list(gameobject._components.values()):
+            if isinstance(comp, Collider):
+                self.remove_collider(comp)
+                self.add_collider(comp, body)
+
+    def step(self, dt):
+        self.sync.push_kinematic()
+        self.space.step(dt)
+        self.sync.pull_dynamic()
+
+    def clear(self):
+        for collider in list(self.colliders):
+            self.remove_collider(collider)
+        for rigidbody in list(self.rigidbodies):
+            self.remove_rigidbody(rigidbody)
@@ -0,0 +1,2 @@
+from .profiler_manager import Profiler
+from .tracer import Tracer
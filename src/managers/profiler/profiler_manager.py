@@ -0,0 +1,138 @@
+import json
+import math
+import time
+from collections import deque
+from .tracer import Tracer
+
+
+class _Sample:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        Profiler._record(self.name, elapsed)
+        Tracer.record(self.name, self.start, elapsed)
+        return False
+
+
+class Profiler:
+    """
+    Per-phase frame profiler.
+    - begin_frame()/end_frame() bracket one Engine.update.
+    - sample(name) times a phase inside the current frame (nested samples are fine).
+    - The last `window_size` frames are kept for stats().
+    """
+
+    enabled = False
+    window_size = 300
+
+    _frames = deque(maxlen=300)
+    _current = None
+    _frame_start = 0.0
+
+    @classmethod
+    def enable(cls, window_size=None):
+        if window_size is not None and window_size != cls.window_size:
+            cls.window_size = window_size
+            cls._frames = deque(cls._frames, maxlen=window_size)
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls):
+        cls.enabled = False
+        cls._current = None
+
+    @classmethod
+    def reset(cls):
+        cls._frames.clear()
+        cls._current = None
+
+    @classmethod
+    def begin_frame(cls):
+        if not cls.enabled:
+            return
+        cls._current = {}
+        cls._frame_start = time.perf_counter()
+
+    @classmethod
+    def end_frame(cls):
+        if cls._current is None:
+            return
+        cls._record("Frame", time.perf_counter() - cls._frame_start)
+        cls._frames.append(cls._current)
+        cls._current = None
+
+    @classmethod
+    def sample(cls, name):
+        """Context manager timing `name`; also shows up as a Tracer span when tracing is on."""
+        if cls._current is None:
+            return Tracer.span(name)
+        return _Sample(name)
+
+    @classmethod
+    def _record(cls, name, elapsed):
+        current = cls._current
+        if current is None:
+            return
+        entry = current.get(name)
+        if entry is None:
+            current[name] = [elapsed, 1]
+        else:
+            entry[0] += elapsed
+            entry[1] += 1
+
+    @classmethod
+    def last_frame(cls):
+        """Phase → (seconds, calls) for the most recent finished frame."""
+        if not cls._frames:
+            return {}
+        return {name: tuple(entry) for name, entry in cls._frames[-1].items()}
+
+    @staticmethod
+    def _percentile(ordered, p):
+        index = max(0, math.ceil(p * len(ordered)) - 1)
+        return ordered[index]
+
+    @classmethod
+    def stats(cls):
+        """
+        Phase → rolling-window statistics in milliseconds:
+        {"frames", "calls", "min", "avg", "p95", "p99", "max"}
+        where "calls" is the average number of calls per frame.
+        """
+        timings = {}
+        calls = {}
+        for frame in cls._frames:
+            for name, (elapsed, count) in frame.items():
+                timings.setdefault(name, []).append(elapsed * 1000.0)
+                calls[name] = calls.get(name, 0) + count
+
+        result = {}
+        for name, values in timings.items():
+            ordered = sorted(values)
+            result[name] = {
+                "frames": len(ordered),
+                "calls": calls[name] / len(ordered),
+                "min": ordered[0],
+                "avg": sum(ordered) / len(ordered),
+                "p95": cls._percentile(ordered, 0.95),
+                "p99": cls._percentile(ordered, 0.99),
+                "max": ordered[-1],
+            }
+        return result
+
+    @classmethod
+    def dump(cls, path):
+        with open(path, 'w') as f:
+            json.dump({
+                "window_size": cls.window_size,
+                "frames": len(cls._frames),
+                "phases": cls.stats(),
+            }, f, indent=2)
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        Tracer.record(self.name, self.start, time.perf_counter() - self.start, self.args)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class Tracer:
+    """
+    Opt-in frame timeline tracer producing Chrome Trace Event JSON (open in Perfetto or chrome://tracing).
+    - Spans are kept per frame in a ring buffer of the last `capacity` frames.
+    - If trigger_ms is set, a frame longer than that dumps the buffer to trigger_path
+      ("{frame}" is replaced by the frame number) and starts a fresh buffer.
+    """
+
+    enabled = False
+    capacity = 300
+    trigger_ms = None
+    trigger_path = "trace_{frame}.json"
+    on_trigger = None
+
+    _frames = deque(maxlen=300)
+    _events = []
+    _frame_index = 0
+    _frame_start = None
+    _origin = time.perf_counter()
+    _null_span = _NullSpan()
+    _lock = threading.Lock()
+
+    @classmethod
+    def enable(cls, capacity=None, trigger_ms=None, trigger_path=None, on_trigger=None):
+        if capacity is not None and capacity != cls.capacity:
+            cls.capacity = capacity
+            cls._frames = deque(cls._frames, maxlen=capacity)
+        cls.trigger_ms = trigger_ms
+        if trigger_path is not None:
+            cls.trigger_path = trigger_path
+        cls.on_trigger = on_trigger
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls):
+        cls.enabled = False
+        cls._frame_start = None
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._frames.clear()
+            cls._events = []
+
+    @classmethod
+    def span(cls, name, args=None):
+        """Context manager recording `name` as a complete event; free when tracing is off."""
+        if not cls.enabled:
+            return cls._null_span
+        return _Span(name, args)
+
+    @classmethod
+    def record(cls, name, start, duration, args=None):
+        if not cls.enabled:
+            return
+        event = (name, start, duration, threading.get_ident(), args)
+        with cls._lock:
+            cls._events.append(event)
+
+    @classmethod
+    def begin_frame(cls):
+        if not cls.enabled:
+            return
+        cls._frame_start = time.perf_counter()
+
+    @classmethod
+    def end_frame(cls):
+        if cls._frame_start is None:
+            return
+        start = cls._frame_start
+        duration = time.perf_counter() - start
+        cls._frame_start = None
+        cls._frame_index += 1
+        cls.record("Engine.update", start, duration, {"frame": cls._frame_index})
+        with cls._lock:
+            cls._frames.append(cls._events)
+            cls._events = []
+
+        if cls.trigger_ms is not None and duration * 1000.0 > cls.trigger_ms:
+            path = cls.trigger_path.format(frame=cls._frame_index)
+            cls.dump(path)
+            cls.reset()
+            if cls.on_trigger:
+                cls.on_trigger(path, cls._frame_index, duration)
+
+    @classmethod
+    def events(cls):
+        """Buffered spans as Chrome Trace Event dicts (timestamps in microseconds)."""
+        pid = os.getpid()
+        with cls._lock:
+            frames = list(cls._frames) + [cls._events]
+        trace_events = []
+        for frame in frames:
+            for name, start, duration, tid, args in frame:
+                event = {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - cls._origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                }
+                if args:
+                    event["args"] = args
+                trace_events.append(event)
+        return trace_events
+
+    @classmethod
+    def dump(cls, path):
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": cls.events(), "displayTimeUnit": "ms"}, f)
@@ -1,2 +1,8 @@
 from .scene import Scene
+from .transform_store import TransformStore
+from .component_scheduler import ComponentScheduler
+from .scene_index import SceneIndex
+from .scene_loader import SceneLoader
+from .change_tracker import ChangeTracker
+from .scene_autosave import SceneAutosave
 from .scene_manager import SceneManager
@@ -0,0 +1,96 @@
+class ChangeTracker:
+    """
+    Per-GameObject dirty tracking for one scene, fed by the existing notify() calls:
+    each GameObject and each of its components gets an immediate subscription that
+    marks the GameObject dirty.
+    - dirty → GameObjects changed since the last take(), in first-changed order
+    - removed → UUIDs of GameObjects destroyed since the last take()
+    - scene_changed → a scene field or the hierarchy (and so possibly the root order) changed
+    Reparenting marks the old and the new parent dirty too, since their children changed.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.dirty = {}
+        self.removed = set()
+        self.scene_changed = False
+        self._subscriptions = {}  # GameObject -> [Subscription]
+        self._parents = {}  # GameObject -> parent as last seen
+        for gameobject in scene.id_mappings.values():
+            self.track(gameobject, dirty=False)
+        self._scene_subscription = scene.subscribe(
+            self._on_scene_changed, immediate=True, fields=("root_gameobjects", "name"))
+        scene.tracker = self
+
+    def track(self, gameobject, dirty=True):
+        if gameobject in self._subscriptions:
+            return
+        self._subscriptions[gameobject] = [gameobject.subscribe(
+            lambda changes, gameobject=gameobject: self._on_gameobject_changed(gameobject, changes),
+            immediate=True, pass_changes=True)]
+        self._track_components(gameobject)
+        self._parents[gameobject] = gameobject.parent
+        if dirty:
+            self.mark(gameobject)
+            self._mark_parent(gameobject)
+            self.scene_changed = True
+
+    def untrack(self, gameobject):
+        for subscription in self._subscriptions.pop(gameobject, ()):
+            subscription.unsubscribe()
+        self.dirty.pop(gameobject, None)
+        self.removed.add(gameobject.uuid)
+        self.scene_changed = True
+        parent = self._parents.pop(gameobject, None)
+        if parent is not None and parent in self._subscriptions:
+            self.mark(parent)
+
+    def mark(self, gameobject):
+        self.dirty[gameobject] = None
+
+    def take(self):
+        """Return (dirty GameObjects, removed ids, scene_changed) and start over."""
+        changes = list(self.dirty), self.removed, self.scene_changed
+        self.dirty = {}
+        self.removed = set()
+        self.scene_changed = False
+        return changes
+
+    def close(self):
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.unsubscribe()
+        self._subscriptions.clear()
+        self._parents.clear()
+        self._scene_subscription.unsubscribe()
+        if self.scene.tracker is self:
+            self.scene.tracker = None
+
+    def _track_components(self, gameobject):
+        subscriptions = self._subscriptions[gameobject]
+        for subscription in subscriptions[1:]:
+            subscription.unsubscribe()
+        del subscriptions[1:]
+        for component in gameobject._components.values():
+            subscriptions.append(component.subscribe(
+                lambda gameobject=gameobject: self.mark(gameobject), immediate=True))
+
+    def _mark_parent(self, gameobject):
+        parent = gameobject.parent
+        if parent is not None and parent in self._subscriptions:
+            self.mark(parent)
+
+    def _on_gameobject_changed(self, gameobject, changes):
+        self.mark(gameobject)
+        if changes is None or "components" in changes:
+            self._track_components(gameobject)
+        if changes is None or "parent" in changes:
+            old = self._parents.get(gameobject)
+            if old is not None and old in self._subscriptions:
+                self.mark(old)
+            self._mark_parent(gameobject)
+            self._parents[gameobject] = gameobject.parent
+            self.scene_changed = True
+
+    def _on_scene_changed(self):
+        self.scene_changed = True
@@ -0,0 +1,80 @@
+class ComponentScheduler:
+    """
+    Per-scene dispatch lists for the Component lifecycle hooks.
+    Only components whose class overrides a hook are listed for it, and only while
+    the component is enabled and its gameobject is active in the hierarchy, so
+    run(hook) costs O(components that do work) instead of O(objects in the scene).
+    """
+
+    HOOKS = ("fixed_update", "update", "late_update")
+
+    # Component class -> hooks it overrides
+    _overrides = {}
+
+    def __init__(self):
+        self._entries = {hook: {} for hook in self.HOOKS}   # hook -> {component: bound method}
+        self._cache = {hook: () for hook in self.HOOKS}     # hook -> ((component, method), ...) or None
+
+    @classmethod
+    def hooks_of(cls, component_type):
+        hooks = cls._overrides.get(component_type)
+        if hooks is None:
+            from ...components import Component
+            hooks = tuple(
+                hook for hook in cls.HOOKS
+                if getattr(component_type, hook) is not getattr(Component, hook)
+            )
+            cls._overrides[component_type] = hooks
+        return hooks
+
+    @staticmethod
+    def is_runnable(component):
+        gameobject = component.gameobject
+        return (
+            gameobject is not None
+            and not gameobject._destroyed
+            and component.enabled
+            and gameobject.active_in_hierarchy
+        )
+
+    def add(self, component):
+        """Add or drop `component` from the dispatch lists depending on whether it can run."""
+        hooks = self.hooks_of(type(component))
+        if not hooks:
+            return
+        if not self.is_runnable(component):
+            self.remove(component)
+            return
+        for hook in hooks:
+            entries = self._entries[hook]
+            if component not in entries:
+                entries[component] = getattr(component, hook)
+                self._cache[hook] = None
+
+    refresh = add
+
+    def remove(self, component):
+        for hook in self.hooks_of(type(component)):
+            if self._entries[hook].pop(component, None) is not None:
+                self._cache[hook] = None
+
+    def add_gameobject(self, gameobject):
+        for component in list(gameobject._components.values()):
+            self.add(component)
+
+    def remove_gameobject(self, gameobject):
+        for component in list(gameobject._components.values()):
+            self.remove(component)
+
+    def count(self, hook):
+        return len(self._entries[hook])
+
+    def run(self, hook):
+        entries = self._entries[hook]
+        pairs = self._cache[hook]
+        if pairs is None:
+            pairs = self._cache[hook] = tuple(entries.items())
+        for component, method in pairs:
+            # Skip anything removed by an earlier callback in this same run
+            if component in entries:
+                method()
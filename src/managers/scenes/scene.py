@@ -1,14 +1,23 @@
 from __future__ import annotations
+from contextlib import contextmanager
+from ...core import Observable
 from ..serialization.serializable import Serializable
-from ..serialization.util import SerializeField
+from ..serialization.util import SerializeField, gc_paused
+from ..profiler import Tracer
+from ..physics import PhysicsWorld
+from .transform_store import TransformStore
+from .component_scheduler import ComponentScheduler
+from .scene_index import SceneIndex
 
 class Scene(Serializable):
     _instance_count = 0
+    # Default for Scene(array_transforms=...): keep Transform data in a TransformStore
+    array_transforms = False
     
     @SerializeField(default= lambda : f"Untitled {Scene._instance_count} ", type_hint= str)
     def name(self) -> str | None: pass
 
-    @SerializeField(default=[], type_hint= list)
+    @SerializeField(default=lambda : [], type_hint= list, transient= True)
     def root_gameobjects(self) -> list['GameObject'] | None : pass
 
     def __init__(self, **kwargs):
@@ -16,17 +25,91 @@ class Scene(Serializable):
         from ...components import Transform
         super().__init__(**kwargs)
         self.removed_gameobjects = set()
-        self.id_mappings : dict[str, GameObject] = {}
+        self.id_mappings : dict[int, GameObject] = {}  # GameObject.id (entity handle) -> GameObject
         self.path = "assets/scenes"
         self.engine = None
+        self.physics = PhysicsWorld(self)
+        self.scheduler = ComponentScheduler()
+        self.index = SceneIndex()
+        self._batching = 0
+        self._restructure_pending = False
+        self.tracker = None  # ChangeTracker while something (e.g. SceneAutosave) follows edits
+        self.transforms = TransformStore() if kwargs.get("array_transforms", Scene.array_transforms) else None
         Scene._instance_count += 1
 
     def find_gameobject_by_id(self, id):
         return self.id_mappings[id]    
 
+    def find_gameobject_by_uuid(self, uuid):
+        """The GameObject of this scene saved / loaded with this persistent UUID, or None."""
+        from ...core.entities import Entities
+        id_mappings = self.id_mappings
+        return next((id_mappings[handle] for handle in Entities.handles(uuid) if handle in id_mappings), None)
+
+    def find(self, name):
+        """First GameObject named `name`, or None."""
+        return self.index.first_with_field("name", name)
+
+    def find_all(self, name):
+        return self.index.with_field("name", name)
+
+    def find_with_tag(self, tag):
+        """First GameObject tagged `tag`, or None."""
+        return self.index.first_with_field("tag", tag)
+
+    def find_all_with_tag(self, tag):
+        return self.index.with_field("tag", tag)
+
+    def find_all_in_layer(self, layer):
+        """layer → a Layer or a layer name."""
+        from ..layers.layer_manager import LayerManager
+        if isinstance(layer, str):
+            layer = LayerManager.get_layer(layer)
+        return self.index.with_field("layer", layer)
+
+    def find_all_with(self, *component_types):
+        """
+        GameObjects that have a component of each type; types may be classes or registered names.
+            scene.find_all_with(RigidBody, BoxCollider)
+        A base class matches its subclasses (Collider → BoxCollider, CircleCollider).
+        """
+        types = self._component_types(component_types)
+        if None in types:
+            return []
+        return self.index.with_components(types)
+
+    def query(self, *component_types, changed=(), since=0):
+        """
+        [(gameobject, component, ...)] for GameObjects that have a component of each type, in
+        argument order; served from the archetype tables, the matching archetypes are cached.
+        changed (a type or types among component_types) + since (a change_tick()) → only rows
+        where one of those components was set after `since`, read from per-column change logs so
+        the cost follows the number of changes, not of rows; e.g. once per frame:
+            since, self.last = self.last, change_tick()
+            for go, transform, body in scene.query(Transform, RigidBody, changed=Transform, since=since):
+        """
+        types = self._component_types(component_types)
+        if None in types:
+            return []
+        changed = self._component_types((changed,) if isinstance(changed, (type, str)) else changed)
+        return self.index.query(types, changed, since)
+
+    @staticmethod
+    def _component_types(component_types):
+        """Classes, or registered names (None if unknown) → tuple of classes."""
+        from ...components import Component_Registry
+        return tuple(Component_Registry.find(t) if isinstance(t, str) else t for t in component_types)
+
     def register_object_recursive(self, obj):
             self.id_mappings[obj.id] = obj
             obj.scene = self
+            self.index.add(obj)
+            if self.tracker is not None:
+                self.tracker.track(obj)
+            if self.transforms is not None and obj.transform:
+                obj.transform.bind(self.transforms)
+            self.physics.add_gameobject(obj)
+            self.scheduler.add_gameobject(obj)
             for child in obj.children:
                 self.register_object_recursive(child)
 
@@ -35,65 +118,105 @@ class Scene(Serializable):
         from ...components import Transform, RigidBody
         parent : GameObject = parent
         gameobject : GameObject = gameobject
-        gameobject.subscribe(self.restructure_root_objects)
+        gameobject.subscribe(self.restructure_root_objects, fields=("parent",))
         self.register_object_recursive(gameobject)
 
         if not parent:    
             gameobject.parent = None
-            if gameobject not in self.root_gameobjects:
+            if self._batching:
+                self._restructure_pending = True
+            elif gameobject not in self.root_gameobjects:
                 self.root_gameobjects.append(gameobject)
         else:
-            gameobject = parent            
-        self.notify()
+            gameobject.parent = parent
+        self.notify("root_gameobjects")
+
+    @contextmanager
+    def batch(self):
+        """
+        Group many edits: notifications are held back and root restructuring is deferred,
+        then done once when the outermost batch exits. The hold uses Observable.batch(), so
+        it covers every observable, not only this scene's: other scenes and the editor get
+        their notifications late too. Main thread only.
+
+            with scene.batch():
+                for i in range(10000):
+                    scene.add_gameobject(GameObject(name=f"Enemy {i}"))
+        """
+        with Observable.batch():
+            self._batching += 1
+            try:
+                yield self
+            finally:
+                self._batching -= 1
+                if not self._batching and self._restructure_pending:
+                    self.restructure_root_objects()
 
     def remove_gameobject(self, gameobject):
         self.removed_gameobjects.add(gameobject)
 
     def destroy_gameobjects(self):
-        from ...editor import Editor
-        def recursive_remove(gameobject):
-            if Editor._instance.selected_gameobject == gameobject:
-                    Editor._instance.selected_gameobject = None
-            for child in gameobject.children:
-                recursive_remove(child)
-            if gameobject.id in self.id_mappings:
-                del self.id_mappings[gameobject.id]
-            print(f"successfully removed {gameobject.name}")
-
-        if len(self.removed_gameobjects) > 0:
+        editor = self.engine.editor if self.engine else None
+        def recursive_remove(root):
+            stack = [root]
+            while stack:
+                gameobject = stack.pop()
+                if editor and editor.selected_gameobject == gameobject:
+                        editor.selected_gameobject = None
+                if self.tracker is not None:
+                    self.tracker.untrack(gameobject)
+                stack.extend(gameobject.children)
+                self.physics.remove_gameobject(gameobject)
+                if gameobject.id in self.id_mappings:
+                    del self.id_mappings[gameobject.id]
+                self.index.remove(gameobject)
+                print(f"successfully removed {gameobject.name}")
+
+        if not self.removed_gameobjects:
+            return
+        with Tracer.span("Scene.destroy_gameobjects", {"count": len(self.removed_gameobjects)}):
             for gameobject in list(self.removed_gameobjects):
-                gameobject.clear_subscribers()
-                gameobject.destroy()
-
+                if gameobject._destroyed and gameobject.id not in self.id_mappings:
+                    continue  # already went with an ancestor
+                # Walk the hierarchy before destroy() drops the Transform that holds the children
                 recursive_remove(gameobject)  # <-- call recursive removal of id mappings
 
+                gameobject.clear_subscribers()
+                gameobject.destroy()  # the whole subtree: components leave the scheduler and physics
+
                 if gameobject in self.root_gameobjects:
                     self.root_gameobjects.remove(gameobject)
 
             self.removed_gameobjects.clear()
-            self.notify()
+        self.notify("root_gameobjects")
 
     def restructure_root_objects(self):
+        if self._batching:
+            self._restructure_pending = True
+            return
+        self._restructure_pending = False
+        roots = [obj for obj in self.root_gameobjects if obj.parent is None]
+        present = set(roots)
         for obj in self.id_mappings.values():
-            if obj.parent == None:
-                if obj not in self.root_gameobjects:
-                    self.root_gameobjects.append(obj)
-
-        for obj in list(self.root_gameobjects):
-            if obj.parent:
-                self.root_gameobjects.remove(obj)
+            if obj.parent is None and obj not in present:
+                roots.append(obj)
+                present.add(obj)
+        self.root_gameobjects[:] = roots
 
     def to_dict(self):
-        return {
-            "name": self.name,
-            "gameobjects": [go.to_dict() for go in self.root_gameobjects]
-        }
+        data = self._schema.dump(self)
+        with gc_paused():
+            data["gameobjects"] = [go.to_dict() for go in self.root_gameobjects]
+        return data
 
     @classmethod
     def from_dict(cls, **kwargs):
         from ...core.gameobject import GameObject
-        scene : Scene = cls(**kwargs)
-        for go_data in kwargs.get("gameobjects", []):
-            go = GameObject.from_dict(**go_data)
-            scene.add_gameobject(go)
+        from ..serialization.linker import Linker
+        scene : Scene = cls._schema.load(cls, kwargs)
+        # Linked (ids → objects) before the batch ends, so roots are restructured once with the full hierarchy
+        with gc_paused(), scene.batch(), Linker.scope(scene.name):
+            for go_data in kwargs.get("gameobjects", []):
+                go = GameObject.from_dict(**go_data)
+                scene.add_gameobject(go)
         return scene
\ No newline at end of file
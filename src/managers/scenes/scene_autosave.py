@@ -0,0 +1,69 @@
+import os
+import time
+from ..profiler import Tracer
+from ..serialization.scene_journal import SceneJournal
+from .change_tracker import ChangeTracker
+
+
+class SceneAutosave:
+    """
+    Keeps `path` in sync with `scene` at a cost proportional to the edits, not the scene size.
+    - save() appends the GameObjects changed since the last save to "<path>.journal"
+    - once the journal holds more than compact_ratio × the scene's GameObject count entries,
+      save() rewrites `path` in full and deletes the journal (a compaction)
+    - interval → update(), called every frame by SceneManager, saves that often (seconds)
+    - manager → compactions go through manager.save_scene_async() instead of blocking
+    """
+
+    def __init__(self, scene, path, interval=None, compact_ratio=0.5, manager=None):
+        self.scene = scene
+        self.path = path
+        self.interval = interval
+        self.compact_ratio = compact_ratio
+        self.manager = manager
+        self.compacting = None  # Future of a background compaction in flight
+        self.tracker = ChangeTracker(scene)
+        # The scene was loaded as file + journal, so keep appending to that journal
+        self.journal_entries = len(SceneJournal.entries(path))
+        self.last_save = time.perf_counter()
+
+    def update(self):
+        if self.interval is not None and time.perf_counter() - self.last_save >= self.interval:
+            self.save()
+
+    def save(self, compact=False):
+        """Write pending changes; returns the number of journal entries written (-1 for a compaction)."""
+        self.last_save = time.perf_counter()
+        limit = self.compact_ratio * max(len(self.scene.id_mappings), 1)
+        in_flight = self.compacting is not None and not self.compacting.done()
+        if not in_flight and (compact or not os.path.exists(self.path) or self.journal_entries >= limit):
+            self.compact()
+            return -1
+        if not os.path.exists(self.path):
+            return 0  # the first full save is still being written; keep the changes pending
+
+        dirty, removed, scene_changed = self.tracker.take()
+        entries = [{"op": "remove", "id": id} for id in removed]
+        entries += [{"op": "put", "id": go.uuid, "data": go.to_dict(recursive=False)} for go in dirty]
+        if scene_changed:
+            scene = self.scene
+            entries.append({"op": "scene", "data": scene._schema.dump(scene),
+                            "roots": [go.uuid for go in scene.root_gameobjects]})
+        if entries:
+            with Tracer.span("SceneAutosave.journal", {"entries": len(entries)}):
+                SceneJournal.append(self.path, entries)
+            self.journal_entries += len(entries)
+        return len(entries)
+
+    def compact(self):
+        from ..serialization.serializer_manager import Serializer
+        self.tracker.take()
+        with Tracer.span("SceneAutosave.compact", {"path": self.path}):
+            if self.manager is not None:
+                self.compacting = self.manager.save_scene_async(self.scene, self.path)
+            else:
+                Serializer.save_scene(self.scene, self.path)
+        self.journal_entries = 0
+
+    def close(self):
+        self.tracker.close()
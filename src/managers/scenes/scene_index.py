@@ -0,0 +1,235 @@
+from bisect import bisect_right, insort
+from itertools import islice
+from operator import itemgetter
+from ..serialization.util import gc_paused
+
+_tick = itemgetter(0)
+
+
+class ChangeLog(list):
+    """
+    (tick, component) for the components of one archetype column, in tick order: stamp()
+    appends on every change of a component whose _change_log is this list, so "changed since t"
+    is a bisect plus the entries after it.
+    - entries go stale when their component is changed again or leaves the column
+      (its _change_log is reset); once there are twice as many entries as rows, compact()
+      keeps only the latest live one per component
+    """
+    __slots__ = ("limit",)
+
+    def __init__(self):
+        super().__init__()
+        self.limit = 64
+
+    def add(self, tick, component):
+        self.append((tick, component))
+        if len(self) > self.limit:
+            self.compact()
+
+    def track(self, component):
+        """`component` joins the column; its current tick counts as a change."""
+        component._change_log = self
+        entry = (component._change_tick, component)
+        if not self or self[-1][0] <= entry[0]:
+            self.add(*entry)
+        else:
+            insort(self, entry, key=_tick)
+
+    def since(self, tick):
+        """Live components changed after `tick`, oldest change first (may repeat)."""
+        return [component for _, component in islice(self, bisect_right(self, tick, key=_tick), None)
+                if component._change_log is self]
+
+    def compact(self):
+        latest = {}
+        for tick, component in self:
+            if component._change_log is self and tick == component._change_tick:
+                latest[component] = tick
+        self[:] = [(tick, component) for component, tick in latest.items()]
+        self.limit = 2 * len(self) + 64
+
+
+class Archetype:
+    """
+    Table of the GameObjects whose components are exactly `types` (lazily loaded ones included):
+    one column per type, GameObject -> its component, or None while it's still saved data.
+    Each column has a ChangeLog, so changed-since queries only touch what changed.
+    """
+    __slots__ = ("types", "gameobjects", "columns", "changes")
+
+    def __init__(self, types):
+        self.types = types  # frozenset of component classes
+        self.gameobjects = {}  # GameObject -> None, in insertion order
+        self.columns = {component_type: {} for component_type in types}
+        self.changes = {component_type: ChangeLog() for component_type in types}
+
+    def insert(self, gameobject):
+        self.gameobjects[gameobject] = None
+        components = gameobject._components
+        changes = self.changes
+        for component_type, column in self.columns.items():
+            component = column[gameobject] = components.get(component_type)
+            if component is not None:
+                changes[component_type].track(component)
+
+    def set(self, gameobject, component_type, component):
+        """Fill (or replace) one cell, e.g. a lazily loaded component that got built."""
+        column = self.columns[component_type]
+        if (previous := column.get(gameobject)) is not None and previous is not component:
+            previous._change_log = None
+        column[gameobject] = component
+        self.changes[component_type].track(component)
+
+    def delete(self, gameobject):
+        del self.gameobjects[gameobject]
+        for column in self.columns.values():
+            if (component := column.pop(gameobject)) is not None:
+                component._change_log = None
+
+
+class SceneIndex:
+    """
+    Per-scene lookup tables for GameObjects, updated as the scene changes so queries cost
+    O(result) instead of a walk over every object.
+    - name / tag / layer → value -> GameObjects; kept current by the GameObject setters
+    - component types → each GameObject sits in the Archetype for its set of component types and
+      moves on add_component / remove_component. Lazily loaded components (GameObject._pending)
+      count; get_component() or a query row builds them on demand
+    Archetypes are never dropped, so the archetypes matching a query are cached until a new one appears.
+    """
+
+    FIELDS = ("name", "tag", "layer")
+
+    def __init__(self):
+        self.fields = {field: {} for field in self.FIELDS}  # field -> value -> {GameObject: None}
+        self.archetypes = {}  # frozenset of component types -> Archetype
+        self.archetype_of = {}  # GameObject -> Archetype
+        self._queries = {}  # tuple of queried types -> [(Archetype, matching type in it for each)]
+
+    def add(self, gameobject):
+        for field, buckets in self.fields.items():
+            buckets.setdefault(getattr(gameobject, "_" + field), {})[gameobject] = None
+        self._move(gameobject, frozenset(self._component_types(gameobject)))
+
+    def remove(self, gameobject):
+        for field, buckets in self.fields.items():
+            self._discard(buckets, getattr(gameobject, "_" + field), gameobject)
+        if (archetype := self.archetype_of.pop(gameobject, None)) is not None:
+            archetype.delete(gameobject)
+
+    def move(self, gameobject, field, old, new):
+        """`gameobject`'s `field` changes from old to new; ignored for GameObjects not indexed."""
+        buckets = self.fields[field]
+        bucket = buckets.get(old)
+        if bucket is None or gameobject not in bucket:
+            return
+        self._discard(buckets, old, gameobject)
+        buckets.setdefault(new, {})[gameobject] = None
+
+    def add_component(self, gameobject, component):
+        archetype = self.archetype_of.get(gameobject)
+        if archetype is None:
+            return
+        component_type = type(component)
+        if component_type in archetype.types:
+            archetype.set(gameobject, component_type, component)
+        else:
+            self._move(gameobject, archetype.types | {component_type})
+
+    def remove_component(self, gameobject, component_type):
+        archetype = self.archetype_of.get(gameobject)
+        if archetype is not None and component_type in archetype.types:
+            self._move(gameobject, archetype.types - {component_type})
+
+    def with_field(self, field, value):
+        return list(self.fields[field].get(value, ()))
+
+    def first_with_field(self, field, value):
+        return next(iter(self.fields[field].get(value, ())), None)
+
+    def with_components(self, component_types):
+        """GameObjects having a component of every type in `component_types` (subclasses count)."""
+        if not component_types:
+            return []
+        return [gameobject for archetype, _ in self._matching(component_types) for gameobject in archetype.gameobjects]
+
+    def query(self, component_types, changed=(), since=0):
+        """
+        [(GameObject, component of each of component_types)] for every GameObject that has them all.
+        changed → only rows where a component of one of these types changed after tick `since`
+        (see change_tick()); they must be among component_types. Served from the columns'
+        ChangeLogs: O(log rows + changes since `since`) per matching archetype, rows in change order.
+        """
+        changed_at = [component_types.index(component_type) for component_type in changed]
+        with gc_paused():
+            return self._rows(component_types, changed_at, since)
+
+    def _rows(self, component_types, changed_at, since):
+        rows = []
+        for archetype, concrete in self._matching(component_types):
+            if changed_at:
+                # Only the change logs are read; components still saved data haven't changed
+                selected = {}
+                for i in changed_at:
+                    for component in archetype.changes[concrete[i]].since(since):
+                        selected[component.gameobject] = None
+                selected = list(selected)
+            else:
+                selected = list(archetype.gameobjects)
+            columns = [archetype.columns[component_type] for component_type in concrete]
+            # Components still saved data (lazy_components) are built for the selected rows
+            if changed_at or any(None in column.values() for column in columns):
+                for gameobject in selected:
+                    if any(column[gameobject] is None for column in columns):
+                        gameobject._materialize()
+            # Rows are assembled column-wise, without a Python-level step per row
+            rows.extend(zip(selected, *[map(column.__getitem__, selected) for column in columns]))
+        return rows
+
+    def _matching(self, component_types):
+        matching = self._queries.get(component_types)
+        if matching is None:
+            matching = []
+            for archetype in self.archetypes.values():
+                concrete = tuple(self._concrete(archetype.types, component_type) for component_type in component_types)
+                if None not in concrete:
+                    matching.append((archetype, concrete))
+            self._queries[component_types] = matching
+        return matching
+
+    def _move(self, gameobject, types):
+        archetype = self.archetypes.get(types)
+        if archetype is None:
+            archetype = self.archetypes[types] = Archetype(types)
+            self._queries.clear()
+        previous = self.archetype_of.get(gameobject)
+        if previous is archetype:
+            return
+        if previous is not None:
+            previous.delete(gameobject)
+        archetype.insert(gameobject)
+        self.archetype_of[gameobject] = archetype
+
+    @staticmethod
+    def _concrete(types, component_type):
+        """The type in `types` that stands for component_type: itself, else a subclass, else None."""
+        if component_type in types:
+            return component_type
+        return next((t for t in types if issubclass(t, component_type)), None)
+
+    @staticmethod
+    def _component_types(gameobject):
+        from ...components import Component_Registry
+        types = list(gameobject._components)
+        if gameobject._pending:
+            registry = Component_Registry.registry
+            types += [registry[data["type"]]["class"] for data in gameobject._pending.values()]
+        return types
+
+    @staticmethod
+    def _discard(buckets, key, gameobject):
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.pop(gameobject, None)
+            if not bucket:
+                del buckets[key]
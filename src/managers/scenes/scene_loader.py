@@ -0,0 +1,87 @@
+import os
+import time
+from ..profiler import Tracer
+from ..serialization.linker import Linker
+from ..serialization.util import gc_paused
+
+
+class SceneLoader:
+    """
+    Instantiates a scene from Serializer.stream_scene() (or given `records`) a slice at a time.
+    SceneManager.update() calls step() once per frame; each call builds GameObjects
+    until its time budget runs out, so large scenes fill in over several frames.
+    - on_progress(loader) → after every step (loader.progress, loader.loaded)
+    - on_complete(scene) → once the last record is in
+    - on_error(loader, exception) → parsing or instantiation failed; the loader stops
+    References saved as ids are linked at the end of every step; ids that may still be
+    ahead in the file wait, and whatever is unresolved at the end is reported as dangling.
+    """
+
+    def __init__(self, path, scene=None, on_progress=None, on_complete=None, on_error=None, records=None):
+        from .scene import Scene
+        from ..serialization.serializer_manager import Serializer
+        self.path = path
+        self.scene = scene or Scene(name=os.path.splitext(os.path.basename(path))[0])
+        self.records = Serializer.stream_scene(path) if records is None else records
+        self.on_progress = on_progress
+        self.on_complete = on_complete
+        self.on_error = on_error
+        self.loaded = 0
+        self.progress = 0.0
+        self.done = False
+        self.error = None
+        self.linker = Linker(self.scene.name)
+
+    def step(self, budget):
+        """Instantiate records for up to `budget` seconds; returns True once the loader is finished."""
+        from ...core.gameobject import GameObject
+        if self.done:
+            return True
+        scene = self.scene
+        deadline = time.perf_counter() + budget
+        try:
+            with Tracer.span("SceneLoader.step", {"path": self.path}), gc_paused(), scene.batch():
+                with self.linker.collecting():
+                    try:
+                        while True:
+                            kind, data, self.progress = next(self.records)
+                            if kind == "gameobject":
+                                scene.add_gameobject(GameObject.from_dict(**data))
+                                self.loaded += 1
+                            else:
+                                fields = dict(scene._schema.persistent)
+                                for name, value in data.items():
+                                    if name in fields:
+                                        setattr(scene, name, value)
+                            if time.perf_counter() >= deadline:
+                                break
+                    except StopIteration:
+                        self.done = True
+                        self.progress = 1.0
+                self.linker.link(final=self.done)
+            if self.done:
+                self.linker.report()
+        except Exception as e:
+            self.done = True
+            self.error = e
+            self.records.close()
+            if self.on_error is None:
+                raise
+            self.on_error(self, e)
+            return True
+
+        if self.on_progress:
+            self.on_progress(self)
+        if self.done and self.on_complete:
+            self.on_complete(scene)
+        return self.done
+
+    def run(self):
+        """Load everything right now."""
+        while not self.step(float("inf")):
+            pass
+        return self.scene
+
+    def cancel(self):
+        self.records.close()
+        self.done = True
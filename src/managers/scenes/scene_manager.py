@@ -1,9 +1,22 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from ...core import Observable
 from . import Scene
 from ..serialization.serializer_manager import Serializer
+from ..serialization.scene_journal import SceneJournal
+from ..profiler import Profiler
+from .scene_loader import SceneLoader
+from .scene_autosave import SceneAutosave
 
 class SceneManager(Observable):
     _instance = None
+    # Seconds per frame that streaming loads may spend instantiating GameObjects (shared by all loaders)
+    load_budget = 0.008
+    # Worker threads shared by load_scene_async(); created on first use
+    _executor = None
+    max_load_workers = 2
+    # Single worker for save_scene_async(), so saves of the same path land in the order they were made
+    _save_executor = None
 
     def __new__(cls, engine=None):
         if cls._instance is None:
@@ -19,11 +32,160 @@ class SceneManager(Observable):
         self.engine = engine
         self.loaded_scenes : list[Scene] = []
         self.active_scene = None
+        self.loaders : list[SceneLoader] = []
+        # (path, parse future, result future, additive, on_complete, on_error) waiting on a worker
+        self.pending_loads = []
+        # (scene, path, write future, result future, on_complete, on_error) waiting on the save worker
+        self.pending_saves = []
+        self.autosaves : dict[Scene, SceneAutosave] = {}
         self._initialized = True
     
-    def initialize(self):
-        scene = Serializer.load_from_yaml("assets\scenes\SampleScene.yaml", self.engine)
+    def initialize(self, path=None, streaming=False, background=False):
+        path = path or os.path.join("assets", "scenes", "SampleScene.yaml")
+        if background:
+            self.load_scene_async(path)
+        elif streaming:
+            self.load_scene_streaming(path)
+        else:
+            self.load_scene(path)
+
+    def load_scene(self, path):
+        if Serializer.format(path) == "json":
+            scene = Serializer.load_from_json(path, self.engine)
+        elif Serializer.format(path) == "bscene":
+            scene = Serializer.load_from_binary(path, self.engine)
+        else:
+            scene = Serializer.load_from_yaml(path, self.engine)
         self.add_scene(scene)
+        return scene
+
+    def load_scene_streaming(self, path, on_progress=None, on_complete=None, on_error=None):
+        """
+        Add an empty scene now and fill it from `path` over the next frames (see SceneLoader).
+        Returns the SceneLoader; callbacks get (loader), (scene) and (loader, exception).
+        """
+        loader = SceneLoader(path, on_progress=on_progress, on_complete=on_complete, on_error=on_error)
+        self.add_scene(loader.scene)
+        self.loaders.append(loader)
+        return loader
+
+    def load_scene_async(self, path, additive=False, on_complete=None, on_error=None) -> Future:
+        """
+        Read and parse `path` on a worker thread, then build it into the live scene graph on
+        the main thread, a time slice per frame from SceneManager.update().
+        - additive=False → every loaded scene is unloaded when the new one is committed
+        - additive=True → joins the loaded scenes; several additive loads can be in flight
+        Returns a Future resolved (on the main thread) with the Scene once fully built;
+        `await asyncio.wrap_future(future)` works from asyncio code.
+        """
+        if SceneManager._executor is None:
+            SceneManager._executor = ThreadPoolExecutor(self.max_load_workers, thread_name_prefix="SceneLoad")
+        parsing = SceneManager._executor.submit(Serializer.read_scene_data, path)
+        result = Future()
+        self.pending_loads.append((path, parsing, result, additive, on_complete, on_error))
+        return result
+
+    def _commit_load(self, path, parsing, result, additive, on_complete, on_error):
+        if not result.set_running_or_notify_cancel():
+            return
+
+        def failed(_loader, e):
+            result.set_exception(e)
+            if on_error:
+                on_error(path, e)
+
+        if (e := parsing.exception()) is not None:
+            failed(None, e)
+            return
+
+        def completed(scene):
+            result.set_result(scene)
+            if on_complete:
+                on_complete(scene)
+
+        if not additive:
+            for scene in list(self.loaded_scenes):
+                self.unload_scene(scene)
+        loader = SceneLoader(path, on_complete=completed, on_error=failed,
+                             records=Serializer.iter_scene_data(parsing.result()))
+        self.add_scene(loader.scene)
+        self.loaders.append(loader)
+
+    def save_scene_async(self, scene, path, on_complete=None, on_error=None) -> Future:
+        """
+        Snapshot `scene` now and write it to `path` on a worker thread; edits made afterwards
+        don't reach the file. The snapshot (to_dict + pickle) runs here and blocks the caller;
+        encoding, compression and the write don't. Format and ".gz" compression follow the extension, and the file
+        is replaced atomically, so a failed save leaves the previous one in place.
+        Returns a Future resolved (on the main thread, from update()) with the path;
+        callbacks get (scene, path) and (scene, path, exception).
+        """
+        if SceneManager._save_executor is None:
+            SceneManager._save_executor = ThreadPoolExecutor(1, thread_name_prefix="SceneSave")
+        with Profiler.sample("SceneManager.snapshot"):
+            snapshot = Serializer.snapshot_scene(scene)
+        writing = SceneManager._save_executor.submit(
+            Serializer.write_snapshot, snapshot, path, SceneJournal.size(path))
+        result = Future()
+        self.pending_saves.append((scene, path, writing, result, on_complete, on_error))
+        return result
+
+    def _finish_save(self, scene, path, writing, result, on_complete, on_error):
+        if not result.set_running_or_notify_cancel():
+            return
+        if (e := writing.exception()) is not None:
+            result.set_exception(e)
+            if on_error:
+                on_error(scene, path, e)
+            return
+        result.set_result(path)
+        if on_complete:
+            on_complete(scene, path)
+
+    def enable_autosave(self, scene, path, interval=60.0, compact_ratio=0.5):
+        """Journal `scene`'s edits to `path` every `interval` seconds (see SceneAutosave); compactions save in the background."""
+        self.disable_autosave(scene)
+        autosave = self.autosaves[scene] = SceneAutosave(scene, path, interval, compact_ratio, manager=self)
+        return autosave
+
+    def disable_autosave(self, scene):
+        if (autosave := self.autosaves.pop(scene, None)) is not None:
+            autosave.close()
+
+    def unload_scene(self, scene):
+        """Destroy every GameObject of `scene` and drop it (and any load still filling it)."""
+        self.disable_autosave(scene)
+        for loader in [loader for loader in self.loaders if loader.scene is scene]:
+            loader.cancel()
+            self.loaders.remove(loader)
+        # Every GameObject, not just the roots: each one's entity handle and UUID are released
+        for gameobject in list(scene.id_mappings.values()):
+            scene.remove_gameobject(gameobject)
+        scene.destroy_gameobjects()
+        scene.physics.clear()  # bodies of anything the scene graph no longer reached
+        if scene in self.loaded_scenes:
+            self.loaded_scenes.remove(scene)
+            if self.active_scene is scene:
+                self.active_scene = self.loaded_scenes[-1] if self.loaded_scenes else None
+            self.notify("loaded_scenes")
+
+    def update(self):
+        """Commit finished background parses and saves and advance streaming loads; called once per frame by the engine."""
+        for load in [load for load in self.pending_loads if load[1].done()]:
+            self.pending_loads.remove(load)
+            self._commit_load(*load)
+        for save in [save for save in self.pending_saves if save[2].done()]:
+            self.pending_saves.remove(save)
+            self._finish_save(*save)
+        for autosave in list(self.autosaves.values()):
+            autosave.update()
+        if not self.loaders:
+            return
+        with Profiler.sample("SceneManager.load"):
+            budget = self.load_budget / len(self.loaders)
+            for loader in list(self.loaders):
+                if loader.step(budget):
+                    self.loaders.remove(loader)
 
     def start(self):
         pass
@@ -34,8 +196,8 @@ class SceneManager(Observable):
             scene.destroy_gameobjects()
         
     def add_scene(self, scene):
-        from ...gui.widgets import Hierarchy
         if scene not in self.loaded_scenes:
+            scene.engine = self.engine
             self.loaded_scenes.append(scene)
             self.active_scene = scene
-            self.notify()
\ No newline at end of file
+            self.notify("loaded_scenes")
\ No newline at end of file
@@ -0,0 +1,74 @@
+import numpy as np
+from ..serialization.util import stamp
+
+
+class TransformStore:
+    """
+    Struct-of-arrays storage for the Transforms of one Scene.
+    Row i of positions / angles / scales belongs to transforms[i]; a bound
+    Transform only keeps its row index. Rows are recycled through a free list
+    and never move, so indices stay valid until the Transform is unbound.
+    """
+
+    def __init__(self, capacity=64):
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.angles = np.zeros(capacity, dtype=np.float64)
+        self.scales = np.ones((capacity, 2), dtype=np.float64)
+        self.transforms = [None] * capacity
+        self.used = np.zeros(capacity, dtype=bool)
+        self._free = []
+        self._next = 0
+
+    def __len__(self):
+        return self._next - len(self._free)
+
+    @property
+    def capacity(self):
+        return len(self.transforms)
+
+    def allocate(self, transform):
+        if self._free:
+            index = self._free.pop()
+        else:
+            if self._next == self.capacity:
+                self._grow(self.capacity * 2)
+            index = self._next
+            self._next += 1
+        self.transforms[index] = transform
+        self.used[index] = True
+        return index
+
+    def release(self, index):
+        self.transforms[index] = None
+        self.used[index] = False
+        self.positions[index] = 0.0
+        self.angles[index] = 0.0
+        self.scales[index] = 1.0
+        self._free.append(index)
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        self.positions = np.concatenate([self.positions, np.zeros((extra, 2))])
+        self.angles = np.concatenate([self.angles, np.zeros(extra)])
+        self.scales = np.concatenate([self.scales, np.ones((extra, 2))])
+        self.used = np.concatenate([self.used, np.zeros(extra, dtype=bool)])
+        self.transforms.extend([None] * extra)
+
+    def rows(self):
+        """Indices of all rows currently bound to a Transform."""
+        return np.flatnonzero(self.used[:self._next])
+
+    def notify(self, rows=None, fields=("position", "angle", "scale")):
+        """
+        Tell the Transforms at `rows` (all bound rows by default) that the arrays were written directly:
+        they are stamped changed, their cached world transforms are invalidated and subscribers, if any, are notified.
+        """
+        transforms = self.transforms
+        for index in (self.rows() if rows is None else rows).tolist():
+            transform = transforms[index]
+            if transform is None:
+                continue
+            stamp(transform)
+            transform._invalidate_world()
+            if transform._subscribers:
+                transform.notify(*fields)
@@ -1,4 +1,10 @@
 
 from .serializable import Serializable
+from .schema import Schema
 from .serializer_manager import Serializer
-from .util import *
\ No newline at end of file
+from .util import *
+from .binary_scene import BinaryScene
+
+from .scene_cache import SceneCache
+from .scene_journal import SceneJournal
+from .linker import Linker
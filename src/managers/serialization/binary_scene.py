@@ -0,0 +1,339 @@
+"""
+Compact binary scene files (.bscene), read in place through mmap.
+
+Layout (little endian):
+- header → magic, version, string/object counts and section offsets
+- string table → (offset, length) per string, then one UTF-8 pool; every name, tag,
+  id, component type and dict key is stored once and referenced by index
+- scene → tagged dict of the scene fields ("name", ...)
+- object records → fixed-size, depth first, each with its parent's record index and
+  the Transform pose inline, so the common data never goes through the value decoder;
+  flag bits say which of name / tag / active / layer / id the source had (v2), so keys
+  that were missing stay missing
+- blobs → per object: component count, then (type, byte length, tagged dict) per
+  component, then a tagged dict of any other GameObject keys
+
+    python -m src.managers.serialization.binary_scene in.yaml out.bscene   (or back)
+"""
+import mmap
+import struct
+import sys
+from contextlib import contextmanager
+
+MAGIC = b"GESC"
+VERSION = 2
+NONE = 0xFFFFFFFF
+
+HEADER = struct.Struct("<4sHHIIQQQQ")
+STRING = struct.Struct("<II")
+# name, tag, layer, id, parent, flags, position x/y, angle, scale x/y, blob offset, blob length
+RECORD = struct.Struct("<IIIIiB3x5dQI4x")
+U32 = struct.Struct("<I")
+I64 = struct.Struct("<q")
+F64 = struct.Struct("<d")
+
+ACTIVE = 1
+POSE = 2
+HAS_NAME, HAS_TAG, HAS_ACTIVE, HAS_LAYER, HAS_ID = 4, 8, 16, 32, 64
+PRESENT = (("name", HAS_NAME), ("tag", HAS_TAG), ("active", HAS_ACTIVE), ("layer", HAS_LAYER), ("id", HAS_ID))
+
+# Tags of the value encoding used inside blobs
+T_NONE, T_FALSE, T_TRUE, T_INT, T_FLOAT, T_STR, T_LIST, T_DICT = range(8)
+
+RECORD_KEYS = ("name", "tag", "layer", "active", "id", "components", "children")
+POSE_KEYS = ("position", "angle", "scale")
+
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}
+
+    def add(self, value):
+        if value is None:
+            return NONE
+        index = self.index.get(value)
+        if index is None:
+            index = self.index[value] = len(self.index)
+        return index
+
+    def pack(self):
+        encoded = [value.encode("utf-8") for value in self.index]
+        table = bytearray()
+        offset = 0
+        for data in encoded:
+            table += STRING.pack(offset, len(data))
+            offset += len(data)
+        return bytes(table) + b"".join(encoded)
+
+
+def _encode(value, out, strings):
+    if value is None:
+        out.append(T_NONE)
+    elif value is True:
+        out.append(T_TRUE)
+    elif value is False:
+        out.append(T_FALSE)
+    elif isinstance(value, int):
+        if not -1 << 63 <= value < 1 << 63:
+            raise OverflowError(f"Can't store {value} in a binary scene: ints are 64-bit")
+        out.append(T_INT)
+        out += I64.pack(value)
+    elif isinstance(value, float):
+        out.append(T_FLOAT)
+        out += F64.pack(value)
+    elif isinstance(value, str):
+        out.append(T_STR)
+        out += U32.pack(strings.add(value))
+    elif isinstance(value, (list, tuple)):
+        out.append(T_LIST)
+        out += U32.pack(len(value))
+        for item in value:
+            _encode(item, out, strings)
+    elif isinstance(value, dict):
+        out.append(T_DICT)
+        out += U32.pack(len(value))
+        for key, item in value.items():
+            if type(key) is not str:  # keys are string table entries; a stringified key wouldn't round-trip
+                raise TypeError(f"Can't store dict key {key!r} ({type(key).__name__}) in a binary scene")
+            out += U32.pack(strings.add(key))
+            _encode(item, out, strings)
+    else:
+        raise TypeError(f"Can't store {type(value).__name__} in a binary scene")
+
+
+def _pose(component):
+    if component.get("type") != "Transform" or not all(key in component for key in POSE_KEYS):
+        return None
+    (x, y), angle, (sx, sy) = component["position"], component["angle"], component["scale"]
+    return float(x), float(y), float(angle), float(sx), float(sy)
+
+
+class BinarySceneReader:
+    """Decodes a mapped .bscene; strings are decoded once, on first use."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        (magic, version, _, string_count, self.object_count,
+         strings_offset, scene_offset, self.records_offset, self.blobs_offset) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a binary scene file")
+        if version not in (1, VERSION):
+            raise ValueError(f"Unsupported binary scene version {version}")
+        self.legacy = version == 1  # v1 always wrote name / tag / active; layer / id were NONE if absent
+        self.strings_offset = strings_offset
+        self.pool_offset = strings_offset + string_count * STRING.size
+        self._strings = [None] * string_count
+        self.position = 0  # records consumed by gameobjects() so far
+        self.scene, _ = self._decode(scene_offset)
+
+    def string(self, index):
+        if index == NONE:
+            return None
+        value = self._strings[index]
+        if value is None:
+            offset, length = STRING.unpack_from(self.buffer, self.strings_offset + index * STRING.size)
+            start = self.pool_offset + offset
+            value = self._strings[index] = str(self.buffer[start:start + length], "utf-8")
+        return value
+
+    def _decode(self, offset):
+        buffer = self.buffer
+        tag = buffer[offset]
+        offset += 1
+        if tag == T_NONE:
+            return None, offset
+        if tag == T_TRUE:
+            return True, offset
+        if tag == T_FALSE:
+            return False, offset
+        if tag == T_INT:
+            return I64.unpack_from(buffer, offset)[0], offset + 8
+        if tag == T_FLOAT:
+            return F64.unpack_from(buffer, offset)[0], offset + 8
+        if tag == T_STR:
+            return self.string(U32.unpack_from(buffer, offset)[0]), offset + 4
+        count = U32.unpack_from(buffer, offset)[0]
+        offset += 4
+        if tag == T_LIST:
+            items = []
+            for _ in range(count):
+                item, offset = self._decode(offset)
+                items.append(item)
+            return items, offset
+        if tag == T_DICT:
+            items = {}
+            for _ in range(count):
+                key = self.string(U32.unpack_from(buffer, offset)[0])
+                items[key], offset = self._decode(offset + 4)
+            return items, offset
+        raise ValueError(f"Corrupt binary scene: unknown value tag {tag}")
+
+    def record(self, index):
+        """GameObject data of record `index` without "children", and its parent's index (-1 for roots)."""
+        name, tag, layer, id, parent, flags, x, y, angle, sx, sy, blob, _ = RECORD.unpack_from(
+            self.buffer, self.records_offset + index * RECORD.size)
+        string = self.string
+        if self.legacy:
+            flags |= (HAS_NAME | HAS_TAG | HAS_ACTIVE | (HAS_LAYER if layer != NONE else 0)
+                      | (HAS_ID if id != NONE else 0))
+        data = {}
+        if flags & HAS_NAME:
+            data["name"] = string(name)
+        if flags & HAS_TAG:
+            data["tag"] = string(tag)
+        if flags & HAS_ACTIVE:
+            data["active"] = bool(flags & ACTIVE)
+        if flags & HAS_LAYER:
+            data["layer"] = string(layer)
+        if flags & HAS_ID:
+            data["id"] = string(id)
+
+        offset = self.blobs_offset + blob
+        count = U32.unpack_from(self.buffer, offset)[0]
+        offset += 4
+        components = []
+        for _ in range(count):
+            type_index, length = STRING.unpack_from(self.buffer, offset)
+            component, _ = self._decode(offset + STRING.size)
+            component = {"type": string(type_index), **component}
+            if flags & POSE and component["type"] == "Transform":
+                component["position"], component["angle"], component["scale"] = [x, y], angle, [sx, sy]
+            components.append(component)
+            offset += STRING.size + length
+        extra, _ = self._decode(offset)
+        if extra:
+            data.update(extra)
+        data["components"] = components
+        return data, parent
+
+    def gameobjects(self):
+        """Yield root GameObject data one subtree at a time, children nested like Scene.to_dict()."""
+        root = None
+        subtree = {}
+        for index in range(self.object_count):
+            data, parent = self.record(index)
+            data["children"] = []
+            if parent < 0:
+                if root is not None:
+                    self.position = index
+                    yield root
+                root = data
+                subtree.clear()
+            else:
+                subtree[parent]["children"].append(data)
+            subtree[index] = data
+        self.position = self.object_count
+        if root is not None:
+            yield root
+
+    def to_dict(self):
+        return {**self.scene, "gameobjects": list(self.gameobjects())}
+
+
+class BinaryScene:
+    EXTENSION = ".bscene"
+
+    @classmethod
+    def encode(cls, data: dict) -> bytes:
+        """Scene data in the Scene.to_dict() layout → .bscene bytes."""
+        strings = _StringTable()
+        records = bytearray()
+        blobs = bytearray()
+        count = 0
+
+        stack = [(go, -1) for go in reversed(data.get("gameobjects", []))]
+        while stack:
+            go, parent = stack.pop()
+            index = count
+            count += 1
+
+            pose = None
+            components = bytearray()
+            component_list = go.get("components", [])
+            for component in component_list:
+                skip = ("type",)
+                if pose is None:
+                    pose = _pose(component)
+                    if pose is not None:
+                        skip = ("type", *POSE_KEYS)
+                payload = {key: value for key, value in component.items() if key not in skip}
+                encoded = bytearray()
+                _encode(payload, encoded, strings)
+                components += STRING.pack(strings.add(component["type"]), len(encoded))
+                components += encoded
+
+            blob = len(blobs)
+            blobs += U32.pack(len(component_list))
+            blobs += components
+            _encode({key: value for key, value in go.items() if key not in RECORD_KEYS}, blobs, strings)
+
+            flags = (ACTIVE if go.get("active", True) else 0) | (POSE if pose else 0)
+            for key, bit in PRESENT:
+                if key in go:
+                    flags |= bit
+            records += RECORD.pack(
+                strings.add(go.get("name")), strings.add(go.get("tag")), strings.add(go.get("layer")),
+                strings.add(go.get("id")), parent, flags, *(pose or (0.0, 0.0, 0.0, 1.0, 1.0)),
+                blob, len(blobs) - blob)
+
+            children = go.get("children", [])
+            for child in children:
+                if not isinstance(child, dict):
+                    raise ValueError(f"GameObject {go.get('name')!r}: children given as ids ({child!r}) "
+                                     "can't be stored in a binary scene, only nested GameObject data")
+            stack.extend((child, index) for child in reversed(children))
+
+        scene = bytearray()
+        _encode({key: value for key, value in data.items() if key != "gameobjects"}, scene, strings)
+        string_table = strings.pack()
+
+        strings_offset = HEADER.size
+        scene_offset = strings_offset + len(string_table)
+        records_offset = scene_offset + len(scene)
+        blobs_offset = records_offset + len(records)
+        header = HEADER.pack(MAGIC, VERSION, 0, len(strings.index), count,
+                             strings_offset, scene_offset, records_offset, blobs_offset)
+        return b"".join((header, string_table, scene, records, blobs))
+
+    @classmethod
+    def save(cls, data: dict, path):
+        with open(path, "wb") as f:
+            f.write(cls.encode(data))
+
+    @classmethod
+    @contextmanager
+    def open(cls, path):
+        """Map `path` read-only and yield a BinarySceneReader over it."""
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield BinarySceneReader(buffer)
+
+    @classmethod
+    def load(cls, path) -> dict:
+        with cls.open(path) as reader:
+            return reader.to_dict()
+
+    @classmethod
+    def convert(cls, source, destination):
+        """YAML / JSON ↔ .bscene, picked by file extension."""
+        import json
+        import yaml
+        if str(source).endswith(cls.EXTENSION):
+            data = cls.load(source)
+        else:
+            with open(source, "r") as f:
+                data = json.load(f) if str(source).endswith(".json") else yaml.safe_load(f)
+
+        if str(destination).endswith(cls.EXTENSION):
+            cls.save(data, destination)
+        else:
+            with open(destination, "w") as f:
+                if str(destination).endswith(".json"):
+                    json.dump(data, f, indent=2)
+                else:
+                    yaml.safe_dump(data, f, sort_keys=False)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m src.managers.serialization.binary_scene SOURCE DESTINATION")
+    BinaryScene.convert(sys.argv[1], sys.argv[2])
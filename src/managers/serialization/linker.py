@@ -0,0 +1,192 @@
+from contextlib import contextmanager
+
+
+class Linker:
+    """
+    Two-pass reference resolution for scene loading.
+    - pass 1 → objects are built as usual; the linker indexes every GameObject id (and any "id"
+      a component's data carries) and collects references saved as ids instead of resolving them:
+      reference fields holding an id string, and hierarchy given as ids ("children" lists of
+      GameObject data, "parent" / "children" of Transform data)
+    - pass 2 → link() resolves everything collected against the index in one go
+    A reference field's type_hint decides what an id stands for: a GameObject id read by a field
+    typed as a Component resolves to that GameObject's component of that type.
+    Ids that resolve to nothing are reported and left as None.
+    """
+    _active = None  # Linker that objects being built register with
+
+    def __init__(self, name="scene"):
+        self.name = name
+        self.index = {}
+        self.references = []  # (object, field name, id, type_hint)
+        self.edges = []  # (parent, child), each a Transform or an id; from children lists
+        self.parent_edges = []  # the same, from "parent" ids; applied after, so sibling order follows children lists
+        self.dangling = []  # (description, id)
+
+    @contextmanager
+    def collecting(self):
+        """Make this the linker that objects built inside the block register with."""
+        previous, Linker._active = Linker._active, self
+        try:
+            yield self
+        finally:
+            Linker._active = previous
+
+    @classmethod
+    @contextmanager
+    def scope(cls, name="scene"):
+        """Join the active linker, or collect into a new one that is linked and reported when the block exits."""
+        if cls._active is not None:
+            yield cls._active
+            return
+        linker = cls(name)
+        with linker.collecting():
+            yield linker
+        linker.link()
+        linker.report()
+
+    @classmethod
+    def defer(cls, obj, references):
+        """Called by Schema.load for reference fields that hold ids: [(field name, id, type_hint)]."""
+        linker = cls._active
+        if linker is not None:
+            linker.references.extend((obj, name, id, type_hint) for name, id, type_hint in references)
+            return
+        # Built outside a load (e.g. a lazily loaded component): resolve against its scene right away
+        gameobject = getattr(obj, "gameobject", None)
+        scene = getattr(gameobject, "scene", None)
+        linker = cls(getattr(scene, "name", "scene"))
+        if scene is not None:
+            for _, id, _ in references:
+                if (target := scene.find_gameobject_by_uuid(id)) is not None:
+                    linker.index[id] = target
+        linker.references.extend((obj, name, id, type_hint) for name, id, type_hint in references)
+        linker.link()
+        linker.report()
+
+    def add(self, id, obj):
+        if id is not None:
+            self.index[id] = obj
+
+    def link_parent(self, parent, child, from_child=False):
+        """Queue a hierarchy link; either side may be an id or a Transform. from_child → saved as the child's "parent"."""
+        (self.parent_edges if from_child else self.edges).append((parent, child))
+
+    def link(self, final=True):
+        """
+        Resolve what has been collected; final=False keeps references to ids not seen yet for a later
+        link() (streaming loads), otherwise they are dangling.
+        """
+        self._link_references(final)
+        self._link_hierarchy(final)
+
+    def report(self):
+        if not self.dangling:
+            return
+        print(f"{self.name}: {len(self.dangling)} dangling reference(s)")
+        for description, id in self.dangling:
+            print(f"  {description} → {id}")
+
+    def _lookup(self, id, type_hint):
+        """id → the object it stands for as a `type_hint`, or None."""
+        from ...components import Component
+        from ...core.gameobject import GameObject
+        target = self.index.get(id)
+        if target is None or not isinstance(type_hint, type) or isinstance(target, type_hint):
+            return target
+        if isinstance(target, GameObject) and issubclass(type_hint, Component):
+            return target.get_component(type_hint)
+        if isinstance(target, Component) and issubclass(type_hint, GameObject):
+            return target.gameobject
+        return None
+
+    def _link_references(self, final):
+        waiting = []
+        for obj, name, id, type_hint in self.references:
+            target = self._lookup(id, type_hint)
+            if target is not None:
+                getattr(type(obj), name).set(obj, target)
+            elif id not in self.index and not final:
+                waiting.append((obj, name, id, type_hint))
+            else:
+                self.dangling.append((f"{_describe(obj)}.{name}", id))
+        self.references = waiting
+
+    def _link_hierarchy(self, final):
+        from ...components import Transform
+        children = {}  # parent Transform -> [child Transform]
+        assigned = {}  # child Transform -> parent Transform
+        waiting = [], []
+        for edges, waits in zip((self.edges, self.parent_edges), waiting):
+            for parent, child in edges:
+                parent_transform = self._transform(parent)
+                child_transform = self._transform(child)
+                if parent_transform is None or child_transform is None:
+                    unresolved = parent if parent_transform is None else child
+                    if not final and unresolved not in self.index:
+                        waits.append((parent, child))
+                    else:
+                        owner = parent if isinstance(parent, Transform) else child
+                        self.dangling.append((f"{_describe(owner)} hierarchy", unresolved))
+                    continue
+                current = assigned.get(child_transform, child_transform._parent)
+                # The same link may be saved on both sides (parent's children and child's parent)
+                if current is parent_transform or child_transform is parent_transform:
+                    continue
+                if current is not None:
+                    self.dangling.append((f"{_describe(child_transform)} second parent", _id_of(parent_transform)))
+                    continue
+                assigned[child_transform] = parent_transform
+                children.setdefault(parent_transform, []).append(child_transform)
+        self.edges, self.parent_edges = waiting
+        if not children:
+            return
+
+        for parent, adopted in children.items():
+            parent._adopt(adopted)
+        linked = [child for adopted in children.values() for child in adopted]
+        self._break_cycles(linked)
+        # Objects already in a scene were scheduled without their new ancestors; re-evaluate each
+        # linked subtree once, from its topmost linked Transform
+        linked_set = set(linked)
+        for child in linked:
+            if child._parent not in linked_set and child.gameobject is not None:
+                child.gameobject._hierarchy_active_changed()
+
+    def _break_cycles(self, transforms):
+        """Detach the link closing any parent cycle the saved ids described; O(linked Transforms)."""
+        state = {}  # Transform -> True while on the current walk, False once known to reach a root
+        for transform in transforms:
+            path, node = [], transform
+            while node is not None and node not in state:
+                state[node] = True
+                path.append(node)
+                node = node._parent
+            if node is not None and state[node]:
+                self.dangling.append((f"{_describe(node)} parent cycle", _id_of(node._parent)))
+                node._parent._children.remove(node)
+                node._parent = None
+            for visited in path:
+                state[visited] = False
+
+    def _transform(self, value):
+        from ...components import Transform
+        from ...core.gameobject import GameObject
+        if isinstance(value, Transform):
+            return value
+        target = self.index.get(value)
+        if isinstance(target, GameObject):
+            return target.transform
+        return target if isinstance(target, Transform) else None
+
+
+def _describe(obj):
+    gameobject = getattr(obj, "gameobject", obj)
+    name = getattr(gameobject, "name", None)
+    owner = f"GameObject {name!r}" if name is not None else type(gameobject).__name__
+    return owner if gameobject is obj else f"{owner} {type(obj).__name__}"
+
+
+def _id_of(transform):
+    gameobject = getattr(transform, "gameobject", None)
+    return getattr(gameobject, "uuid", None)
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+
+class SceneCache:
+    """
+    On-disk cache of parsed text scenes, stored as .bscene files.
+    - key → content hash of the source file + component registry version + binary format version,
+      so editing the scene or changing component types simply misses and re-parses
+    - a hit refreshes the entry's mtime; once the cache grows past max_bytes the least
+      recently used entries are deleted
+    Safe to use from the scene loading worker threads.
+    """
+    enabled = True
+    directory = os.path.join(".cache", "scenes")
+    max_bytes = 256 * 1024 * 1024
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def key(cls, path) -> str:
+        from .binary_scene import VERSION
+        from ...components import Component_Registry
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+        return f"{digest.hexdigest()}-{Component_Registry.version()}-v{VERSION}"
+
+    @classmethod
+    def entry(cls, path) -> str:
+        from .binary_scene import BinaryScene
+        return os.path.join(cls.directory, cls.key(path) + BinaryScene.EXTENSION)
+
+    @classmethod
+    def lookup(cls, path):
+        """Path of the cached .bscene for `path`, or None on a miss."""
+        if not cls.enabled:
+            return None
+        entry = cls.entry(path)
+        try:
+            os.utime(entry)
+        except OSError:
+            return None
+        return entry
+
+    @classmethod
+    def store(cls, path, data):
+        """
+        Cache parsed scene data for `path`. Best effort: a scene the binary format can't hold, or
+        any error while writing, is reported and skipped, so caching never fails a load.
+        """
+        if not cls.enabled:
+            return None
+        try:
+            return cls._store(path, data)
+        except Exception as e:
+            print(f"SceneCache: not caching {path}: {type(e).__name__}: {e}")
+            return None
+
+    @classmethod
+    def _store(cls, path, data):
+        from .binary_scene import BinaryScene
+        encoded = BinaryScene.encode(data)
+        entry = cls.entry(path)
+        os.makedirs(cls.directory, exist_ok=True)
+        # Write next to the entry and rename, so a concurrent reader never sees half a file
+        fd, temporary = tempfile.mkstemp(dir=cls.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(temporary, entry)
+        except BaseException:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+        cls.evict()
+        return entry
+
+    @classmethod
+    def evict(cls):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        from .binary_scene import BinaryScene
+        with cls._lock:
+            try:
+                entries = [entry for entry in os.scandir(cls.directory) if entry.name.endswith(BinaryScene.EXTENSION)]
+            except FileNotFoundError:
+                return
+            stats = sorted(((entry.stat(), entry.path) for entry in entries), key=lambda item: item[0].st_mtime)
+            total = sum(stat.st_size for stat, _ in stats)
+            for stat, path in stats:
+                if total <= cls.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= stat.st_size
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            try:
+                entries = list(os.scandir(cls.directory))
+            except FileNotFoundError:
+                return
+            for entry in entries:
+                os.remove(entry.path)
@@ -0,0 +1,119 @@
+import json
+import os
+import threading
+
+
+class SceneJournal:
+    """
+    Append-only change log kept next to a scene file as "<scene path>.journal", one JSON entry per line:
+    - {"op": "put", "id", "data"} → GameObject data with "children" as a list of child ids
+    - {"op": "remove", "id"} → GameObject destroyed
+    - {"op": "scene", "data", "roots"} → scene fields and the root GameObject ids in order
+    Loading replays it over the scene file; a full save (compaction) deletes it.
+    Background saves trim it from their worker thread, so changes to the file go through _lock.
+    """
+    _lock = threading.Lock()
+
+    @staticmethod
+    def path_for(scene_path):
+        return scene_path + ".journal"
+
+    @classmethod
+    def exists(cls, scene_path):
+        return os.path.exists(cls.path_for(scene_path))
+
+    @classmethod
+    def append(cls, scene_path, entries):
+        text = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        with cls._lock, open(cls.path_for(scene_path), "a") as f:
+            f.write(text)
+
+    @classmethod
+    def size(cls, scene_path) -> int:
+        try:
+            return os.path.getsize(cls.path_for(scene_path))
+        except FileNotFoundError:
+            return 0
+
+    @classmethod
+    def entries(cls, scene_path):
+        try:
+            with open(cls.path_for(scene_path), "r") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # torn final write; everything before it is intact
+        return entries
+
+    @classmethod
+    def clear(cls, scene_path):
+        with cls._lock:
+            try:
+                os.remove(cls.path_for(scene_path))
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    def discard(cls, scene_path, size):
+        """
+        Drop the first `size` bytes: the entries a full save taken at that journal size already holds.
+        Entries appended while the save was being written are kept.
+        """
+        path = cls.path_for(scene_path)
+        with cls._lock:
+            try:
+                with open(path, "rb") as f:
+                    rest = f.read()
+            except FileNotFoundError:
+                return
+            # Shorter than at the snapshot → cleared and restarted since, so all of it is newer
+            rest = rest[size:] if len(rest) >= size else rest
+            if not rest:
+                os.remove(path)
+                return
+            with open(path + ".tmp", "wb") as f:
+                f.write(rest)
+            os.replace(path + ".tmp", path)
+
+    @classmethod
+    def apply(cls, data, scene_path):
+        """Scene data from the scene file → the same data with the journal replayed over it."""
+        entries = cls.entries(scene_path)
+        if not entries:
+            return data
+
+        # Flatten to id -> data with child ids; objects saved without an id get a stand-in key
+        nodes = {}
+
+        def flatten(go_data):
+            key = go_data.get("id") or f"#{len(nodes)}"
+            node = dict(go_data)
+            nodes[key] = node
+            node["children"] = [flatten(child) for child in go_data.get("children", [])]
+            return key
+
+        roots = [flatten(go_data) for go_data in data.get("gameobjects", [])]
+        data = {key: value for key, value in data.items() if key != "gameobjects"}
+
+        for entry in entries:
+            op = entry["op"]
+            if op == "put":
+                nodes[entry["id"]] = entry["data"]
+            elif op == "remove":
+                nodes.pop(entry["id"], None)
+            elif op == "scene":
+                data.update(entry["data"])
+                roots = entry["roots"]
+
+        def build(key):
+            node = dict(nodes[key])
+            node["children"] = [build(child) for child in node.get("children", []) if child in nodes]
+            return node
+
+        data["gameobjects"] = [build(key) for key in roots if key in nodes]
+        return data
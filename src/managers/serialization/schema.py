@@ -0,0 +1,126 @@
+from pygame import Vector2
+
+
+class Schema:
+    """
+    Frozen field layout of one Serializable class, compiled when the class is created.
+    Instead of walking field metadata per object, each class gets generated functions:
+    - init(obj, kwargs) → seed every "_<name>" from kwargs or the field default
+    - dump(obj) → dict of the persistent fields
+    - load(cls, data, args, extra) → cls(*args, **decoded data, **extra)
+    Fields declared with transient=True are seeded by init but never dumped or loaded.
+    References to other objects are saved as ids and handed to the Linker on load.
+    """
+    __slots__ = ("cls", "fields", "names", "persistent", "init", "dump", "load")
+
+    # type → (encode, decode) for values that don't map onto plain YAML/JSON data
+    codecs = {
+        Vector2: (lambda v: [v[0], v[1]], Vector2),
+    }
+
+    def __init__(self, cls, fields):
+        self.cls = cls
+        self.fields = tuple(fields)
+        self.names = frozenset(name for name, _ in self.fields)
+        self.persistent = tuple((name, prop) for name, prop in self.fields if not prop.transient)
+        self.init = self._compile_init()
+        self.dump = self._compile_dump()
+        self.load = self._compile_load()
+
+    @classmethod
+    def register_codec(cls, value_type, encode, decode):
+        """Serialize values of `value_type` as encode(value), restore them with decode(data)."""
+        cls.codecs[value_type] = (encode, decode)
+
+    @classmethod
+    def codec(cls, type_hint):
+        if not isinstance(type_hint, type):
+            return None
+        for base in type_hint.__mro__:
+            if base in cls.codecs:
+                return cls.codecs[base]
+        return None
+
+    @staticmethod
+    def _build(name, lines, namespace):
+        exec("\n".join(lines), namespace)
+        return namespace[name]
+
+    def _compile_init(self):
+        namespace = {}
+        given, defaults = [], []
+        for i, (name, prop) in enumerate(self.fields):
+            namespace[f"default_{i}"] = prop.default
+            value = f"default_{i}()" if callable(prop.default) else f"default_{i}"
+            given.append(f"        self._{name} = kwargs[{name!r}] if {name!r} in kwargs else {value}")
+            defaults.append(f"        self._{name} = {value}")
+
+        lines = ["def init(self, kwargs):"]
+        if self.fields:
+            lines += ["    if kwargs:", *given, "    else:", *defaults]
+        else:
+            lines.append("    pass")
+        return self._build("init", lines, namespace)
+
+    def _compile_dump(self):
+        namespace = {"encode_reference": _encode_reference}
+        reads, items = [], []
+        for i, (name, prop) in enumerate(self.persistent):
+            read = f"self._{name}" if prop.direct else f"self.{name}"
+            codec = self.codec(prop.type_hint)
+            if codec is not None:
+                namespace[f"encode_{i}"] = codec[0]
+                reads.append(f"    value_{i} = {read}")
+                items.append(f"        {name!r}: None if value_{i} is None else encode_{i}(value_{i}),")
+            elif prop.holds_references:
+                items.append(f"        {name!r}: encode_reference({read}),")
+            else:
+                items.append(f"        {name!r}: {read},")
+        lines = ["def dump(self):", *reads, "    return {", *items, "    }"]
+        return self._build("dump", lines, namespace)
+
+    def _compile_load(self):
+        from .serializable import Serializable
+        from .linker import Linker
+        namespace = {"Linker": Linker}
+        lines = ["def load(cls, data, args=(), extra=None):", "    kwargs = {}"]
+        linked = False
+        for i, (name, prop) in enumerate(self.persistent):
+            type_hint = prop.type_hint
+            codec = self.codec(type_hint)
+            lines += [f"    if {name!r} in data:", f"        value = data[{name!r}]"]
+            if codec is not None:
+                namespace[f"decode_{i}"] = codec[1]
+                lines.append(f"        kwargs[{name!r}] = decode_{i}(value) if value is not None else None")
+            elif isinstance(type_hint, type) and issubclass(type_hint, Serializable):
+                # An id → resolved by the Linker once every object of the load exists
+                linked = True
+                namespace[f"nested_{i}"] = type_hint
+                lines += [
+                    "        if type(value) is str:",
+                    f"            references.append(({name!r}, value, nested_{i}))",
+                    "        else:",
+                    f"            kwargs[{name!r}] = nested_{i}.from_dict(value) if type(value) is dict else value",
+                ]
+            else:
+                lines.append(f"        kwargs[{name!r}] = value")
+        lines += ["    if extra:", "        kwargs.update(extra)"]
+        if linked:
+            lines.insert(2, "    references = []")
+            lines += ["    obj = cls(*args, **kwargs)", "    if references:", "        Linker.defer(obj, references)",
+                      "    return obj"]
+        else:
+            lines.append("    return cls(*args, **kwargs)")
+        return self._build("load", lines, namespace)
+
+
+def _encode_reference(value):
+    """GameObject → its UUID, Component → its GameObject's UUID (the field's type_hint picks the component back out)."""
+    from .serializable import Serializable
+    from ...components import Component
+    from ...core.gameobject import GameObject
+    if isinstance(value, GameObject):
+        return value.uuid
+    if isinstance(value, Component):
+        return value.gameobject.uuid if value.gameobject is not None else None
+    return value.to_dict() if isinstance(value, Serializable) else value
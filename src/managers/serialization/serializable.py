@@ -1,74 +1,71 @@
 from typing import Any, Type
 from src.core.util import Observable
-from .util import SerializableProperty, SerializeField
+from .util import SerializableProperty, SerializeField, change_tick
+from .schema import Schema
 
-class Serializable(Observable):
+class SerializableMeta(type):
+    """
+    `class Layer(Serializable, slots=True)` stores the class's own fields in __slots__.
+    - instances get no __dict__ unless a base already has one (or "__dict__" is listed)
+    """
+    def __new__(mcls, name, bases, namespace, slots=False, **kwargs):
+        if slots and "__slots__" not in namespace:
+            namespace["__slots__"] = tuple(
+                "_" + key for key, value in namespace.items() if isinstance(value, SerializableProperty)
+            )
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
 
-    _serializable_fields = []
+
+class Serializable(Observable, metaclass=SerializableMeta):
+    __slots__ = ("_change_tick",)
+
+    _serializable_fields = ()
+    _change_log = None  # the ChangeLog of the archetype column a component sits in (see SceneIndex)
 
     def __init__(self, **kwargs):
         super().__init__()
-        # Initialize all serializable fields
-        for name, prop in getattr(type(self), "_serializable_fields", []):
-            prop : SerializableProperty
-            attr_name = "_" + name
-            if name in kwargs:
-                setattr(self, attr_name, kwargs[name] if prop.type_hint is not dict else kwargs[name])
-            else:
-                default_val = prop.default() if callable(prop.default) else prop.default
-                if not hasattr(self, attr_name):
-                    setattr(self, attr_name, default_val)
+        self._change_tick = change_tick()
+        self._schema.init(self, kwargs)
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        fields = []
+        fields = {}
+        # Base classes first; a redefined field keeps its place but takes the new property
+        for base in reversed(cls.__mro__):
+            for name, attr in base.__dict__.items():
+                if isinstance(attr, SerializableProperty) and attr.serialize_field:
+                    fields[name] = attr
 
-        for base in cls.__mro__:
-            if hasattr(base, "_serializable_fields"):
-                fields.extend(base._serializable_fields)
+        cls._serializable_fields = tuple(fields.items())
+        cls._schema = Schema(cls, cls._serializable_fields)
 
-        for name, attr in cls.__dict__.items():
-            if isinstance(attr, SerializableProperty) and getattr(attr, "serialize_field", False):
-                if (name, attr) not in fields:
-                    fields.append((name, attr))
+    def __getattr__(self, name):
+        # Field getters read "_<name>" directly; seed it here if __init__ never ran for it
+        prop = getattr(type(self), name, None)
+        if not isinstance(prop, SerializableProperty):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        attr_name = "_" + name
+        try:
+            object.__getattribute__(self, attr_name)
+        except AttributeError:
+            setattr(self, attr_name, prop.default() if callable(prop.default) else prop.default)
+            return prop.__get__(self, type(self))
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
-        cls._serializable_fields = fields
+    def changed_since(self, tick) -> bool:
+        """Whether a field was set (or the object created) after `tick`, a change_tick() value."""
+        return self._change_tick > tick
 
     def to_dict(self) -> dict:
-        data = {}
-        for name, prop in getattr(type(self), "_serializable_fields", []):
-            if getattr(prop, "hide", False):
-                continue
-
-            value = getattr(self, name)
-
-            if isinstance(value, Serializable):
-                data[name] = value.to_dict()
-            else:
-                data[name] = value
-        return data
+        return self._schema.dump(self)
 
     @classmethod
     def from_dict(cls: Type['Serializable'], data: dict, **kwargs) -> 'Serializable':
-        init_kwargs = {}
-        for name, prop in getattr(cls, "_serializable_fields", []):
-            
-            if name in data:
-                value = data[name]
-                type_hint = getattr(prop, "type_hint", None)
-
-                if isinstance(type_hint, type) and issubclass(type_hint, Serializable) and isinstance(value, dict):
-                    value = type_hint.from_dict(value)
-            else:
-                value = getattr(prop, "default", None)
-                if callable(value):
-                    value = value()
-
-            init_kwargs[name] = value
-
-        init_kwargs.update(kwargs)
-        return cls(**init_kwargs)
+        return cls._schema.load(cls, data, (), kwargs)
 
     @property
     def serializable_fields(self):
         return self._serializable_fields
+
+
+Serializable._schema = Schema(Serializable, ())
@@ -1,19 +1,26 @@
+import gzip
 import json
+import os
+import pickle
+import tempfile
 import yaml
 from ...components import Component_Registry
+from .scene_cache import SceneCache
+from .scene_journal import SceneJournal
 
 class Serializer:
+    # gzip level for ".gz" scene files; low levels already shrink YAML/JSON several times over
+    compress_level = 3
+
     @classmethod
     def serialize_scene(cls, scene):
-        return {
-            "sceneName": scene.name,
-            "gameObjects": [cls._serialize_gameobject(go) for go in scene.root_gameobjects]
-        }
+        return scene.to_dict()
 
     @classmethod
     def deserialize_scene(cls, data, engine):
         from ..scenes.scene import Scene
         scene = Scene.from_dict(**data)
+        scene.engine = engine
         return scene
 
     @classmethod
@@ -62,24 +69,267 @@ class Serializer:
 
         return Component_Registry.registry[type_name]["deserialize"](data, gameobject)
 
+    @classmethod
+    def format(cls, path) -> str:
+        """Scene file format by extension: "json", "bscene" or "yaml"; a trailing ".gz" means gzip compressed."""
+        if path.endswith(".gz"):
+            path = path[:-3]
+        if path.endswith(".json"):
+            return "json"
+        if path.endswith(".bscene"):
+            return "bscene"
+        return "yaml"
+
+    @classmethod
+    def _open(cls, path, mode="r"):
+        return gzip.open(path, mode + "t") if path.endswith(".gz") else open(path, mode)
+
+    @classmethod
+    def save_scene(cls, scene, path):
+        """Full save, format picked by extension (.json / .bscene / YAML otherwise)."""
+        if cls.format(path) == "json":
+            cls.save_to_json(scene, path)
+        elif cls.format(path) == "bscene":
+            cls.save_to_binary(scene, path)
+        else:
+            cls.save_to_yaml(scene, path)
+
+    @classmethod
+    def snapshot_scene(cls, scene) -> tuple:
+        """
+        Frozen copy of scene.to_dict() for a save on another thread: the scene fields and each
+        root GameObject subtree pickled separately, so later edits can't leak into the save and
+        the worker unpickles in pieces instead of holding the GIL for the whole scene.
+        Runs on the calling thread: to_dict + pickle is the part of an async save that still
+        blocks it (see benchmarks/background_save.py).
+        """
+        from .util import gc_paused
+        with gc_paused():
+            data = cls.serialize_scene(scene)
+            gameobjects = data.pop("gameobjects", [])
+            return (pickle.dumps(data, pickle.HIGHEST_PROTOCOL),
+                    [pickle.dumps(go_data, pickle.HIGHEST_PROTOCOL) for go_data in gameobjects])
+
+    @classmethod
+    def write_snapshot(cls, snapshot, path, journal_size=0):
+        """
+        snapshot_scene() → encoded, compressed and atomically written to `path`; runs on a worker thread.
+        journal_size → the journal's size when the snapshot was taken; those entries are dropped after the write.
+        """
+        scene, gameobjects = snapshot
+        data = pickle.loads(scene)
+        data["gameobjects"] = [pickle.loads(go_data) for go_data in gameobjects]
+        cls.write_scene_data(data, path)
+        SceneJournal.discard(path, journal_size)
+        return path
+
+    @classmethod
+    def encode_scene_data(cls, data, path) -> bytes:
+        """Plain scene data → the bytes of a scene file at `path` (format and compression by extension)."""
+        from .binary_scene import BinaryScene
+        fmt = cls.format(path)
+        if fmt == "bscene":
+            if path.endswith(".gz"):
+                raise ValueError(f"{path}: binary scenes are memory-mapped and can't be compressed")
+            return BinaryScene.encode(data)
+        if fmt == "json":
+            encoded = json.dumps(data, indent=2).encode("utf-8")
+        else:
+            # One dump per root subtree, concatenated under "gameobjects:"; a single dump of the whole
+            # scene is one long C call that would hold the GIL (and so stall the main thread) throughout
+            dumper = getattr(yaml, "CDumper", yaml.Dumper)
+            fields = {key: value for key, value in data.items() if key != "gameobjects"}
+            gameobjects = data.get("gameobjects", [])
+            parts = [yaml.dump(fields, Dumper=dumper)] if fields else []
+            parts.append("gameobjects:\n" if gameobjects else "gameobjects: []\n")
+            parts += [yaml.dump([go_data], Dumper=dumper) for go_data in gameobjects]
+            encoded = "".join(parts).encode("utf-8")
+        if path.endswith(".gz"):
+            encoded = gzip.compress(encoded, cls.compress_level)
+        return encoded
+
+    @classmethod
+    def write_scene_data(cls, data, path):
+        """
+        Encode plain scene data and replace `path` atomically: the file is written next to it and
+        renamed over it, so a crash or a failed encode leaves the previous save intact.
+        Touches no engine objects, so it may run on any thread.
+        """
+        encoded = cls.encode_scene_data(data, path)
+        directory = os.path.dirname(path) or "."
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                fd = None  # closed with f from here on
+                f.write(encoded)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            if fd is not None:
+                os.close(fd)
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass  # don't hide the original error
+            raise
+
     @classmethod
     def save_to_yaml(cls, scene, path):
-        with open(path, 'w') as f:
-            yaml.dump(cls.serialize_scene(scene), f)
+        cls.write_scene_data(cls.serialize_scene(scene), path)
+        SceneJournal.clear(path)
 
     @classmethod
     def load_from_yaml(cls, path, engine):
-        with open(path, 'r') as f:
+        if SceneJournal.exists(path):
+            return cls.deserialize_scene(cls.read_scene_data(path), engine)
+        if (scene := cls._load_cached(path, engine)) is not None:
+            return scene
+        with cls._open(path) as f:
             data = yaml.safe_load(f)
+        SceneCache.store(path, data)
         return cls.deserialize_scene(data, engine)
 
     @classmethod
     def save_to_json(cls, scene, path):
-        with open(path, 'w') as f:
-            json.dump(cls.serialize_scene(scene), f, indent=2)
+        cls.write_scene_data(cls.serialize_scene(scene), path)
+        SceneJournal.clear(path)
 
     @classmethod
     def load_from_json(cls, path, engine):
-        with open(path, 'r') as f:
+        if SceneJournal.exists(path):
+            return cls.deserialize_scene(cls.read_scene_data(path), engine)
+        if (scene := cls._load_cached(path, engine)) is not None:
+            return scene
+        with cls._open(path) as f:
             data = json.load(f)
+        SceneCache.store(path, data)
         return cls.deserialize_scene(data, engine)
+
+    @classmethod
+    def _load_cached(cls, path, engine):
+        if (cached := SceneCache.lookup(path)) is None:
+            return None
+        try:
+            return cls.load_from_binary(cached, engine)
+        except FileNotFoundError:
+            return None  # evicted since the lookup
+
+    @classmethod
+    def save_to_binary(cls, scene, path):
+        cls.write_scene_data(cls.serialize_scene(scene), path)
+        SceneJournal.clear(path)
+
+    @classmethod
+    def load_from_binary(cls, path, engine):
+        from .binary_scene import BinaryScene
+        if SceneJournal.exists(path):
+            return cls.deserialize_scene(cls.read_scene_data(path), engine)
+        # GameObjects are decoded from the mapped file one root subtree at a time while the scene builds
+        with BinaryScene.open(path) as reader:
+            return cls.deserialize_scene({**reader.scene, "gameobjects": reader.gameobjects()}, engine)
+
+    @classmethod
+    def read_scene_data(cls, path) -> dict:
+        """Parse a scene file (and its journal) into plain Scene.to_dict() data; touches no engine objects, so it may run on any thread."""
+        return SceneJournal.apply(cls._read_scene_file(path), path)
+
+    @classmethod
+    def _read_scene_file(cls, path) -> dict:
+        from .binary_scene import BinaryScene
+        if path.endswith(".bscene"):
+            return BinaryScene.load(path)
+        if (cached := SceneCache.lookup(path)) is not None:
+            try:
+                return BinaryScene.load(cached)
+            except FileNotFoundError:
+                pass
+        with cls._open(path) as f:
+            if cls.format(path) == "json":
+                data = json.load(f)
+            else:
+                data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        SceneCache.store(path, data)
+        return data
+
+    @classmethod
+    def iter_scene_data(cls, data):
+        """stream_scene()-style records over already parsed scene data."""
+        gameobjects = data.get("gameobjects", [])
+        yield "scene", {key: value for key, value in data.items() if key != "gameobjects"}, 0.0
+        for i, go_data in enumerate(gameobjects):
+            yield "gameobject", go_data, (i + 1) / len(gameobjects)
+
+    @classmethod
+    def stream_scene(cls, path):
+        """
+        Parse a scene file one record at a time, yielding (kind, data, progress):
+        - ("scene", {field: value}, progress) for scene-level fields
+        - ("gameobject", root GameObject data with nested children, progress)
+        progress is the fraction of the file consumed so far (0..1).
+        Text scenes already in the SceneCache stream from their cached .bscene.
+        """
+        if SceneJournal.exists(path):
+            return cls.iter_scene_data(cls.read_scene_data(path))
+        if path.endswith(".bscene"):
+            return cls._stream_binary(path)
+        if (cached := SceneCache.lookup(path)) is not None:
+            return cls._stream_binary(cached)
+        if cls.format(path) == "json":
+            return cls._stream_json(path)
+        return cls._stream_yaml(path)
+
+    @classmethod
+    def _stream_yaml(cls, path):
+        size = max(os.path.getsize(path), 1)
+        with cls._open(path) as f:
+            loader = yaml.SafeLoader(f)
+            try:
+                def construct():
+                    data = loader.construct_object(loader.compose_node(None, None), deep=True)
+                    # Forget constructed nodes so memory stays flat over the document
+                    loader.constructed_objects = {}
+                    loader.recursive_objects = {}
+                    return data
+
+                def progress():
+                    if path.endswith(".gz"):
+                        # characters don't map onto compressed bytes; use the compressed read offset
+                        return min(f.buffer.fileobj.tell() / size, 1.0)
+                    return min(loader.index / size, 1.0)
+
+                loader.get_event()  # StreamStart
+                if loader.check_event(yaml.StreamEndEvent):
+                    return
+                loader.get_event()  # DocumentStart
+                if not loader.check_event(yaml.MappingStartEvent):
+                    raise ValueError(f"{path}: a scene document must be a mapping")
+                loader.get_event()
+                while not loader.check_event(yaml.MappingEndEvent):
+                    key = construct()
+                    if key == "gameobjects" and loader.check_event(yaml.SequenceStartEvent):
+                        loader.get_event()
+                        while not loader.check_event(yaml.SequenceEndEvent):
+                            data = construct()
+                            yield "gameobject", data, progress()
+                        loader.get_event()
+                    else:
+                        yield "scene", {key: construct()}, progress()
+            finally:
+                loader.dispose()
+
+    @classmethod
+    def _stream_json(cls, path):
+        # json has no incremental parser; parse up front, instantiate incrementally
+        with cls._open(path) as f:
+            data = json.load(f)
+        yield from cls.iter_scene_data(data)
+
+    @classmethod
+    def _stream_binary(cls, path):
+        from .binary_scene import BinaryScene
+        with BinaryScene.open(path) as reader:
+            yield "scene", dict(reader.scene), 0.0
+            total = max(reader.object_count, 1)
+            for go_data in reader.gameobjects():
+                yield "gameobject", go_data, reader.position / total
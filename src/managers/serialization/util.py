@@ -1,13 +1,20 @@
+import gc
+import itertools
 import weakref
+from contextlib import contextmanager
+from operator import attrgetter
 
 class SerializableProperty(property):
-    def __init__(self, fget=None, fset=None, fdel=None, doc=None,type_hint= None, default= None, hidden= False, editor_hint = None):
+    def __init__(self, fget=None, fset=None, fdel=None, doc=None,type_hint= None, default= None, hidden= False, editor_hint = None, holds_references = True, direct = False, transient = False):
         super().__init__(fget, fset, fdel, doc)
         self.serialize_field = True
         self.type_hint = type_hint
         self.editor_hint = editor_hint
         self.default = default
         self.hidden = hidden
+        self.holds_references = holds_references
+        self.direct = direct  # value lives as-is in "_<name>", so schemas may read it without the property
+        self.transient = transient
 
     def get(self, component):
         val = self.__get__(component)
@@ -21,26 +28,98 @@ class SerializableProperty(property):
         super().__set__(component, value)
 
 
-        
-def SerializeField(default=None, type_hint=None, hidden=False, getter=None, setter=None, editor_hint=None):
-    
-    def decorator(func):
-        attr_name = "_" + func.__name__
+# Global change counter: every SerializeField set stamps the object with the next value
+_ticks = itertools.count(1)
+
+
+def change_tick() -> int:
+    """
+    A fresh tick; objects stamped after this call compare greater.
+        since, last = last, change_tick()
+        ... obj.changed_since(since)
+    """
+    return next(_ticks)
+
+
+def stamp(obj):
+    """Mark `obj` changed now: a fresh "_change_tick", also logged if its archetype keeps a ChangeLog for it."""
+    obj._change_tick = tick = next(_ticks)
+    if (log := obj._change_log) is not None:
+        log.add(tick, obj)
 
-        def _getter(self):
-            if not hasattr(self, attr_name):
-                val = default() if callable(default) else default
-                setattr(self, attr_name, val)
 
-            value = getattr(self, attr_name)
-            return value() if isinstance(value, weakref.ref) else value
+@contextmanager
+def gc_paused():
+    """
+    Hold off the cyclic garbage collector while building or walking many objects at once.
+    Every allocation burst otherwise triggers collections that rescan everything loaded so far.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def holds_references(type_hint) -> bool:
+    """
+    Whether a field of this type can end up holding a weakref to another Serializable.
+    - None / "ForwardRef" / Serializable subclass / object → yes
+    - int, str, Vector2, list, ... → no, reads skip the weakref unwrap
+    """
+    from .serializable import Serializable
+    if not isinstance(type_hint, type):
+        return True
+    return type_hint is object or issubclass(type_hint, Serializable)
+
+
+def SerializeField(default=None, type_hint=None, hidden=False, getter=None, setter=None, editor_hint=None, notify=True, transient=False):
+    """
+    Generated accessors assume Serializable.__init__ already seeded "_<name>".
+    - plain types → C-level attrgetter, no python frame per read
+    - reference types → unwrap weakrefs stored by SerializableProperty.set
+    - notify=False → setter skips change notifications entirely
+    - transient=True → runtime-only, left out of to_dict / from_dict
+    - every set, custom setters included, stamps "_change_tick" (see change_tick() / stamp())
+    """
+    def decorator(func):
+        field_name = func.__name__
+        attr_name = "_" + field_name
+        references = holds_references(type_hint)
+
+        if references:
+            def _getter(self):
+                value = getattr(self, attr_name)
+                return value() if type(value) is weakref.ref else value
+        else:
+            _getter = attrgetter(attr_name)
 
-        def _setter(self, value):
-            self.notify()
-            setattr(self, attr_name, value)
+        # stamp() inlined: setters are hot
+        if setter is not None:
+            def _setter(self, value):
+                setter(self, value)
+                self._change_tick = tick = next(_ticks)
+                if (log := self._change_log) is not None:
+                    log.add(tick, self)
+        elif notify:
+            def _setter(self, value):
+                setattr(self, attr_name, value)
+                self._change_tick = tick = next(_ticks)
+                if (log := self._change_log) is not None:
+                    log.add(tick, self)
+                if self._subscribers:
+                    self.notify(field_name)
+        else:
+            def _setter(self, value):
+                setattr(self, attr_name, value)
+                self._change_tick = tick = next(_ticks)
+                if (log := self._change_log) is not None:
+                    log.add(tick, self)
 
         final_getter = getter or _getter
-        final_setter = setter or _setter
+        final_setter = _setter
 
         hint = editor_hint if editor_hint is not None else type_hint
 
@@ -50,7 +129,10 @@ def SerializeField(default=None, type_hint=None, hidden=False, getter=None, sett
             type_hint=type_hint,
             editor_hint=hint,
             default=default,
-            hidden=hidden
+            hidden=hidden,
+            holds_references=references,
+            direct=getter is None and not references,
+            transient=transient
         )
 
     return decorator
@@ -1,5 +1,6 @@
 from .state import EngineState
 from ..time.time_manager import Time
+from ..profiler import Profiler, Tracer
 
 class PlayState(EngineState):
 
@@ -17,10 +18,26 @@ class PlayState(EngineState):
         self.accumulator += Time.deltaTime
 
         while self.accumulator >= Time.fixedDeltaTime:
-            self.update_physics(Time.fixedDeltaTime)
+            with Tracer.span("PlayState.fixed_step"):
+                self.run_components("fixed_update")
+                self.update_physics(Time.fixedDeltaTime)
             self.accumulator -= Time.fixedDeltaTime
 
+        self.run_components("update")
+        self.run_components("late_update")
         self.render()
+
+    def run_components(self, hook):
+        from ..scenes import SceneManager
+        with Profiler.sample("Components." + hook):
+            for scene in SceneManager._instance.loaded_scenes:
+                scene.scheduler.run(hook)
+
+    def update_physics(self, dt):
+        from ..scenes import SceneManager
+        for scene in SceneManager._instance.loaded_scenes:
+            scene.physics.step(dt)
+
     def render(self):
         # Game rendering
         pass
@@ -1,4 +1,5 @@
 from . import EngineState
+from ..profiler import Profiler
 
 class StateManager:    
     def __init__(self):
@@ -12,9 +13,11 @@ class StateManager:
 
     def update(self):
         if self.current_state:
-            self.current_state.update()
+            with Profiler.sample(type(self.current_state).__name__ + ".update"):
+                self.current_state.update()
 
-        self.cleanup()
+        with Profiler.sample("StateManager.cleanup"):
+            self.cleanup()
 
     def cleanup(self):
         from ...managers.scenes import SceneManager
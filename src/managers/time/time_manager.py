@@ -11,6 +11,7 @@ class Time:
     unscaledTime = 0.0
     frameCount = 0
     timeScale = 1.0
+    captureDeltaTime = 0.0
 
     _last_frame_time = None
 
@@ -33,6 +34,9 @@ class Time:
 
         raw_dt = now - cls._last_frame_time
         cls._last_frame_time = now
+        if cls.captureDeltaTime > 0:
+            # Fixed-step mode: advance by a constant amount regardless of wall clock
+            raw_dt = cls.captureDeltaTime
 
         cls.unscaledDeltaTime = raw_dt
         cls.deltaTime = raw_dt * cls.timeScale
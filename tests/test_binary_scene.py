@@ -0,0 +1,37 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+import yaml
+from src.managers.serialization.binary_scene import BinaryScene
+from src.managers.serialization.scene_cache import SceneCache
+from src.managers.serialization.serializer_manager import Serializer
+
+
+def scene(lookup):
+    return {"name": "S", "gameobjects": [
+        {"name": "a", "components": [{"type": "Custom", "lookup": lookup}], "children": []},
+    ]}
+
+
+def test_str_keyed_dict_round_trips(tmp_path):
+    data = scene({"1": "one", "two": [2, 2.5, None, True]})
+    path = str(tmp_path / "scene.bscene")
+    BinaryScene.save(data, path)
+    assert BinaryScene.load(path) == data
+
+
+def test_int_keyed_dict_is_rejected():
+    with pytest.raises(TypeError):
+        BinaryScene.encode(scene({1: "one"}))
+
+
+def test_int_keyed_dict_survives_a_warm_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(SceneCache, "directory", str(tmp_path / "cache"))
+    path = tmp_path / "scene.yaml"
+    path.write_text(yaml.safe_dump(scene({1: "one", "2": "two"})))
+
+    cold = Serializer.read_scene_data(str(path))
+    warm = Serializer.read_scene_data(str(path))
+    assert cold == warm
+    assert warm["gameobjects"][0]["components"][0]["lookup"] == {1: "one", "2": "two"}
@@ -0,0 +1,54 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pymunk
+import pytest
+from src.core.gameobject import GameObject
+from src.managers import Scene
+from src.components import RigidBody
+
+
+@pytest.fixture(params=[False, True], ids=["fields", "store"])
+def scene(request):
+    scene = Scene(name="s", array_transforms=request.param)
+    for i in range(20):
+        gameobject = GameObject(name=f"k{i}")
+        gameobject.transform.position = (i, 0)
+        gameobject.add_component(RigidBody(gameobject))
+        scene.add_gameobject(gameobject)
+    for rigidbody in scene.physics.rigidbodies:
+        rigidbody.body.body_type = pymunk.Body.KINEMATIC
+    scene.physics.sync.mark_dirty()
+    return scene
+
+
+def poses(scene):
+    return [(tuple(rigidbody.body.position), rigidbody.body.angle) for rigidbody in scene.physics.rigidbodies]
+
+
+def targets(scene):
+    return [(tuple(rigidbody.gameobject.transform.position), rigidbody.gameobject.transform.angle)
+            for rigidbody in scene.physics.rigidbodies]
+
+
+def test_push_moves_bodies_to_their_transforms(scene):
+    sync = scene.physics.sync
+    sync.push_kinematic()
+    assert poses(scene) == targets(scene)
+
+    gameobjects = [rigidbody.gameobject for rigidbody in scene.physics.rigidbodies]
+    gameobjects[3].transform.position = (30, 3)
+    gameobjects[7].transform.angle = 1.5
+    sync.push_kinematic()
+    assert poses(scene) == targets(scene)
+
+
+def test_push_resets_bodies_that_drifted(scene):
+    sync = scene.physics.sync
+    sync.push_kinematic()
+    body = next(iter(scene.physics.rigidbodies)).body
+    body.velocity = (10, 0)
+    scene.physics.space.step(0.1)
+    assert poses(scene) != targets(scene)
+    sync.push_kinematic()
+    assert poses(scene) == targets(scene)
@@ -0,0 +1,43 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import threading
+from src.core.entities import Entities
+from src.managers import Scene
+
+
+def test_no_live_handle_is_zero():
+    handles = [Entities.allocate() for _ in range(3)]
+    assert all(handles)
+    for handle in handles:
+        Entities.release(handle)
+
+
+def test_uuid_lookup_per_scene_with_duplicate_uuids():
+    data = {"name": "S", "gameobjects": [{"name": "a", "id": "dup-uuid", "components": []}]}
+    first, second = Scene.from_dict(**data), Scene.from_dict(**data)
+    (a,), (b,) = first.id_mappings.values(), second.id_mappings.values()
+    assert first.find_gameobject_by_uuid("dup-uuid") is a
+    assert second.find_gameobject_by_uuid("dup-uuid") is b
+
+    second.remove_gameobject(b)
+    second.destroy_gameobjects()
+    assert first.find_gameobject_by_uuid("dup-uuid") is a
+    assert Entities.handles("dup-uuid") == [a.id]
+
+
+def test_concurrent_allocate_release_never_reuses_a_live_slot():
+    def churn():
+        for _ in range(5000):
+            Entities.release(Entities.allocate())
+
+    threads = [threading.Thread(target=churn) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(Entities._free) == len(set(Entities._free))
+    handles = [Entities.allocate() for _ in range(1000)]
+    assert len({Entities.index(handle) for handle in handles}) == len(handles)
+    for handle in handles:
+        Entities.release(handle)
@@ -0,0 +1,58 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import random
+import numpy as np
+from src.core.gameobject import GameObject
+from src.managers import Scene, change_tick
+from src.components import BoxCollider, RigidBody, Transform
+
+
+def brute_force(scene, since):
+    return {go for go in scene.id_mappings.values()
+            if go.get_component(RigidBody) is not None and go.transform.changed_since(since)}
+
+
+def changed(scene, since):
+    rows = scene.query(Transform, RigidBody, changed=Transform, since=since)
+    assert len(rows) == len({row[0] for row in rows})
+    return {row[0] for row in rows}
+
+
+def test_changed_query_matches_a_scan():
+    rng = random.Random(0)
+    scene = Scene(name="s", array_transforms=True)
+    gameobjects = []
+    for i in range(200):
+        gameobject = GameObject(name=f"g{i}")
+        scene.add_gameobject(gameobject)
+        gameobject.add_component(RigidBody(gameobject))
+        gameobjects.append(gameobject)
+
+    since = change_tick()
+    assert changed(scene, since) == set()
+    for frame in range(50):
+        for _ in range(20):
+            gameobject = rng.choice(gameobjects)
+            if gameobject._destroyed:
+                continue
+            action = rng.random()
+            if action < 0.6:
+                gameobject.transform.position = (frame, rng.random())
+            elif action < 0.7:
+                gameobject.transform.set_pose(1, 2, 0.5)
+            elif action < 0.8:
+                gameobject.add_component(BoxCollider(gameobject))  # moves archetype
+            elif action < 0.9:
+                gameobject.remove_component(BoxCollider)
+            elif action < 0.95:
+                scene.transforms.positions[gameobject.transform._index] = (7, 7)
+                scene.transforms.notify(np.array([gameobject.transform._index]))
+            else:
+                scene.remove_gameobject(gameobject)
+                scene.destroy_gameobjects()
+        assert changed(scene, since) == brute_force(scene, since)
+        since = change_tick()
+
+    logs = [log for archetype in scene.index.archetypes.values() for log in archetype.changes.values()]
+    assert all(len(log) <= log.limit for log in logs)
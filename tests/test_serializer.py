@@ -0,0 +1,36 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from src.managers.serialization.serializer_manager import Serializer
+
+DATA = {"name": "S", "gameobjects": [{"name": "a", "components": [], "children": []}]}
+
+
+def open_fds():
+    return set(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else set()
+
+
+@pytest.mark.parametrize("name", ["scene.yaml", "scene.json.gz", "scene.bscene"])
+def test_failed_write_keeps_the_previous_file_and_leaves_no_temp(tmp_path, monkeypatch, name):
+    path = str(tmp_path / name)
+    Serializer.write_scene_data(DATA, path)
+    previous = open(path, "rb").read()
+
+    def fail(fd):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "fsync", fail)
+    fds = open_fds()
+    with pytest.raises(OSError, match="disk full"):
+        Serializer.write_scene_data({**DATA, "name": "T"}, path)
+
+    assert os.listdir(tmp_path) == [name]
+    assert open(path, "rb").read() == previous
+    assert open_fds() <= fds
+
+
+def test_failed_encode_writes_nothing(tmp_path):
+    path = str(tmp_path / "scene.bscene.gz")
+    with pytest.raises(ValueError):
+        Serializer.write_scene_data(DATA, path)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,56 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from src.core.gameobject import GameObject
+from src.managers import Scene
+
+
+@pytest.fixture(params=[False, True], ids=["unbound", "store"])
+def transform(request):
+    gameobject = GameObject(name="t")
+    if request.param:
+        Scene(name="s", array_transforms=True).add_gameobject(gameobject)
+    return gameobject.transform
+
+
+def test_in_place_position_edit_updates_world(transform):
+    assert transform.world_position == (0, 0)
+    changes = []
+    transform.subscribe(changes.append, immediate=True, pass_changes=True)
+    tick = transform._change_tick
+
+    transform.position.x = 50
+    assert transform.position == (50, 0)
+    assert transform.world_position == (50, 0)
+    assert transform.transform_point((1, 0)) == (51, 0)
+    assert transform._change_tick > tick
+    assert changes == [frozenset({"position"})]
+
+    transform.position += (0, 5)
+    transform.position[0] = 2
+    assert transform.world_position == (2, 5)
+
+
+def test_in_place_scale_edit_updates_world(transform):
+    transform.transform_point((1, 1))
+    transform.scale.x = 3
+    assert transform.scale == (3, 1)
+    assert transform.transform_point((1, 1)) == (3, 1)
+
+
+def test_derived_vectors_are_detached(transform):
+    moved = transform.position + (1, 1)
+    moved.x = 10
+    copied = transform.position.copy()
+    copied.y = 10
+    assert transform.position == (0, 0)
+    assert transform.world_position == (0, 0)
+
+
+def test_assigned_vector_is_not_aliased(transform):
+    from pygame import Vector2
+    target = Vector2(4, 4)
+    transform.position = target
+    target.x = 9
+    assert transform.position == (4, 4)